@@ -349,9 +349,7 @@ export class EnvironmentSensor implements Sensor, Disposable {
 
     private async addAtomsToOpenCog(atoms: Atom[]): Promise<void> {
         try {
-            for (const atom of atoms) {
-                await this.opencog.addAtom(atom);
-            }
+            await this.opencog.addAtoms(atoms);
         } catch (error) {
             console.error('Error adding environment atoms to OpenCog:', error);
         }
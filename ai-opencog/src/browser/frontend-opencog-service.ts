@@ -16,15 +16,24 @@
 
 import { injectable, inject } from '@theia/core/shared/inversify';
 import { WebSocketConnectionProvider } from '@theia/core/lib/browser/messaging';
+import { Event, Emitter } from '@theia/core/lib/common/event';
 import {
     Atom,
     AtomPattern,
+    AtomUpdate,
+    AtomSpaceChangeBatch,
+    PatternMatch,
+    QueryPlanStats,
+    AtomSpaceExportChunk,
+    AtomSpaceTransferProgress,
+    MemoryBreakdown,
     ReasoningQuery,
     ReasoningResult,
     LearningData,
     PatternInput,
     PatternResult,
     OpenCogService,
+    OpenCogClient,
     OPENCOG_SERVICE_PATH,
     LearningModel,
     AdaptationStrategy,
@@ -48,10 +57,16 @@ export class FrontendOpenCogService implements OpenCogService {
 
     private readonly openCogService: OpenCogService;
 
+    private readonly onAtomSpaceChangesEmitter = new Emitter<AtomSpaceChangeBatch>();
+    readonly onAtomSpaceChanges: Event<AtomSpaceChangeBatch> = this.onAtomSpaceChangesEmitter.event;
+
     constructor(
         @inject(WebSocketConnectionProvider) protected readonly connectionProvider: WebSocketConnectionProvider
     ) {
-        this.openCogService = this.connectionProvider.createProxy<OpenCogService>(OPENCOG_SERVICE_PATH);
+        const client: OpenCogClient = {
+            onAtomSpaceChanges: batch => this.onAtomSpaceChangesEmitter.fire(batch)
+        };
+        this.openCogService = this.connectionProvider.createProxy<OpenCogService>(OPENCOG_SERVICE_PATH, client);
     }
 
     async addAtom(atom: Atom): Promise<string> {
@@ -70,6 +85,54 @@ export class FrontendOpenCogService implements OpenCogService {
         return this.openCogService.updateAtom(atomId, updates);
     }
 
+    async addAtoms(atoms: Atom[]): Promise<string[]> {
+        return this.openCogService.addAtoms(atoms);
+    }
+
+    async updateAtoms(updates: AtomUpdate[]): Promise<boolean[]> {
+        return this.openCogService.updateAtoms(updates);
+    }
+
+    async removeAtoms(atomIds: string[]): Promise<boolean[]> {
+        return this.openCogService.removeAtoms(atomIds);
+    }
+
+    async getIncoming(atomId: string): Promise<Atom[]> {
+        return this.openCogService.getIncoming(atomId);
+    }
+
+    async getAttentionalFocus(limit?: number): Promise<Atom[]> {
+        return this.openCogService.getAttentionalFocus(limit);
+    }
+
+    async matchPattern(pattern: AtomPattern, limit?: number): Promise<PatternMatch[]> {
+        return this.openCogService.matchPattern(pattern, limit);
+    }
+
+    async prepareQuery(pattern: AtomPattern): Promise<string> {
+        return this.openCogService.prepareQuery(pattern);
+    }
+
+    async executePreparedQuery(handle: string): Promise<Atom[]> {
+        return this.openCogService.executePreparedQuery(handle);
+    }
+
+    async releasePreparedQuery(handle: string): Promise<boolean> {
+        return this.openCogService.releasePreparedQuery(handle);
+    }
+
+    async getQueryPlanStats(): Promise<QueryPlanStats[]> {
+        return this.openCogService.getQueryPlanStats();
+    }
+
+    async subscribeAtomSpaceChanges(pattern?: AtomPattern): Promise<string> {
+        return this.openCogService.subscribeAtomSpaceChanges(pattern);
+    }
+
+    async unsubscribeAtomSpaceChanges(subscriptionId: string): Promise<boolean> {
+        return this.openCogService.unsubscribeAtomSpaceChanges(subscriptionId);
+    }
+
     async reason(query: ReasoningQuery): Promise<ReasoningResult> {
         return this.openCogService.reason(query);
     }
@@ -98,6 +161,30 @@ export class FrontendOpenCogService implements OpenCogService {
         return this.openCogService.importAtomSpace(data);
     }
 
+    async beginAtomSpaceExport(chunkSize?: number): Promise<string> {
+        return this.openCogService.beginAtomSpaceExport(chunkSize);
+    }
+
+    async readAtomSpaceExportChunk(exportId: string): Promise<AtomSpaceExportChunk> {
+        return this.openCogService.readAtomSpaceExportChunk(exportId);
+    }
+
+    async beginAtomSpaceImport(): Promise<string> {
+        return this.openCogService.beginAtomSpaceImport();
+    }
+
+    async writeAtomSpaceImportChunk(importId: string, data: string): Promise<AtomSpaceTransferProgress> {
+        return this.openCogService.writeAtomSpaceImportChunk(importId, data);
+    }
+
+    async finishAtomSpaceImport(importId: string): Promise<number> {
+        return this.openCogService.finishAtomSpaceImport(importId);
+    }
+
+    async cancelAtomSpaceTransfer(transferId: string): Promise<boolean> {
+        return this.openCogService.cancelAtomSpaceTransfer(transferId);
+    }
+
     // Advanced learning and adaptation methods
     async learnFromFeedback(feedback: UserFeedback, context: LearningContext): Promise<void> {
         return this.openCogService.learnFromFeedback(feedback, context);
@@ -153,6 +240,7 @@ export class FrontendOpenCogService implements OpenCogService {
     // Learning analytics
     async getLearningStats(): Promise<{
         totalLearningRecords: number;
+        retainedLearningRecords: number;
         modelAccuracy: Record<string, number>;
         userAdaptations: number;
         behaviorPatterns: number;
@@ -160,6 +248,10 @@ export class FrontendOpenCogService implements OpenCogService {
         return this.openCogService.getLearningStats();
     }
 
+    async getMemoryBreakdown(): Promise<MemoryBreakdown> {
+        return this.openCogService.getMemoryBreakdown();
+    }
+
     // ===== PHASE 5: MULTI-MODAL COGNITIVE PROCESSING METHODS =====
 
     /**
@@ -38,6 +38,8 @@ export class SensorMotorService implements Disposable {
     protected sensors: Sensor[] = [];
     protected actuators: Map<string, Actuator> = new Map();
 
+    private static readonly CYCLE_INTERVAL_MS = 30000;
+
     constructor(
         @inject(OpenCogService) private readonly opencog: OpenCogService,
         @inject(CodeChangeSensor) private readonly codeChangeSensor: CodeChangeSensor,
@@ -174,21 +176,43 @@ export class SensorMotorService implements Disposable {
     }
 
     private startCognitiveMotorLoop(): void {
-        // Start a periodic cognitive-motor loop that analyzes sensor data and triggers actuators
-        const loopInterval = setInterval(async () => {
-            if (!this.active) {
-                clearInterval(loopInterval);
+        // Run a cognitive-motor cycle when the AtomSpace changes, coalescing the
+        // changes that arrive within one cycle interval into a single cycle
+        let subscriptionId: string | undefined;
+        let pendingCycle: ReturnType<typeof setTimeout> | undefined;
+
+        this.disposables.push(this.opencog.onAtomSpaceChanges(batch => {
+            if (batch.subscriptionId !== subscriptionId || !this.active || pendingCycle) {
                 return;
             }
+            pendingCycle = setTimeout(async () => {
+                pendingCycle = undefined;
+                if (!this.active) {
+                    return;
+                }
+                try {
+                    await this.processCognitiveMotorCycle();
+                } catch (error) {
+                    console.error('Error in cognitive-motor cycle:', error);
+                }
+            }, SensorMotorService.CYCLE_INTERVAL_MS);
+        }));
 
-            try {
-                await this.processCognitiveMotorCycle();
-            } catch (error) {
-                console.error('Error in cognitive-motor cycle:', error);
+        this.opencog.subscribeAtomSpaceChanges().then(id => {
+            subscriptionId = id;
+            if (!this.active) {
+                this.opencog.unsubscribeAtomSpaceChanges(id).catch(() => undefined);
             }
-        }, 30000); // Run every 30 seconds
+        }).catch(error => console.error('Failed to subscribe to AtomSpace changes:', error));
 
-        this.disposables.push({ dispose: () => clearInterval(loopInterval) });
+        this.disposables.push({
+            dispose: () => {
+                clearTimeout(pendingCycle);
+                if (subscriptionId) {
+                    this.opencog.unsubscribeAtomSpaceChanges(subscriptionId).catch(() => undefined);
+                }
+            }
+        });
     }
 
     private async processCognitiveMotorCycle(): Promise<void> {
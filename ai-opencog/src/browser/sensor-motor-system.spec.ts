@@ -37,6 +37,7 @@ describe('Phase 4 Sensor-Motor System', () => {
         // Mock OpenCog service
         mockOpenCogService = {
             addAtom: async () => 'mock-atom-id',
+            addAtoms: async (atoms: unknown[]) => atoms.map(() => 'mock-atom-id'),
             reason: async () => ({ 
                 conclusion: [], 
                 confidence: 0.8, 
@@ -44,6 +45,9 @@ describe('Phase 4 Sensor-Motor System', () => {
                 metadata: { domain: 'test' }
             }),
             queryAtoms: async () => [],
+            onAtomSpaceChanges: () => ({ dispose: () => {} }),
+            subscribeAtomSpaceChanges: async () => 'mock-subscription',
+            unsubscribeAtomSpaceChanges: async () => true,
             getAtomSpaceSize: async () => 100
         };
 
@@ -420,9 +420,7 @@ export class ActivitySensor implements Sensor, Disposable {
 
     private async addAtomsToOpenCog(atoms: Atom[]): Promise<void> {
         try {
-            for (const atom of atoms) {
-                await this.opencog.addAtom(atom);
-            }
+            await this.opencog.addAtoms(atoms);
         } catch (error) {
             console.error('Error adding activity atoms to OpenCog:', error);
         }
@@ -366,9 +366,7 @@ export class CodeChangeSensor implements Sensor, Disposable {
 
     private async addAtomsToOpenCog(atoms: Atom[]): Promise<void> {
         try {
-            for (const atom of atoms) {
-                await this.opencog.addAtom(atom);
-            }
+            await this.opencog.addAtoms(atoms);
         } catch (error) {
             console.error('Error adding atoms to OpenCog:', error);
         }
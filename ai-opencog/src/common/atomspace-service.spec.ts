@@ -16,8 +16,10 @@
 
 import { expect } from 'chai';
 import { Container } from '@theia/core/shared/inversify';
+import { Emitter } from '@theia/core/lib/common/event';
 import { AtomSpaceService } from '../node/atomspace-service';
-import { Atom, PatternInput } from '../common/opencog-types';
+import { AtomSpaceConnection } from '../node/atomspace-connection';
+import { Atom, AtomSpaceChangeBatch, PatternInput, PatternMatch } from '../common/opencog-types';
 
 describe('AtomSpaceService', () => {
     let atomSpaceService: AtomSpaceService;
@@ -76,6 +78,213 @@ describe('AtomSpaceService', () => {
         expect(result.metadata).to.have.property('reasoningType');
     });
 
+    describe('Query Indexes', () => {
+        beforeEach(async () => {
+            await atomSpaceService.addAtom({ type: 'ConceptNode', name: 'shared' });
+            await atomSpaceService.addAtom({ type: 'PredicateNode', name: 'shared' });
+            await atomSpaceService.addAtom({ type: 'ConceptNode', name: 'other' });
+        });
+
+        it('should query by name across types', async () => {
+            const atoms = await atomSpaceService.queryAtoms({ name: 'shared' });
+            expect(atoms.map(a => a.type)).to.have.members(['ConceptNode', 'PredicateNode']);
+        });
+
+        it('should query by composite type and name', async () => {
+            const atoms = await atomSpaceService.queryAtoms({ type: 'ConceptNode', name: 'shared' });
+            expect(atoms).to.have.length(1);
+            expect(atoms[0].type).to.equal('ConceptNode');
+        });
+
+        it('should keep indexes in sync with updates and removals', async () => {
+            const [atom] = await atomSpaceService.queryAtoms({ type: 'ConceptNode', name: 'other' });
+            await atomSpaceService.updateAtom(atom.id!, { name: 'renamed' });
+
+            expect(await atomSpaceService.queryAtoms({ name: 'other' })).to.have.length(0);
+            expect(await atomSpaceService.queryAtoms({ type: 'ConceptNode', name: 'renamed' })).to.have.length(1);
+
+            await atomSpaceService.removeAtom(atom.id!);
+            expect(await atomSpaceService.queryAtoms({ name: 'renamed' })).to.have.length(0);
+            expect(await atomSpaceService.queryAtoms({ type: 'ConceptNode' })).to.have.length(1);
+        });
+
+        it('should rebuild indexes on import and clear', async () => {
+            const exported = await atomSpaceService.exportAtomSpace();
+            await atomSpaceService.clearAtomSpace();
+            expect(await atomSpaceService.queryAtoms({ name: 'shared' })).to.have.length(0);
+
+            await atomSpaceService.importAtomSpace(exported);
+            expect(await atomSpaceService.queryAtoms({ name: 'shared' })).to.have.length(2);
+        });
+    });
+
+    describe('Threshold Queries', () => {
+        beforeEach(async () => {
+            await atomSpaceService.addAtom({
+                type: 'ConceptNode',
+                name: 'weak',
+                truthValue: { strength: 0.3, confidence: 0.9 },
+                attentionValue: { sti: 10, lti: 1, vlti: 0 }
+            });
+            await atomSpaceService.addAtom({
+                type: 'ConceptNode',
+                name: 'strong',
+                truthValue: { strength: 0.85, confidence: 0.4 },
+                attentionValue: { sti: 50, lti: 5, vlti: 0 }
+            });
+            await atomSpaceService.addAtom({
+                type: 'PredicateNode',
+                name: 'certain',
+                truthValue: { strength: 0.95, confidence: 0.95 },
+                attentionValue: { sti: 30, lti: 3, vlti: 1 }
+            });
+            await atomSpaceService.addAtom({ type: 'ConceptNode', name: 'untracked' });
+        });
+
+        it('should apply truth value thresholds', async () => {
+            const strong = await atomSpaceService.queryAtoms({ truthValueThreshold: { strength: 0.8, confidence: 0 } });
+            expect(strong.map(a => a.name)).to.have.members(['strong', 'certain']);
+
+            const confident = await atomSpaceService.queryAtoms({ truthValueThreshold: { strength: 0.8, confidence: 0.9 } });
+            expect(confident.map(a => a.name)).to.deep.equal(['certain']);
+        });
+
+        it('should combine thresholds with type constraints', async () => {
+            const atoms = await atomSpaceService.queryAtoms({
+                type: 'ConceptNode',
+                truthValueThreshold: { strength: 0.8, confidence: 0 }
+            });
+            expect(atoms.map(a => a.name)).to.deep.equal(['strong']);
+        });
+
+        it('should apply attention thresholds', async () => {
+            const atoms = await atomSpaceService.queryAtoms({ attentionThreshold: { sti: 20, lti: 0, vlti: 1 } });
+            expect(atoms.map(a => a.name)).to.deep.equal(['certain']);
+        });
+
+        it('should return the attentional focus ordered by STI', async () => {
+            const focus = await atomSpaceService.getAttentionalFocus(2);
+            expect(focus.map(a => a.name)).to.deep.equal(['strong', 'certain']);
+        });
+
+        it('should re-index values on update', async () => {
+            const [weak] = await atomSpaceService.queryAtoms({ type: 'ConceptNode', name: 'weak' });
+            await atomSpaceService.updateAtom(weak.id!, { attentionValue: { sti: 100, lti: 1, vlti: 0 } });
+
+            const focus = await atomSpaceService.getAttentionalFocus(1);
+            expect(focus[0].name).to.equal('weak');
+        });
+    });
+
+    describe('Link Structure', () => {
+        const inheritance = (child: string, parent: string): Atom => ({
+            type: 'InheritanceLink',
+            outgoing: [
+                { type: 'ConceptNode', name: child },
+                { type: 'ConceptNode', name: parent }
+            ]
+        });
+
+        it('should intern identical nodes and links', async () => {
+            const firstId = await atomSpaceService.addAtom(inheritance('cat', 'animal'));
+            const secondId = await atomSpaceService.addAtom(inheritance('cat', 'animal'));
+            await atomSpaceService.addAtom(inheritance('dog', 'animal'));
+
+            expect(secondId).to.equal(firstId);
+            expect(await atomSpaceService.queryAtoms({ type: 'ConceptNode', name: 'animal' })).to.have.length(1);
+            // cat, dog, animal and two distinct links
+            expect(await atomSpaceService.getAtomSpaceSize()).to.equal(5);
+        });
+
+        it('should merge values when an existing atom is re-added', async () => {
+            const atomId = await atomSpaceService.addAtom({
+                type: 'ConceptNode',
+                name: 'merged',
+                truthValue: { strength: 0.4, confidence: 0.2 }
+            });
+            await atomSpaceService.addAtom({
+                type: 'ConceptNode',
+                name: 'merged',
+                truthValue: { strength: 0.9, confidence: 0.8 },
+                metadata: { source: 'sensor' }
+            });
+
+            const [atom] = await atomSpaceService.queryAtoms({ type: 'ConceptNode', name: 'merged' });
+            expect(atom.id).to.equal(atomId);
+            expect(atom.truthValue).to.deep.equal({ strength: 0.9, confidence: 0.8 });
+            expect(atom.metadata).to.deep.equal({ source: 'sensor' });
+        });
+
+        it('should give a re-derived conclusion the same content-addressed atom', async () => {
+            const query = {
+                type: 'deductive' as const,
+                atoms: [{
+                    type: 'ImplicationLink',
+                    truthValue: { strength: 0.9, confidence: 0.8 },
+                    outgoing: [
+                        { type: 'ConceptNode', name: 'rain', truthValue: { strength: 0.9, confidence: 0.9 } },
+                        inheritance('street', 'wet')
+                    ]
+                }]
+            };
+            const [first] = (await atomSpaceService.reason(query)).conclusion as Atom[];
+            const [second] = (await atomSpaceService.reason(query)).conclusion as Atom[];
+            expect(first.id).to.equal(second.id);
+
+            const firstId = await atomSpaceService.addAtom(first);
+            const secondId = await atomSpaceService.addAtom(second);
+            expect(secondId).to.equal(firstId);
+            expect(await atomSpaceService.queryAtoms({ type: 'InheritanceLink' })).to.have.length(1);
+            // Adding the same content without an ID resolves to the derived atom
+            expect(await atomSpaceService.addAtom(inheritance('street', 'wet'))).to.equal(firstId);
+        });
+
+        it('should materialize outgoing atoms from stored IDs', async () => {
+            await atomSpaceService.addAtom(inheritance('cat', 'animal'));
+            const [link] = await atomSpaceService.queryAtoms({ type: 'InheritanceLink' });
+
+            expect(link.outgoing!.map(a => a.name)).to.deep.equal(['cat', 'animal']);
+            expect(link.outgoing![0].id).to.be.a('string');
+        });
+
+        it('should maintain incoming sets', async () => {
+            const catLink = await atomSpaceService.addAtom(inheritance('cat', 'animal'));
+            const dogLink = await atomSpaceService.addAtom(inheritance('dog', 'animal'));
+            const [animal] = await atomSpaceService.queryAtoms({ type: 'ConceptNode', name: 'animal' });
+            const [cat] = await atomSpaceService.queryAtoms({ type: 'ConceptNode', name: 'cat' });
+
+            expect((await atomSpaceService.getIncoming(animal.id!)).map(a => a.id)).to.have.members([catLink, dogLink]);
+            expect((await atomSpaceService.getIncoming(cat.id!)).map(a => a.id)).to.deep.equal([catLink]);
+
+            await atomSpaceService.removeAtom(dogLink);
+            expect((await atomSpaceService.getIncoming(animal.id!)).map(a => a.id)).to.deep.equal([catLink]);
+        });
+
+        it('should remove links that contain a removed atom', async () => {
+            await atomSpaceService.addAtom(inheritance('cat', 'animal'));
+            const [cat] = await atomSpaceService.queryAtoms({ type: 'ConceptNode', name: 'cat' });
+
+            expect(await atomSpaceService.removeAtom(cat.id!)).to.equal(true);
+            expect(await atomSpaceService.queryAtoms({ type: 'InheritanceLink' })).to.have.length(0);
+            expect(await atomSpaceService.queryAtoms({ type: 'ConceptNode', name: 'animal' })).to.have.length(1);
+        });
+
+        it('should round-trip links through export and import', async () => {
+            await atomSpaceService.addAtom(inheritance('cat', 'animal'));
+            const exported = await atomSpaceService.exportAtomSpace();
+
+            await atomSpaceService.clearAtomSpace();
+            await atomSpaceService.importAtomSpace(exported);
+
+            expect(await atomSpaceService.getAtomSpaceSize()).to.equal(3);
+            const [animal] = await atomSpaceService.queryAtoms({ type: 'ConceptNode', name: 'animal' });
+            expect(await atomSpaceService.getIncoming(animal.id!)).to.have.length(1);
+
+            const newId = await atomSpaceService.addAtom({ type: 'ConceptNode', name: 'fresh' });
+            expect(newId).to.not.be.oneOf(JSON.parse(exported).map((a: Atom) => a.id));
+        });
+    });
+
     it('should manage AtomSpace size', async () => {
         const initialSize = await atomSpaceService.getAtomSpaceSize();
         expect(initialSize).to.equal(0);
@@ -131,6 +340,485 @@ describe('AtomSpaceService', () => {
         expect(names).to.include('concept2');
     });
 
+    describe('Pattern Matching', () => {
+        const link = (type: string, child: string, parent: string): Atom => ({
+            type,
+            outgoing: [
+                { type: 'ConceptNode', name: child },
+                { type: 'ConceptNode', name: parent }
+            ]
+        });
+
+        beforeEach(async () => {
+            await atomSpaceService.addAtom(link('InheritanceLink', 'cat', 'mammal'));
+            await atomSpaceService.addAtom(link('InheritanceLink', 'dog', 'mammal'));
+            await atomSpaceService.addAtom(link('InheritanceLink', 'mammal', 'animal'));
+            await atomSpaceService.addAtom(link('InheritanceLink', 'sparrow', 'bird'));
+            await atomSpaceService.addAtom(link('SimilarityLink', 'cat', 'dog'));
+        });
+
+        const names = (matches: PatternMatch[], variable: string) =>
+            matches.map(match => match.bindings[variable].name).sort();
+
+        it('should bind variables in a single template', async () => {
+            const matches = await atomSpaceService.matchPattern({
+                pattern: {
+                    type: 'InheritanceLink',
+                    outgoing: ['$X', { type: 'ConceptNode', name: 'mammal' }]
+                }
+            });
+
+            expect(names(matches, '$X')).to.deep.equal(['cat', 'dog']);
+            expect(matches[0].groundings[0].type).to.equal('InheritanceLink');
+        });
+
+        it('should join clauses on shared variables', async () => {
+            const matches = await atomSpaceService.matchPattern({
+                pattern: {
+                    clauses: [
+                        { type: 'InheritanceLink', outgoing: ['$X', '$Y'] },
+                        { type: 'InheritanceLink', outgoing: ['$Y', { type: 'ConceptNode', name: 'animal' }] }
+                    ]
+                }
+            });
+
+            expect(names(matches, '$X')).to.deep.equal(['cat', 'dog']);
+            expect(names(matches, '$Y')).to.deep.equal(['mammal', 'mammal']);
+        });
+
+        it('should require repeated variables to bind the same atom', async () => {
+            await atomSpaceService.addAtom(link('SimilarityLink', 'cat', 'cat'));
+            const matches = await atomSpaceService.matchPattern({
+                pattern: { type: 'SimilarityLink', outgoing: ['$X', '$X'] }
+            });
+
+            expect(names(matches, '$X')).to.deep.equal(['cat']);
+        });
+
+        it('should apply bindVariables constraints and bind whole links', async () => {
+            const matches = await atomSpaceService.matchPattern({
+                pattern: { variable: '$L', outgoing: ['$X', '$Y'] },
+                bindVariables: { $L: 'SimilarityLink', $Y: { name: 'dog' } }
+            });
+
+            expect(matches).to.have.length(1);
+            expect(matches[0].bindings.$L.type).to.equal('SimilarityLink');
+            expect(matches[0].bindings.$X.name).to.equal('cat');
+        });
+
+        it('should stop after the requested number of groundings', async () => {
+            const matches = await atomSpaceService.matchPattern({
+                pattern: { type: 'InheritanceLink', outgoing: ['$X', '$Y'] }
+            }, 2);
+
+            expect(matches).to.have.length(2);
+        });
+
+        it('should answer queryAtoms with the atoms grounding the template', async () => {
+            const atoms = await atomSpaceService.queryAtoms({
+                type: 'InheritanceLink',
+                pattern: { outgoing: [{ type: 'ConceptNode', name: 'cat' }, '$Y'] }
+            });
+
+            expect(atoms).to.have.length(1);
+            expect(atoms[0].outgoing!.map(atom => atom.name)).to.deep.equal(['cat', 'mammal']);
+        });
+    });
+
+    describe('Prepared Queries', () => {
+        beforeEach(async () => {
+            for (let i = 0; i < 20; i++) {
+                await atomSpaceService.addAtom({
+                    type: i % 2 === 0 ? 'ConceptNode' : 'PredicateNode',
+                    name: `atom-${i}`,
+                    truthValue: { strength: i / 20, confidence: 0.9 }
+                });
+            }
+        });
+
+        it('should execute a prepared query repeatedly', async () => {
+            const handle = await atomSpaceService.prepareQuery({ type: 'ConceptNode', truthValueThreshold: { strength: 0.5, confidence: 0 } });
+
+            const first = await atomSpaceService.executePreparedQuery(handle);
+            await atomSpaceService.addAtom({ type: 'ConceptNode', name: 'late', truthValue: { strength: 1, confidence: 1 } });
+            const second = await atomSpaceService.executePreparedQuery(handle);
+
+            expect(first.map(atom => atom.name)).to.have.members(['atom-10', 'atom-12', 'atom-14', 'atom-16', 'atom-18']);
+            expect(second).to.have.length(first.length + 1);
+        });
+
+        it('should reject unknown or released handles', async () => {
+            const handle = await atomSpaceService.prepareQuery({ type: 'ConceptNode' });
+            expect(await atomSpaceService.releasePreparedQuery(handle)).to.be.true;
+
+            let error: Error | undefined;
+            try {
+                await atomSpaceService.executePreparedQuery(handle);
+            } catch (e) {
+                error = e;
+            }
+            expect(error).to.be.instanceOf(Error);
+        });
+
+        it('should share one plan per pattern shape and report its usage', async () => {
+            await atomSpaceService.queryAtoms({ type: 'ConceptNode', name: 'atom-0' });
+            await atomSpaceService.queryAtoms({ type: 'PredicateNode', name: 'atom-1' });
+            await atomSpaceService.queryAtoms({ name: 'atom-2' });
+
+            const stats = await atomSpaceService.getQueryPlanStats();
+            const typeAndName = stats.find(plan => plan.shape === 'type|name')!;
+            expect(typeAndName.accessPath).to.equal('type-name');
+            expect(typeAndName.executions).to.equal(2);
+            expect(typeAndName.hits).to.equal(1);
+            expect(typeAndName.totalLatencyMs).to.be.at.least(0);
+            expect(stats.find(plan => plan.shape === 'name')!.executions).to.equal(1);
+        });
+    });
+
+    describe('Batched Operations', () => {
+        it('should add, update and remove atoms in batches', async () => {
+            const [cat, animal, link] = await atomSpaceService.addAtoms([
+                { id: 'cat', type: 'ConceptNode', name: 'cat' },
+                { id: 'animal', type: 'ConceptNode', name: 'animal' },
+                { type: 'InheritanceLink', outgoing: [{ id: 'cat', type: 'ConceptNode' }, { id: 'animal', type: 'ConceptNode' }] }
+            ]);
+            expect([cat, animal]).to.deep.equal(['cat', 'animal']);
+            expect(await atomSpaceService.getAtomSpaceSize()).to.equal(3);
+
+            const updated = await atomSpaceService.updateAtoms([
+                { atomId: cat, updates: { truthValue: { strength: 0.9, confidence: 0.8 } } },
+                { atomId: 'missing', updates: { name: 'x' } }
+            ]);
+            expect(updated).to.deep.equal([true, false]);
+            const [stored] = await atomSpaceService.queryAtoms({ type: 'ConceptNode', name: 'cat' });
+            expect(stored.truthValue).to.deep.equal({ strength: 0.9, confidence: 0.8 });
+
+            expect(await atomSpaceService.removeAtoms([animal, link, 'missing'])).to.deep.equal([true, false, false]);
+            expect(await atomSpaceService.getAtomSpaceSize()).to.equal(1);
+        });
+
+        it('should roll back a batch when one change fails', async () => {
+            const cat = await atomSpaceService.addAtom({ type: 'ConceptNode', name: 'cat', truthValue: { strength: 0.5, confidence: 0.5 } });
+            const animal = await atomSpaceService.addAtom({ type: 'ConceptNode', name: 'animal' });
+            const link = await atomSpaceService.addAtom({ type: 'InheritanceLink', outgoing: [{ id: cat, type: 'ConceptNode' }, { id: animal, type: 'ConceptNode' }] });
+
+            let error: Error | undefined;
+            try {
+                await atomSpaceService.updateAtoms([
+                    { atomId: cat, updates: { truthValue: { strength: 0.1, confidence: 0.9 } } },
+                    { atomId: link, updates: { outgoing: [null as unknown as Atom] } }
+                ]);
+            } catch (e) {
+                error = e as Error;
+            }
+            expect(error).to.not.be.undefined;
+            const [stored] = await atomSpaceService.queryAtoms({ type: 'ConceptNode', name: 'cat' });
+            expect(stored.truthValue).to.deep.equal({ strength: 0.5, confidence: 0.5 });
+
+            error = undefined;
+            try {
+                await atomSpaceService.addAtoms([
+                    { type: 'ConceptNode', name: 'dog' },
+                    { type: 'ListLink', outgoing: [null as unknown as Atom] }
+                ]);
+            } catch (e) {
+                error = e as Error;
+            }
+            expect(error).to.not.be.undefined;
+            expect(await atomSpaceService.queryAtoms({ type: 'ConceptNode', name: 'dog' })).to.be.empty;
+
+            await atomSpaceService.removeAtoms([animal]);
+            expect(await atomSpaceService.getAtomSpaceSize()).to.equal(1);
+            expect(await atomSpaceService.getIncoming(cat)).to.be.empty;
+        });
+    });
+
+    describe('Change Feed', () => {
+        function collect(subscriptionId: string): AtomSpaceChangeBatch[] {
+            const batches: AtomSpaceChangeBatch[] = [];
+            atomSpaceService.onAtomSpaceChanges(batch => {
+                if (batch.subscriptionId === subscriptionId) {
+                    batches.push(batch);
+                }
+            });
+            return batches;
+        }
+
+        const nextTurn = () => new Promise(resolve => setImmediate(resolve));
+
+        it('should deliver sequenced changes in one batch per turn', async () => {
+            const subscriptionId = await atomSpaceService.subscribeAtomSpaceChanges();
+            const batches = collect(subscriptionId);
+
+            const [cat, animal] = await atomSpaceService.addAtoms([
+                { type: 'ConceptNode', name: 'cat' },
+                { type: 'ConceptNode', name: 'animal' }
+            ]);
+            const link = await atomSpaceService.addAtom({ type: 'InheritanceLink', outgoing: [{ id: cat, type: 'ConceptNode' }, { id: animal, type: 'ConceptNode' }] });
+            await atomSpaceService.updateAtom(cat, { truthValue: { strength: 0.9, confidence: 0.9 } });
+            await atomSpaceService.removeAtom(animal);
+            expect(batches).to.be.empty;
+
+            await nextTurn();
+            expect(batches).to.have.length(1);
+            const changes = batches[0].changes;
+            expect(changes.map(change => change.kind)).to.deep.equal(['added', 'added', 'added', 'updated', 'removed', 'removed']);
+            expect(changes.map(change => change.atom!.id)).to.deep.equal([cat, animal, link, cat, link, animal]);
+            for (let i = 1; i < changes.length; i++) {
+                expect(changes[i].sequence).to.equal(changes[i - 1].sequence + 1);
+            }
+            expect(changes[2].atom!.outgoing).to.deep.equal([{ id: cat, type: 'ConceptNode' }, { id: animal, type: 'ConceptNode' }]);
+        });
+
+        it('should filter changes by pattern and stop after unsubscribing', async () => {
+            const strong = await atomSpaceService.subscribeAtomSpaceChanges({ type: 'ConceptNode', truthValueThreshold: { strength: 0.8, confidence: 0 } });
+            const batches = collect(strong);
+
+            const weak = await atomSpaceService.addAtom({ type: 'ConceptNode', name: 'weak', truthValue: { strength: 0.2, confidence: 0.5 } });
+            const sure = await atomSpaceService.addAtom({ type: 'ConceptNode', name: 'sure', truthValue: { strength: 0.9, confidence: 0.5 } });
+            await atomSpaceService.addAtom({ type: 'PredicateNode', name: 'other', truthValue: { strength: 0.9, confidence: 0.5 } });
+            // Leaving the filter is reported as well
+            await atomSpaceService.updateAtom(sure, { truthValue: { strength: 0.1, confidence: 0.5 } });
+            await atomSpaceService.updateAtom(weak, { name: 'still-weak' });
+            await nextTurn();
+
+            expect(batches).to.have.length(1);
+            expect(batches[0].changes.map(change => [change.kind, change.atom!.id])).to.deep.equal([['added', sure], ['updated', sure]]);
+
+            expect(await atomSpaceService.unsubscribeAtomSpaceChanges(strong)).to.be.true;
+            await atomSpaceService.addAtom({ type: 'ConceptNode', name: 'late', truthValue: { strength: 0.9, confidence: 0.5 } });
+            await atomSpaceService.clearAtomSpace();
+            await nextTurn();
+            expect(batches).to.have.length(1);
+        });
+
+        it('should deliver changes only to the subscribing connection until it disconnects', async () => {
+            const connect = () => {
+                const batches: AtomSpaceChangeBatch[] = [];
+                const closed = new Emitter<void>();
+                const service = AtomSpaceConnection.serve(atomSpaceService, {
+                    onAtomSpaceChanges: batch => batches.push(batch),
+                    onDidCloseConnection: closed.event
+                });
+                return { service, batches, close: () => closed.fire() };
+            };
+            const first = connect();
+            const second = connect();
+            const firstId = await first.service.subscribeAtomSpaceChanges();
+            await second.service.subscribeAtomSpaceChanges();
+
+            const cat = await first.service.addAtom({ type: 'ConceptNode', name: 'cat' });
+            await nextTurn();
+            expect(first.batches).to.have.length(1);
+            expect(first.batches[0].subscriptionId).to.equal(firstId);
+            expect(second.batches).to.have.length(1);
+            expect(second.batches[0].subscriptionId).to.not.equal(firstId);
+            expect(await second.service.unsubscribeAtomSpaceChanges(firstId)).to.be.false;
+
+            first.close();
+            await atomSpaceService.removeAtom(cat);
+            await nextTurn();
+            expect(first.batches).to.have.length(1);
+            expect(second.batches).to.have.length(2);
+            expect(await atomSpaceService.unsubscribeAtomSpaceChanges(firstId)).to.be.false;
+        });
+    });
+
+    describe('Read Views', () => {
+        it('should keep reading the version a view was taken at', async () => {
+            const cat = await atomSpaceService.addAtom({ type: 'ConceptNode', name: 'cat', truthValue: { strength: 0.5, confidence: 0.5 } });
+            const animal = await atomSpaceService.addAtom({ type: 'ConceptNode', name: 'animal' });
+            const link = await atomSpaceService.addAtom({ type: 'InheritanceLink', outgoing: [{ id: cat, type: 'ConceptNode' }, { id: animal, type: 'ConceptNode' }] });
+
+            const view = atomSpaceService.snapshot();
+            await atomSpaceService.updateAtom(cat, { truthValue: { strength: 0.9, confidence: 0.9 } });
+            await atomSpaceService.removeAtom(animal);
+            const dog = await atomSpaceService.addAtom({ type: 'ConceptNode', name: 'dog' });
+
+            expect(view.size).to.equal(3);
+            expect(view.get(cat)!.truthValue).to.deep.equal({ strength: 0.5, confidence: 0.5 });
+            expect(view.has(dog)).to.be.false;
+            expect(view.getAtom(link)!.outgoing!.map(child => child.name)).to.deep.equal(['cat', 'animal']);
+            expect(Array.from(view.values(), record => record.id)).to.have.members([cat, animal, link]);
+            expect(await atomSpaceService.getAtomSpaceSize()).to.equal(2);
+
+            await atomSpaceService.clearAtomSpace();
+            expect(Array.from(view.values(), record => record.id)).to.have.members([cat, animal, link]);
+
+            view.release();
+            expect(() => view.get(cat)).to.throw(/released/);
+        });
+
+        it('should export a consistent stream while atoms are written between chunks', async () => {
+            for (let i = 0; i < 50; i++) {
+                await atomSpaceService.addAtom({ type: 'ConceptNode', name: `concept-${i}` });
+            }
+            const ids: string[] = [];
+            let written = 0;
+            for await (const chunk of atomSpaceService.exportAtomSpaceStream({ batchSize: 10 })) {
+                ids.push(...chunk.trim().split('\n').map(line => JSON.parse(line).id));
+                await atomSpaceService.addAtom({ type: 'ConceptNode', name: `late-${written++}` });
+                await atomSpaceService.removeAtom(ids[0]);
+            }
+            expect(ids).to.have.length(50);
+            expect(new Set(ids).size).to.equal(50);
+        });
+    });
+
+    describe('Memory Accounting', () => {
+        it('should attribute memory to the stores that hold it', async () => {
+            const empty = await atomSpaceService.getMemoryBreakdown();
+            expect(empty.atomSpace).to.deep.equal({ entries: 0, bytes: 0 });
+            expect(empty.atomSpaceViews).to.deep.equal({ entries: 0, bytes: 0 });
+
+            const atoms: Atom[] = [];
+            for (let i = 0; i < 1000; i++) {
+                atoms.push({ type: 'ConceptNode', name: `concept_${i}`, truthValue: { strength: 0.5, confidence: 0.5 } });
+            }
+            await atomSpaceService.addAtoms(atoms);
+            await atomSpaceService.learn({ type: 'supervised', input: { code: 'x' }, output: 'y', timestamp: Date.now() });
+            const [first] = await atomSpaceService.queryAtoms({ type: 'ConceptNode', name: 'concept_1' });
+            const view = atomSpaceService.snapshot();
+            await atomSpaceService.updateAtom(first.id!, { name: 'renamed' });
+
+            const breakdown = await atomSpaceService.getMemoryBreakdown();
+            view.release();
+            expect(breakdown.atomSpace.entries).to.equal(await atomSpaceService.getAtomSpaceSize());
+            expect(breakdown.atomSpace.bytes).to.be.greaterThan(1000 * 100);
+            expect(breakdown.learningHistory.entries).to.equal(1);
+            expect(breakdown.learningHistory.bytes).to.be.greaterThan(0);
+            // Three hash index keys, four value entries and one content key per atom
+            expect(breakdown.atomSpaceIndexes.entries).to.be.greaterThan(1000 * 4);
+            expect(breakdown.atomSpaceIndexes.bytes).to.be.greaterThan(1000 * 100);
+            expect(breakdown.atomSpaceViews.entries).to.equal(1);
+            expect(breakdown.atomSpaceViews.bytes).to.be.greaterThan(0);
+            expect(breakdown.queryCache.entries).to.equal(1);
+            expect(breakdown.queryCache.bytes).to.be.greaterThan(0);
+            expect(breakdown.accountedBytes).to.equal(breakdown.atomSpace.bytes + breakdown.atomSpaceIndexes.bytes
+                + breakdown.atomSpaceViews.bytes + breakdown.queryCache.bytes + breakdown.learningHistory.bytes
+                + breakdown.userBehaviorPatterns.bytes + breakdown.learningModels.bytes + breakdown.advancedLearningModels.bytes);
+            expect(breakdown.heapUsed).to.be.greaterThan(0);
+        });
+    });
+
+    describe('Streaming Transfer', () => {
+        async function populate(count: number): Promise<void> {
+            for (let i = 0; i < count; i++) {
+                await atomSpaceService.addAtom({
+                    type: 'InheritanceLink',
+                    outgoing: [{ type: 'ConceptNode', name: `child-${i}` }, { type: 'ConceptNode', name: 'parent' }],
+                    truthValue: { strength: 0.8, confidence: 0.5 }
+                });
+            }
+        }
+
+        async function collect(source: AsyncIterable<string>): Promise<string> {
+            let text = '';
+            for await (const chunk of source) {
+                text += chunk;
+            }
+            return text;
+        }
+
+        async function* fromChunks(chunks: string[]): AsyncIterableIterator<string> {
+            yield* chunks;
+        }
+
+        it('should stream an NDJSON export and re-import it', async () => {
+            await populate(25);
+            const progress: number[] = [];
+            const exported = await collect(atomSpaceService.exportAtomSpaceStream({
+                batchSize: 10,
+                onProgress: ({ processed }) => progress.push(processed)
+            }));
+
+            expect(exported.trim().split('\n')).to.have.length(51);
+            expect(progress).to.deep.equal([10, 20, 30, 40, 50, 51]);
+
+            // Split mid-line and reverse the lines so links arrive before their atoms
+            const reversed = exported.trim().split('\n').reverse().join('\n');
+            const imported = await atomSpaceService.importAtomSpaceStream(fromChunks([reversed.slice(0, 77), reversed.slice(77)]));
+
+            expect(imported).to.equal(51);
+            expect(await atomSpaceService.getAtomSpaceSize()).to.equal(51);
+            const [parent] = await atomSpaceService.queryAtoms({ type: 'ConceptNode', name: 'parent' });
+            expect(await atomSpaceService.getIncoming(parent.id!)).to.have.length(25);
+        });
+
+        it('should transfer the AtomSpace in RPC-sized chunks', async () => {
+            await populate(12);
+            const exportId = await atomSpaceService.beginAtomSpaceExport(5);
+            const chunks: string[] = [];
+            let chunk = await atomSpaceService.readAtomSpaceExportChunk(exportId);
+            while (!chunk.done) {
+                expect(chunk.total).to.equal(25);
+                chunks.push(chunk.data);
+                chunk = await atomSpaceService.readAtomSpaceExportChunk(exportId);
+            }
+            expect(chunks).to.have.length(5);
+            expect(chunk.processed).to.equal(25);
+
+            const importId = await atomSpaceService.beginAtomSpaceImport();
+            expect(await atomSpaceService.getAtomSpaceSize()).to.equal(0);
+            for (const data of chunks) {
+                await atomSpaceService.writeAtomSpaceImportChunk(importId, data);
+            }
+            expect(await atomSpaceService.finishAtomSpaceImport(importId)).to.equal(25);
+            expect(await atomSpaceService.queryAtoms({ type: 'InheritanceLink' })).to.have.length(12);
+        });
+
+        it('should reject links whose atoms never arrive', async () => {
+            const line = JSON.stringify({ id: 'atom_9', type: 'ListLink', outgoing: ['atom_404'] });
+            let error: Error | undefined;
+            try {
+                await atomSpaceService.importAtomSpaceStream(fromChunks([line]));
+            } catch (e) {
+                error = e;
+            }
+            expect(error).to.be.instanceOf(Error);
+            expect(error!.message).to.contain('atom_404');
+        });
+
+        it('should forget cancelled transfers', async () => {
+            await populate(3);
+            const exportId = await atomSpaceService.beginAtomSpaceExport();
+            expect(await atomSpaceService.cancelAtomSpaceTransfer(exportId)).to.be.true;
+            expect(await atomSpaceService.cancelAtomSpaceTransfer(exportId)).to.be.false;
+        });
+
+        it('should export the AtomSpace as it was when the export began', async () => {
+            await populate(3);
+            const exportId = await atomSpaceService.beginAtomSpaceExport(2);
+            await populate(5);
+
+            let chunk = await atomSpaceService.readAtomSpaceExportChunk(exportId);
+            while (!chunk.done) {
+                expect(chunk.total).to.equal(7);
+                chunk = await atomSpaceService.readAtomSpaceExportChunk(exportId);
+            }
+            expect(chunk.processed).to.equal(7);
+            expect((await atomSpaceService.getMemoryBreakdown()).atomSpaceViews.entries).to.equal(0);
+        });
+
+        it('should cancel the transfers of a connection that disconnects', async () => {
+            await populate(3);
+            const closed = new Emitter<void>();
+            const service = AtomSpaceConnection.serve(atomSpaceService, {
+                onAtomSpaceChanges: () => undefined,
+                onDidCloseConnection: closed.event
+            });
+            const exportId = await service.beginAtomSpaceExport(2);
+            await service.readAtomSpaceExportChunk(exportId);
+            await populate(5);
+            expect((await atomSpaceService.getMemoryBreakdown()).atomSpaceViews.entries).to.be.greaterThan(0);
+
+            closed.fire();
+            await populate(1);
+            expect((await atomSpaceService.getMemoryBreakdown()).atomSpaceViews.entries).to.equal(0);
+            expect(await atomSpaceService.cancelAtomSpaceTransfer(exportId)).to.be.false;
+        });
+    });
+
     describe('Pattern Recognition', () => {
         it('should recognize code patterns in JavaScript code', async () => {
             const codeInput: PatternInput = {
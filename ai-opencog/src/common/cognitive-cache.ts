@@ -9,6 +9,7 @@
  */
 
 import { injectable } from '@theia/core/shared/inversify';
+import { estimateCollectionBytes } from './memory-estimate';
 
 export interface CacheEntry {
     data: any;
@@ -154,6 +155,13 @@ export class CognitiveCache {
         };
     }
 
+    /**
+     * Estimated heap bytes held by the cached entries
+     */
+    estimateMemoryUsage(): number {
+        return estimateCollectionBytes(this.cache.entries(), this.cache.size);
+    }
+
     /**
      * Check if key exists in cache and is not expired
      */
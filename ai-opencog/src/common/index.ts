@@ -26,6 +26,7 @@ export * from './distributed-reasoning-types';
 export * from './distributed-reasoning-service';
 export * from './production-optimization-types';
 export * from './cognitive-cache';
+export * from './memory-estimate';
 export * from './cognitive-personalization';
 export * from './resource-manager';
 export * from './feedback-integration';
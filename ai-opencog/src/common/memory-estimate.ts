@@ -0,0 +1,123 @@
+/**
+ * Copyright (c) 2024 Cognitive Intelligence Ventures.
+ * 
+ * This program and the accompanying materials are made available under the
+ * terms of the Eclipse Public License v. 2.0 which is available at
+ * http://www.eclipse.org/legal/epl-2.0.
+ * 
+ * SPDX-License-Identifier: EPL-2.0
+ */
+
+/*
+ * Approximate V8 object sizes on a 64-bit heap. Small integers are stored inline;
+ * other numbers are boxed. Strings are assumed to be one byte per character.
+ */
+const OBJECT_HEADER_BYTES = 24;
+const FIELD_BYTES = 8;
+const STRING_HEADER_BYTES = 16;
+const HEAP_NUMBER_BYTES = 16;
+const MAX_SMALL_INTEGER = 2 ** 30;
+
+/**
+ * Estimate the heap bytes retained by a value and everything reachable from it.
+ * Objects reached twice are counted once per `seen` set.
+ */
+export function estimateRetainedBytes(value: unknown, seen: Set<object> = new Set()): number {
+    switch (typeof value) {
+        case 'string':
+            return STRING_HEADER_BYTES + Math.ceil(value.length / FIELD_BYTES) * FIELD_BYTES;
+        case 'number':
+            return Number.isInteger(value) && Math.abs(value) < MAX_SMALL_INTEGER ? 0 : HEAP_NUMBER_BYTES;
+        case 'bigint':
+            return HEAP_NUMBER_BYTES + FIELD_BYTES;
+        case 'object':
+            break;
+        default:
+            // Booleans, undefined, symbols and functions are shared
+            return 0;
+    }
+    if (value === null || seen.has(value)) {
+        return 0;
+    }
+    seen.add(value);
+
+    if (ArrayBuffer.isView(value)) {
+        return OBJECT_HEADER_BYTES + value.byteLength;
+    }
+    if (value instanceof Date) {
+        return OBJECT_HEADER_BYTES + FIELD_BYTES;
+    }
+    let bytes = OBJECT_HEADER_BYTES;
+    if (Array.isArray(value)) {
+        bytes += value.length * FIELD_BYTES;
+        for (const item of value) {
+            bytes += estimateRetainedBytes(item, seen);
+        }
+    } else if (value instanceof Map) {
+        // Hash table slots: key, value and chain link per entry
+        bytes += value.size * 3 * FIELD_BYTES;
+        for (const [key, item] of value) {
+            bytes += estimateRetainedBytes(key, seen) + estimateRetainedBytes(item, seen);
+        }
+    } else if (value instanceof Set) {
+        bytes += value.size * 2 * FIELD_BYTES;
+        for (const item of value) {
+            bytes += estimateRetainedBytes(item, seen);
+        }
+    } else {
+        // Property names are interned and shared between objects of the same shape
+        for (const item of Object.values(value)) {
+            bytes += FIELD_BYTES + estimateRetainedBytes(item, seen);
+        }
+    }
+    return bytes;
+}
+
+/**
+ * Estimate the bytes held by `count` similar records by measuring an evenly spaced
+ * sample of at most `sampleSize` of them
+ */
+export function estimateCollectionBytes<T>(records: Iterable<T>, count: number, sampleSize = 64): number {
+    if (count === 0) {
+        return 0;
+    }
+    const stride = Math.max(1, Math.floor(count / sampleSize));
+    let sampled = 0;
+    let sampledBytes = 0;
+    let index = 0;
+    for (const record of records) {
+        if (index++ % stride === 0) {
+            sampledBytes += estimateRetainedBytes(record);
+            if (++sampled === sampleSize) {
+                break;
+            }
+        }
+    }
+    return sampled === 0 ? 0 : Math.round(sampledBytes / sampled * count);
+}
+
+/**
+ * Estimate the bytes of a hash index from keys to atom IDs, sets of atom IDs or
+ * records owned elsewhere. Those values, and the keys when `sharedKeys` is set, are
+ * held by the records as well, so only the slots referring to them are counted.
+ */
+export function estimateIndexBytes(index: ReadonlyMap<string, unknown>, sharedKeys = false): number {
+    let bytes = OBJECT_HEADER_BYTES + index.size * 3 * FIELD_BYTES;
+    for (const [key, value] of index) {
+        if (!sharedKeys) {
+            bytes += estimateRetainedBytes(key);
+        }
+        if (value instanceof Set) {
+            bytes += OBJECT_HEADER_BYTES + value.size * 2 * FIELD_BYTES;
+        }
+    }
+    return bytes;
+}
+
+/**
+ * Estimate the bytes of `count` small objects held in arrays, each with `fields`
+ * fields of which `heapNumbers` hold non-integer numbers; their strings are shared
+ */
+export function estimateEntryBytes(count: number, fields: number, heapNumbers = 0): number {
+    return count * (FIELD_BYTES + OBJECT_HEADER_BYTES + fields * FIELD_BYTES + heapNumbers * HEAP_NUMBER_BYTES);
+}
@@ -14,9 +14,17 @@
 // SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
 // *****************************************************************************
 
+import { Event } from '@theia/core/lib/common/event';
 import {
     Atom,
     AtomPattern,
+    AtomUpdate,
+    AtomSpaceChangeBatch,
+    PatternMatch,
+    QueryPlanStats,
+    AtomSpaceExportChunk,
+    AtomSpaceTransferProgress,
+    MemoryBreakdown,
     ReasoningQuery,
     ReasoningResult,
     LearningData,
@@ -51,6 +59,14 @@ import { KnowledgeManagementService } from './knowledge-management-service';
 
 export const OPENCOG_SERVICE_PATH = '/services/opencog';
 
+/**
+ * Frontend side of an OpenCog connection, notified of the changes matching the
+ * subscriptions made over that connection
+ */
+export interface OpenCogClient {
+    onAtomSpaceChanges(batch: AtomSpaceChangeBatch): void;
+}
+
 /**
  * Core OpenCog service interface for Theia integration
  * Enhanced with knowledge management capabilities
@@ -64,6 +80,60 @@ export interface OpenCogService {
     removeAtom(atomId: string): Promise<boolean>;
     updateAtom(atomId: string, updates: Partial<Atom>): Promise<boolean>;
 
+    /**
+     * Batched variants of the single-atom operations. Each batch is applied as a
+     * whole in one call: if any change fails, the changes already made are rolled
+     * back and the error is rethrown. Results are in input order.
+     */
+    addAtoms(atoms: Atom[]): Promise<string[]>;
+    updateAtoms(updates: AtomUpdate[]): Promise<boolean[]>;
+    removeAtoms(atomIds: string[]): Promise<boolean[]>;
+
+    /**
+     * Links whose outgoing set contains the given atom
+     */
+    getIncoming(atomId: string): Promise<Atom[]>;
+
+    /**
+     * Atoms with the highest short-term importance, most important first
+     */
+    getAttentionalFocus(limit?: number): Promise<Atom[]>;
+
+    /**
+     * Find every grounding of the pattern's variable template, up to `limit`
+     */
+    matchPattern(pattern: AtomPattern, limit?: number): Promise<PatternMatch[]>;
+
+    /**
+     * Compile a pattern into a cached query plan and return a handle for repeated execution
+     */
+    prepareQuery(pattern: AtomPattern): Promise<string>;
+
+    /**
+     * Run a query prepared with `prepareQuery`
+     */
+    executePreparedQuery(handle: string): Promise<Atom[]>;
+
+    /**
+     * Drop a prepared query handle
+     */
+    releasePreparedQuery(handle: string): Promise<boolean>;
+
+    /**
+     * Hit counts and latency of cached query plans, most expensive first
+     */
+    getQueryPlanStats(): Promise<QueryPlanStats[]>;
+
+    /**
+     * AtomSpace change feed. Each subscription receives batches of the changes to
+     * atoms matching its pattern's type, name and value thresholds, in sequence order.
+     * Over RPC, batches go only to the `OpenCogClient` of the connection that
+     * subscribed, and its subscriptions end when it disconnects.
+     */
+    readonly onAtomSpaceChanges: Event<AtomSpaceChangeBatch>;
+    subscribeAtomSpaceChanges(pattern?: AtomPattern): Promise<string>;
+    unsubscribeAtomSpaceChanges(subscriptionId: string): Promise<boolean>;
+
     /**
      * Reasoning operations
      */
@@ -103,15 +173,22 @@ export interface OpenCogService {
     getPersonalization(userId: string): Promise<Record<string, any>>;
     
     /**
-     * Learning analytics
+     * Learning analytics. `totalLearningRecords` counts every record ever learned;
+     * `retainedLearningRecords` those still kept in the bounded history.
      */
     getLearningStats(): Promise<{
         totalLearningRecords: number;
+        retainedLearningRecords: number;
         modelAccuracy: Record<string, number>;
         userAdaptations: number;
         behaviorPatterns: number;
     }>;
 
+    /**
+     * Estimated heap usage of the AtomSpace and the learning stores
+     */
+    getMemoryBreakdown(): Promise<MemoryBreakdown>;
+
     /**
      * Pattern recognition
      */
@@ -125,6 +202,20 @@ export interface OpenCogService {
     exportAtomSpace(): Promise<string>;
     importAtomSpace(data: string): Promise<void>;
 
+    /**
+     * Chunked NDJSON export: open a transfer, then read chunks until `done`
+     */
+    beginAtomSpaceExport(chunkSize?: number): Promise<string>;
+    readAtomSpaceExportChunk(exportId: string): Promise<AtomSpaceExportChunk>;
+
+    /**
+     * Chunked NDJSON import replacing the AtomSpace: open a transfer, write chunks, then finish
+     */
+    beginAtomSpaceImport(): Promise<string>;
+    writeAtomSpaceImportChunk(importId: string, data: string): Promise<AtomSpaceTransferProgress>;
+    finishAtomSpaceImport(importId: string): Promise<number>;
+    cancelAtomSpaceTransfer(transferId: string): Promise<boolean>;
+
     /**
      * Knowledge Management Service integration
      */
@@ -46,7 +46,12 @@ export interface AttentionValue {
 }
 
 /**
- * Pattern for querying atoms in the AtomSpace
+ * Pattern for querying atoms in the AtomSpace.
+ *
+ * `pattern` is a hypergraph template: a term `{ type?, name?, outgoing?, variable? }`
+ * or `{ clauses: [...] }`, where outgoing entries are nested terms, atom IDs or
+ * `$`-prefixed variables. `bindVariables` restricts variables to a type or to
+ * `{ type?, name?, id? }`.
  */
 export interface AtomPattern {
     type?: string;
@@ -57,6 +62,101 @@ export interface AtomPattern {
     bindVariables?: Record<string, any>;
 }
 
+/**
+ * Changes to apply to one atom in a batched update
+ */
+export interface AtomUpdate {
+    atomId: string;
+    updates: Partial<Atom>;
+}
+
+/**
+ * One grounding of a pattern: the atom bound to each variable and the atom
+ * grounding each clause, in clause order
+ */
+export interface PatternMatch {
+    bindings: Record<string, Atom>;
+    groundings: Atom[];
+}
+
+export type AtomSpaceChangeKind = 'added' | 'updated' | 'removed' | 'cleared';
+
+/**
+ * One AtomSpace mutation. `atom` is the atom after the change, or as it was when
+ * removed; its outgoing set holds `{ id, type }` references. `cleared` has no atom.
+ */
+export interface AtomSpaceChange {
+    sequence: number;
+    kind: AtomSpaceChangeKind;
+    atom?: Atom;
+}
+
+/**
+ * Changes delivered to one subscription, in sequence order
+ */
+export interface AtomSpaceChangeBatch {
+    subscriptionId: string;
+    changes: AtomSpaceChange[];
+}
+
+/**
+ * Entries held by one in-memory store and their estimated heap footprint
+ */
+export interface StoreMemoryUsage {
+    entries: number;
+    bytes: number;
+}
+
+/**
+ * Estimated heap usage per backend store, to tell which one is growing
+ */
+export interface MemoryBreakdown {
+    atomSpace: StoreMemoryUsage;
+    /** Type, name, value and incoming indexes and the content interner of the AtomSpace */
+    atomSpaceIndexes: StoreMemoryUsage;
+    /** Previous atom versions kept for open read views */
+    atomSpaceViews: StoreMemoryUsage;
+    /** Cached and prepared query plans */
+    queryCache: StoreMemoryUsage;
+    learningHistory: StoreMemoryUsage;
+    userBehaviorPatterns: StoreMemoryUsage;
+    learningModels: StoreMemoryUsage;
+    advancedLearningModels: StoreMemoryUsage;
+    /** Sum of the store estimates */
+    accountedBytes: number;
+    heapUsed: number;
+    heapTotal: number;
+}
+
+/**
+ * Progress of a streamed AtomSpace export or import
+ */
+export interface AtomSpaceTransferProgress {
+    processed: number;
+    total?: number;
+}
+
+/**
+ * One NDJSON chunk of a chunked AtomSpace export
+ */
+export interface AtomSpaceExportChunk extends AtomSpaceTransferProgress {
+    data: string;
+    done: boolean;
+}
+
+/**
+ * Usage statistics of one cached AtomSpace query plan
+ */
+export interface QueryPlanStats {
+    shape: string;
+    accessPath: string;
+    hits: number;
+    executions: number;
+    totalLatencyMs: number;
+    averageLatencyMs: number;
+    maxLatencyMs: number;
+}
+
 /**
  * Reasoning query structure
  */
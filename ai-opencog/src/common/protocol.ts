@@ -22,6 +22,7 @@ export interface RpcServer<T> {
 import {
     Atom,
     AtomPattern,
+    AtomUpdate,
     ReasoningQuery,
     ReasoningResult,
     LearningData,
@@ -46,12 +47,25 @@ export interface OpenCogProtocol {
     'opencog/query-atoms': { pattern: AtomPattern };
     'opencog/remove-atom': { atomId: string };
     'opencog/update-atom': { atomId: string; updates: Partial<Atom> };
+    'opencog/add-atoms': { atoms: Atom[] };
+    'opencog/update-atoms': { updates: AtomUpdate[] };
+    'opencog/remove-atoms': { atomIds: string[] };
+    'opencog/get-incoming': { atomId: string };
+    'opencog/get-attentional-focus': { limit?: number };
+    'opencog/match-pattern': { pattern: AtomPattern; limit?: number };
+    'opencog/prepare-query': { pattern: AtomPattern };
+    'opencog/execute-prepared-query': { handle: string };
+    'opencog/release-prepared-query': { handle: string };
+    'opencog/get-query-plan-stats': {};
+    'opencog/subscribe-atomspace-changes': { pattern?: AtomPattern };
+    'opencog/unsubscribe-atomspace-changes': { subscriptionId: string };
 
     // Reasoning operations
     'opencog/reason': { query: ReasoningQuery };
 
     // Learning operations
     'opencog/learn': { data: LearningData };
+    'opencog/get-memory-breakdown': {};
 
     // Pattern recognition
     'opencog/recognize-patterns': { input: PatternInput };
@@ -61,6 +75,12 @@ export interface OpenCogProtocol {
     'opencog/clear-atomspace': {};
     'opencog/export-atomspace': {};
     'opencog/import-atomspace': { data: string };
+    'opencog/begin-atomspace-export': { chunkSize?: number };
+    'opencog/read-atomspace-export-chunk': { exportId: string };
+    'opencog/begin-atomspace-import': {};
+    'opencog/write-atomspace-import-chunk': { importId: string; data: string };
+    'opencog/finish-atomspace-import': { importId: string };
+    'opencog/cancel-atomspace-transfer': { transferId: string };
 
     // Distributed reasoning operations
     'distributed-reasoning/submit-task': { query: ReasoningQuery; constraints?: any };
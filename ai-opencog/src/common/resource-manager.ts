@@ -48,6 +48,11 @@ export interface ResourceThresholds {
     cpuCritical: number;
 }
 
+/**
+ * Frees AtomSpace memory for real, reporting what was removed
+ */
+export type AtomSpaceMemoryReclaimer = () => Promise<{ atomsRemoved: number; memoryFreed: number }>;
+
 /**
  * Resource management service for optimizing cognitive system performance
  */
@@ -60,6 +65,7 @@ export class ResourceManager {
     private monitoringInterval?: NodeJS.Timeout;
     private lastCleanup = Date.now();
     private readonly cleanupInterval = 300000; // 5 minutes
+    private atomSpaceReclaimer?: AtomSpaceMemoryReclaimer;
 
     constructor() {
         this.thresholds = {
@@ -75,6 +81,13 @@ export class ResourceManager {
         this.startMonitoring();
     }
 
+    /**
+     * Connect the AtomSpace whose memory `optimizeAtomSpaceMemory` reclaims
+     */
+    setAtomSpaceMemoryReclaimer(reclaimer: AtomSpaceMemoryReclaimer): void {
+        this.atomSpaceReclaimer = reclaimer;
+    }
+
     /**
      * Optimize AtomSpace memory usage
      */
@@ -88,12 +101,14 @@ export class ResourceManager {
         let atomsRemoved = 0;
         let memoryFreed = 0;
 
-        // Implementation would connect to actual AtomSpace service
-        // For now, simulate optimization
-        const optimization = this.calculateMemoryOptimization();
-        
-        atomsRemoved = optimization.atomsToRemove;
-        memoryFreed = optimization.memoryToFree;
+        if (this.atomSpaceReclaimer) {
+            ({ atomsRemoved, memoryFreed } = await this.atomSpaceReclaimer());
+        } else {
+            // No AtomSpace connected, estimate the optimization
+            const optimization = this.calculateMemoryOptimization();
+            atomsRemoved = optimization.atomsToRemove;
+            memoryFreed = optimization.memoryToFree;
+        }
         
         this.metrics.memoryUsage.atomSpace -= memoryFreed;
         this.metrics.memoryUsage.total -= memoryFreed;
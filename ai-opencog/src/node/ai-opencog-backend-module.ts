@@ -14,7 +14,8 @@
 // SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
 // *****************************************************************************
 
-import { ContainerModule } from 'inversify';
+import { ContainerModule, interfaces } from 'inversify';
+import { BackendApplicationContribution } from '@theia/core/lib/node/backend-application';
 import { ConnectionHandler, RpcConnectionHandler } from '@theia/core/lib/common/messaging';
 import { 
     OPENCOG_SERVICE_PATH,
@@ -42,8 +43,13 @@ import {
     ProductionOptimizationServiceSymbol
 } from '../common/service-symbols';
 import { AdvancedLearningService, ADVANCED_LEARNING_SERVICE_PATH } from '../common/advanced-learning-service';
-import { AtomSpaceService } from './atomspace-service';
+import { AtomSpaceService, AtomSpaceEngines, AtomSpaceProvider } from './atomspace-service';
+import { AtomSpaceConnection, AtomSpaceConnectionClient } from './atomspace-connection';
+import { StartupProfiler } from './startup-profiler';
+import { AtomSpacePersistenceContribution } from './atomspace-persistence-contribution';
+import { AtomSpaceAttentionContribution } from './atomspace-attention-contribution';
 import { KnowledgeManagementServiceImpl } from './knowledge-management-service-impl';
+import { MultiModalProcessingService } from './multi-modal-processing-service';
 // Phase 2 backend components
 import { CodeAnalysisAgent } from './code-analysis-agent';
 // Phase 3 reasoning engines
@@ -62,8 +68,31 @@ import { DistributedReasoningServiceImpl } from './distributed-reasoning-service
 // Phase 5 production optimization
 import { ProductionOptimizationServiceImpl } from './production-optimization-service-impl';
 
+/**
+ * Serve a service over RPC. The service is constructed when a client first connects
+ * to its path, and its construction is recorded by the startup profiler.
+ */
+function bindRpcService(bind: interfaces.Bind, path: string, serviceId: interfaces.ServiceIdentifier<object>): void {
+    bind(ConnectionHandler).toDynamicValue(ctx =>
+        new RpcConnectionHandler(path, () =>
+            ctx.container.get(StartupProfiler).activate(path, () => ctx.container.get(serviceId))
+        )
+    ).inSingletonScope();
+}
+
 export default new ContainerModule(bind => {
+    bind(StartupProfiler).toSelf().inSingletonScope();
+    bind(BackendApplicationContribution).toService(StartupProfiler);
+
     bind(OpenCogServiceSymbol).to(AtomSpaceService).inSingletonScope();
+    // Contributions reach the AtomSpace through a provider, so it is not built at boot unless needed
+    bind(AtomSpaceProvider).toDynamicValue(ctx => () =>
+        ctx.container.get(StartupProfiler).activate(OPENCOG_SERVICE_PATH, () => ctx.container.get<AtomSpaceService>(OpenCogServiceSymbol))
+    ).inSingletonScope();
+    bind(AtomSpacePersistenceContribution).toSelf().inSingletonScope();
+    bind(BackendApplicationContribution).toService(AtomSpacePersistenceContribution);
+    bind(AtomSpaceAttentionContribution).toSelf().inSingletonScope();
+    bind(BackendApplicationContribution).toService(AtomSpaceAttentionContribution);
     bind(KnowledgeManagementServiceSymbol).to(KnowledgeManagementServiceImpl).inSingletonScope();
     
     // Phase 2: Bind node-based code analysis agent
@@ -74,9 +103,18 @@ export default new ContainerModule(bind => {
     bind(PLNReasoningEngine).toSelf().inSingletonScope();
     bind(PatternMatchingEngine).toSelf().inSingletonScope();
     bind(CodeAnalysisReasoningEngine).toSelf().inSingletonScope();
+    bind(MultiModalProcessingService).toSelf().inSingletonScope();
+    // The AtomSpace resolves the engines on first use rather than at activation
+    bind(AtomSpaceEngines).toDynamicValue(ctx => ({
+        pln: () => ctx.container.get(PLNReasoningEngine),
+        patternMatching: () => ctx.container.get(PatternMatchingEngine),
+        codeAnalysis: () => ctx.container.get(CodeAnalysisReasoningEngine),
+        multiModal: () => ctx.container.get(MultiModalProcessingService)
+    })).inSingletonScope();
     
     // Phase 3: Bind reasoning services
-    bind(DeductiveReasoningServiceSymbol).to(DeductiveReasoningServiceImpl).inSingletonScope();
+    // Not a singleton: each connection gets its own rule networks, released when it disconnects
+    bind(DeductiveReasoningServiceSymbol).to(DeductiveReasoningServiceImpl);
     bind(InductiveReasoningServiceSymbol).to(InductiveReasoningServiceImpl).inSingletonScope();
     bind(AbductiveReasoningServiceSymbol).to(AbductiveReasoningServiceImpl).inSingletonScope();
     
@@ -94,74 +132,35 @@ export default new ContainerModule(bind => {
     // Phase 5: Bind production optimization service
     bind(ProductionOptimizationServiceSymbol).to(ProductionOptimizationServiceImpl).inSingletonScope();
     
+    // Each connection gets its own change subscriptions, dropped when it disconnects
     bind(ConnectionHandler).toDynamicValue(ctx =>
-        new RpcConnectionHandler(OPENCOG_SERVICE_PATH, () =>
-            ctx.container.get(OpenCogServiceSymbol)
+        new RpcConnectionHandler<AtomSpaceConnectionClient>(OPENCOG_SERVICE_PATH, client =>
+            AtomSpaceConnection.serve(ctx.container.get<AtomSpaceProvider>(AtomSpaceProvider)(), client)
         )
     ).inSingletonScope();
 
-    bind(ConnectionHandler).toDynamicValue(ctx =>
-        new RpcConnectionHandler(KNOWLEDGE_MANAGEMENT_SERVICE_PATH, () =>
-            ctx.container.get(KnowledgeManagementServiceSymbol)
-        )
-    ).inSingletonScope();
+    bindRpcService(bind, KNOWLEDGE_MANAGEMENT_SERVICE_PATH, KnowledgeManagementServiceSymbol);
     
     // Phase 3: Bind reasoning service connection handlers
-    bind(ConnectionHandler).toDynamicValue(ctx =>
-        new RpcConnectionHandler(DEDUCTIVE_REASONING_SERVICE_PATH, () =>
-            ctx.container.get(DeductiveReasoningServiceSymbol)
-        )
-    ).inSingletonScope();
+    bindRpcService(bind, DEDUCTIVE_REASONING_SERVICE_PATH, DeductiveReasoningServiceSymbol);
     
-    bind(ConnectionHandler).toDynamicValue(ctx =>
-        new RpcConnectionHandler(INDUCTIVE_REASONING_SERVICE_PATH, () =>
-            ctx.container.get(InductiveReasoningServiceSymbol)
-        )
-    ).inSingletonScope();
+    bindRpcService(bind, INDUCTIVE_REASONING_SERVICE_PATH, InductiveReasoningServiceSymbol);
     
-    bind(ConnectionHandler).toDynamicValue(ctx =>
-        new RpcConnectionHandler(ABDUCTIVE_REASONING_SERVICE_PATH, () =>
-            ctx.container.get(AbductiveReasoningServiceSymbol)
-        )
-    ).inSingletonScope();
+    bindRpcService(bind, ABDUCTIVE_REASONING_SERVICE_PATH, AbductiveReasoningServiceSymbol);
     
     // Phase 3: Bind learning service connection handlers
-    bind(ConnectionHandler).toDynamicValue(ctx =>
-        new RpcConnectionHandler(SUPERVISED_LEARNING_SERVICE_PATH, () =>
-            ctx.container.get(SupervisedLearningServiceSymbol)
-        )
-    ).inSingletonScope();
+    bindRpcService(bind, SUPERVISED_LEARNING_SERVICE_PATH, SupervisedLearningServiceSymbol);
     
-    bind(ConnectionHandler).toDynamicValue(ctx =>
-        new RpcConnectionHandler(UNSUPERVISED_LEARNING_SERVICE_PATH, () =>
-            ctx.container.get(UnsupervisedLearningServiceSymbol)
-        )
-    ).inSingletonScope();
+    bindRpcService(bind, UNSUPERVISED_LEARNING_SERVICE_PATH, UnsupervisedLearningServiceSymbol);
     
-    bind(ConnectionHandler).toDynamicValue(ctx =>
-        new RpcConnectionHandler(REINFORCEMENT_LEARNING_SERVICE_PATH, () =>
-            ctx.container.get(ReinforcementLearningServiceSymbol)
-        )
-    ).inSingletonScope();
+    bindRpcService(bind, REINFORCEMENT_LEARNING_SERVICE_PATH, ReinforcementLearningServiceSymbol);
     
     // Phase 5: Bind advanced learning service connection handler
-    bind(ConnectionHandler).toDynamicValue(ctx =>
-        new RpcConnectionHandler(ADVANCED_LEARNING_SERVICE_PATH, () =>
-            ctx.container.get(AdvancedLearningServiceSymbol)
-        )
-    ).inSingletonScope();
+    bindRpcService(bind, ADVANCED_LEARNING_SERVICE_PATH, AdvancedLearningServiceSymbol);
     
     // Phase 5: Bind distributed reasoning service connection handler
-    bind(ConnectionHandler).toDynamicValue(ctx =>
-        new RpcConnectionHandler(DISTRIBUTED_REASONING_SERVICE_PATH, () =>
-            ctx.container.get(DistributedReasoningServiceSymbol)
-        )
-    ).inSingletonScope();
+    bindRpcService(bind, DISTRIBUTED_REASONING_SERVICE_PATH, DistributedReasoningServiceSymbol);
     
     // Phase 5: Bind production optimization service connection handler
-    bind(ConnectionHandler).toDynamicValue(ctx =>
-        new RpcConnectionHandler(PRODUCTION_OPTIMIZATION_SERVICE_PATH, () =>
-            ctx.container.get(ProductionOptimizationServiceSymbol)
-        )
-    ).inSingletonScope();
+    bindRpcService(bind, PRODUCTION_OPTIMIZATION_SERVICE_PATH, ProductionOptimizationServiceSymbol);
 });
\ No newline at end of file
@@ -0,0 +1,55 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { injectable, inject } from '@theia/core/shared/inversify';
+import { BackendApplicationContribution } from '@theia/core/lib/node/backend-application';
+import { AtomSpaceProvider } from './atomspace-service';
+
+/**
+ * Atom count above which attention allocation forgets atoms, from `AI_OPENCOG_ATOM_BUDGET`
+ */
+export function configuredAtomBudget(): number | undefined {
+    const budget = Number(process.env.AI_OPENCOG_ATOM_BUDGET);
+    return budget > 0 ? budget : undefined;
+}
+
+/**
+ * Runs background attention allocation when `AI_OPENCOG_ATTENTION_ALLOCATION` is
+ * `true`, forgetting atoms beyond `AI_OPENCOG_ATOM_BUDGET` when that is set
+ */
+@injectable()
+export class AtomSpaceAttentionContribution implements BackendApplicationContribution {
+
+    @inject(AtomSpaceProvider)
+    protected readonly atomSpace: AtomSpaceProvider;
+
+    onStart(): void {
+        if (!this.enabled) {
+            return;
+        }
+        this.atomSpace().startAttentionAllocation({ maxAtoms: configuredAtomBudget() });
+    }
+
+    onStop(): void {
+        if (this.enabled) {
+            this.atomSpace().stopAttentionAllocation();
+        }
+    }
+
+    private get enabled(): boolean {
+        return process.env.AI_OPENCOG_ATTENTION_ALLOCATION === 'true';
+    }
+}
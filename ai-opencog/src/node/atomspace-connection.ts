@@ -0,0 +1,143 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { Disposable } from '@theia/core/lib/common/disposable';
+import { Event } from '@theia/core/lib/common/event';
+import { AtomPattern, AtomSpaceExportChunk } from '../common/opencog-types';
+import { OpenCogClient, OpenCogService } from '../common/opencog-service';
+import { AtomSpaceService } from './atomspace-service';
+
+/**
+ * Client end of one RPC connection, as handed to the connection handler
+ */
+export interface AtomSpaceConnectionClient extends OpenCogClient {
+    readonly onDidCloseConnection: Event<void>;
+}
+
+/**
+ * Calls answered by the connection rather than passed straight to the AtomSpace
+ */
+const CONNECTION_METHODS = new Set<PropertyKey>([
+    'subscribeAtomSpaceChanges', 'unsubscribeAtomSpaceChanges',
+    'beginAtomSpaceExport', 'readAtomSpaceExportChunk', 'beginAtomSpaceImport', 'finishAtomSpaceImport', 'cancelAtomSpaceTransfer'
+]);
+
+/**
+ * One RPC connection to the shared AtomSpace. Change subscriptions made through it
+ * are delivered only to its client and dropped when the client disconnects; a
+ * connection cannot end another connection's subscriptions. Transfers it leaves
+ * unfinished are cancelled when the client disconnects, so an abandoned export does
+ * not keep its read view open.
+ */
+export class AtomSpaceConnection implements Disposable {
+
+    private readonly subscriptions = new Set<string>();
+    private readonly transfers = new Set<string>();
+    private readonly toDispose: Disposable[] = [];
+
+    constructor(
+        private readonly atomSpace: AtomSpaceService,
+        private readonly client: AtomSpaceConnectionClient
+    ) {
+        this.toDispose.push(
+            atomSpace.onAtomSpaceChanges(batch => {
+                if (this.subscriptions.has(batch.subscriptionId)) {
+                    this.client.onAtomSpaceChanges(batch);
+                }
+            }),
+            client.onDidCloseConnection(() => this.dispose())
+        );
+    }
+
+    /**
+     * RPC target for a connection: its own change subscriptions, with every other
+     * call going to the shared AtomSpace
+     */
+    static serve(atomSpace: AtomSpaceService, client: AtomSpaceConnectionClient): OpenCogService {
+        const connection = new AtomSpaceConnection(atomSpace, client);
+        return new Proxy(atomSpace, {
+            get: (target, property) => {
+                if (CONNECTION_METHODS.has(property)) {
+                    return (connection as any)[property].bind(connection);
+                }
+                const value = Reflect.get(target, property);
+                return typeof value === 'function' ? value.bind(target) : value;
+            }
+        });
+    }
+
+    async subscribeAtomSpaceChanges(pattern?: AtomPattern): Promise<string> {
+        const subscriptionId = await this.atomSpace.subscribeAtomSpaceChanges(pattern);
+        this.subscriptions.add(subscriptionId);
+        return subscriptionId;
+    }
+
+    async unsubscribeAtomSpaceChanges(subscriptionId: string): Promise<boolean> {
+        if (!this.subscriptions.delete(subscriptionId)) {
+            return false;
+        }
+        return this.atomSpace.unsubscribeAtomSpaceChanges(subscriptionId);
+    }
+
+    async beginAtomSpaceExport(chunkSize?: number): Promise<string> {
+        const exportId = await this.atomSpace.beginAtomSpaceExport(chunkSize);
+        this.transfers.add(exportId);
+        return exportId;
+    }
+
+    async readAtomSpaceExportChunk(exportId: string): Promise<AtomSpaceExportChunk> {
+        try {
+            const chunk = await this.atomSpace.readAtomSpaceExportChunk(exportId);
+            if (chunk.done) {
+                this.transfers.delete(exportId);
+            }
+            return chunk;
+        } catch (error) {
+            this.transfers.delete(exportId);
+            throw error;
+        }
+    }
+
+    async beginAtomSpaceImport(): Promise<string> {
+        const importId = await this.atomSpace.beginAtomSpaceImport();
+        this.transfers.add(importId);
+        return importId;
+    }
+
+    async finishAtomSpaceImport(importId: string): Promise<number> {
+        this.transfers.delete(importId);
+        return this.atomSpace.finishAtomSpaceImport(importId);
+    }
+
+    async cancelAtomSpaceTransfer(transferId: string): Promise<boolean> {
+        this.transfers.delete(transferId);
+        return this.atomSpace.cancelAtomSpaceTransfer(transferId);
+    }
+
+    dispose(): void {
+        for (const subscriptionId of this.subscriptions) {
+            this.atomSpace.unsubscribeAtomSpaceChanges(subscriptionId);
+        }
+        this.subscriptions.clear();
+        for (const transferId of this.transfers) {
+            this.atomSpace.cancelAtomSpaceTransfer(transferId);
+        }
+        this.transfers.clear();
+        for (const disposable of this.toDispose.splice(0)) {
+            disposable.dispose();
+        }
+    }
+}
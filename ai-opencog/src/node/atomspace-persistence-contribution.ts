@@ -0,0 +1,50 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { injectable, inject } from '@theia/core/shared/inversify';
+import { BackendApplicationContribution } from '@theia/core/lib/node/backend-application';
+import { AtomSpaceProvider } from './atomspace-service';
+
+/**
+ * Recovers the AtomSpace from its write-ahead log before the backend accepts
+ * connections, when `AI_OPENCOG_WAL_DIR` names a log directory
+ */
+@injectable()
+export class AtomSpacePersistenceContribution implements BackendApplicationContribution {
+
+    @inject(AtomSpaceProvider)
+    protected readonly atomSpace: AtomSpaceProvider;
+
+    async initialize(): Promise<void> {
+        const directory = process.env.AI_OPENCOG_WAL_DIR;
+        if (directory) {
+            const recovered = await this.atomSpace().enablePersistence(directory);
+            console.log(`AtomSpace recovered ${recovered} atoms from ${directory}`);
+        }
+    }
+
+    onStop(): void {
+        if (!process.env.AI_OPENCOG_WAL_DIR) {
+            return;
+        }
+        // The process may exit as soon as this returns, so the last group-commit window is written synchronously
+        try {
+            this.atomSpace().disablePersistenceSync();
+        } catch (error) {
+            console.error('Failed to close the AtomSpace log:', error);
+        }
+    }
+}
@@ -14,11 +14,23 @@
 // SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
 // *****************************************************************************
 
-import { injectable, inject } from '@theia/core/shared/inversify';
+import { injectable, inject, optional } from '@theia/core/shared/inversify';
+import { Event, Emitter } from '@theia/core/lib/common/event';
 import * as crypto from 'crypto';
+import { promises as fs } from 'fs';
 import {
     Atom,
     AtomPattern,
+    AtomUpdate,
+    AtomSpaceChangeBatch,
+    PatternMatch,
+    QueryPlanStats,
+    AtomSpaceExportChunk,
+    AtomSpaceTransferProgress,
+    MemoryBreakdown,
+    StoreMemoryUsage,
+    estimateCollectionBytes,
+    estimateRetainedBytes,
     ReasoningQuery,
     ReasoningResult,
     LearningData,
@@ -53,8 +65,61 @@ import {
 import { OpenCogService } from '../common/opencog-service';
 import { KnowledgeManagementServiceImpl } from './knowledge-management-service-impl';
 import { MultiModalProcessingService } from './multi-modal-processing-service';
+import { LearningHistory, LearningUserSummary } from './learning-history';
 
-import { PLNReasoningEngine, PatternMatchingEngine, CodeAnalysisReasoningEngine } from './reasoning-engines';
+import {
+    PLNReasoningEngine, PatternMatchingEngine, CodeAnalysisReasoningEngine, PLNForwardChainer, ForwardChainerOptions,
+    ForwardChainerMetrics, ForwardChainResult
+} from './reasoning-engines';
+import {
+    AtomIndex, AtomValueIndex, AtomRecord, AtomInterner, IncomingIndex, AtomStore, ColumnarAtomStore, createAtomStore, PatternMatcher,
+    CompiledPattern, QueryPlan, QueryPlanCache, recordFields, isContentAtomId, AtomStreamImporter, AtomStreamOptions,
+    NdjsonLineBuffer, DEFAULT_STREAM_BATCH_SIZE, encodeAtomRecords, readNdjsonLines, yieldToEventLoop,
+    AtomSnapshotReader, encodeAtomSnapshot, AtomWriteAheadLog, WalEntry, WriteAheadLogOptions, AtomChangeFeed,
+    AtomSpaceView, AtomStoreKind, AttentionAllocator, AttentionAllocationOptions, AttentionBank, AttentionCycleStats
+} from './atomspace';
+
+/**
+ * Chunked export or import driven over RPC
+ */
+interface AtomSpaceTransfer {
+    lastAccess: number;
+    processed: number;
+    total?: number;
+    /** Read view an export is taken from, held until the export ends */
+    view?: AtomSpaceView;
+    chunks?: AsyncIterableIterator<string>;
+    importer?: AtomStreamImporter;
+    lines?: NdjsonLineBuffer;
+}
+
+/**
+ * Engines the AtomSpace delegates reasoning and multi-modal processing to. Each
+ * accessor is called once, on first use of the engine.
+ */
+export const AtomSpaceEngines = Symbol('AtomSpaceEngines');
+export interface AtomSpaceEngines {
+    pln(): PLNReasoningEngine;
+    patternMatching(): PatternMatchingEngine;
+    codeAnalysis(): CodeAnalysisReasoningEngine;
+    multiModal(): MultiModalProcessingService;
+}
+
+/**
+ * Engines for an AtomSpace constructed outside a container
+ */
+const STANDALONE_ENGINES: AtomSpaceEngines = {
+    pln: () => new PLNReasoningEngine(),
+    patternMatching: () => new PatternMatchingEngine(),
+    codeAnalysis: () => new CodeAnalysisReasoningEngine(),
+    multiModal: () => new MultiModalProcessingService()
+};
+
+/**
+ * Resolves the AtomSpace singleton on demand, for components that only need it in some configurations
+ */
+export const AtomSpaceProvider = Symbol('AtomSpaceProvider');
+export type AtomSpaceProvider = () => AtomSpaceService;
 
 /**
  * AtomSpace implementation for storing and managing OpenCog atoms
@@ -62,7 +127,64 @@ import { PLNReasoningEngine, PatternMatchingEngine, CodeAnalysisReasoningEngine
  */
 @injectable()
 export class AtomSpaceService implements OpenCogService {
-    private atoms: Map<string, Atom> = new Map();
+    private readonly atomStoreKind: AtomStoreKind = process.env.AI_OPENCOG_ATOM_STORE === 'columnar' ? 'columnar' : 'map';
+    private atoms: AtomStore = createAtomStore(this.atomStoreKind);
+    private atomIndex = new AtomIndex();
+    private valueIndex = new AtomValueIndex();
+    private incomingIndex = new IncomingIndex();
+    private interner = new AtomInterner();
+    private queryPlans = new QueryPlanCache();
+    private preparedQueries = new Map<string, { plan: QueryPlan; pattern: AtomPattern }>();
+    private nextQueryId = 1;
+    private transfers = new Map<string, AtomSpaceTransfer>();
+    private nextTransferId = 1;
+    private transferExpiryTimer: ReturnType<typeof setTimeout> | undefined;
+    private wal: AtomWriteAheadLog | undefined;
+    private readonly onAtomSpaceChangesEmitter = new Emitter<AtomSpaceChangeBatch>();
+    readonly onAtomSpaceChanges: Event<AtomSpaceChangeBatch> = this.onAtomSpaceChangesEmitter.event;
+    private changeFeed = new AtomChangeFeed(
+        batch => this.onAtomSpaceChangesEmitter.fire(batch),
+        record => this.toChangeAtom(record)
+    );
+    /** Open read views, each keeping the previous version of atoms changed after it was taken */
+    private views = new Set<AtomSpaceView>();
+    /** State of each atom before the running batch first touched it */
+    private batchJournal: Map<string, AtomRecord | undefined> | undefined;
+
+    private static readonly TRANSFER_TIMEOUT_MS = 10 * 60 * 1000;
+    private static readonly TRANSFER_EXPIRY_CHECK_MS = 60 * 1000;
+    /** Training records kept per learning model */
+    private static readonly MAX_TRAINING_DATA = 1000;
+    private patternMatcher = new PatternMatcher({
+        size: () => this.atoms.size,
+        get: atomId => this.atoms.get(atomId),
+        select: (type, name) => this.atomIndex.select({ type, name }),
+        incoming: atomId => this.incomingIndex.get(atomId),
+        values: () => this.atoms.values()
+    });
+    private attentionBank: AttentionBank = {
+        size: () => this.atoms.size,
+        keys: () => this.atoms.keys(),
+        get: atomId => this.atoms.get(atomId),
+        incoming: atomId => this.incomingIndex.get(atomId),
+        highestSti: limit => this.valueIndex.top('sti', limit),
+        lowestLti: limit => this.valueIndex.bottom('lti', limit),
+        setAttention: (atomId, attentionValue) => {
+            const existing = this.atoms.get(atomId);
+            if (existing) {
+                this.replaceAttention(existing, { ...existing, attentionValue });
+            }
+        },
+        forget: atomId => this.extractAtom(atomId),
+        endCycle: () => this.journalAttention()
+    };
+    /** Atoms whose attention changed since attention was last journaled */
+    private readonly attentionChanges = new Set<string>();
+    private attentionAllocator: AttentionAllocator | undefined;
+    private forwardChainer: PLNForwardChainer | undefined;
+    /** Atoms added or changed since the forward chainer last ran */
+    private readonly pendingInference = new Set<string>();
+    private storingInferences = false;
     private nextAtomId = 1;
     private knowledgeManagementService: KnowledgeManagementService;
     
@@ -71,62 +193,223 @@ export class AtomSpaceService implements OpenCogService {
     private adaptationStrategies: Map<string, AdaptationStrategy> = new Map();
     private userBehaviorPatterns: Map<string, UserBehaviorPattern[]> = new Map();
     private userPersonalization: Map<string, Record<string, any>> = new Map();
-    private learningHistory: LearningData[] = [];
+    private learningHistory = new LearningHistory();
     private nextModelId = 1;
     
     // Advanced learning models storage for SSR backend
     private advancedLearningModels: Map<string, AdvancedLearningModel> = new Map();
     
-    // Advanced reasoning engines
-    private plnEngine: PLNReasoningEngine;
-    private patternEngine: PatternMatchingEngine;
-    private codeAnalysisEngine: CodeAnalysisReasoningEngine;
+    // Advanced reasoning engines and multi-modal processing, created on first use
+    private readonly engines: AtomSpaceEngines;
+    private pln: PLNReasoningEngine | undefined;
+    private patternMatching: PatternMatchingEngine | undefined;
+    private codeAnalysis: CodeAnalysisReasoningEngine | undefined;
+    private multiModal: MultiModalProcessingService | undefined;
+
+    constructor(@inject(AtomSpaceEngines) @optional() engines?: AtomSpaceEngines) {
+        this.knowledgeManagementService = new KnowledgeManagementServiceImpl();
+        this.engines = engines ?? STANDALONE_ENGINES;
+    }
+
+    private get plnEngine(): PLNReasoningEngine {
+        return this.pln ??= this.engines.pln();
+    }
 
-    // Multi-modal processing service
-    private multiModalService: MultiModalProcessingService;
+    private get patternEngine(): PatternMatchingEngine {
+        return this.patternMatching ??= this.engines.patternMatching();
+    }
 
-    constructor() {
-        this.knowledgeManagementService = new KnowledgeManagementServiceImpl();
-        this.plnEngine = new PLNReasoningEngine();
-        this.patternEngine = new PatternMatchingEngine();
-        this.codeAnalysisEngine = new CodeAnalysisReasoningEngine();
-        this.multiModalService = new MultiModalProcessingService();
+    private get codeAnalysisEngine(): CodeAnalysisReasoningEngine {
+        return this.codeAnalysis ??= this.engines.codeAnalysis();
+    }
+
+    private get multiModalService(): MultiModalProcessingService {
+        return this.multiModal ??= this.engines.multiModal();
     }
 
     async addAtom(atom: Atom): Promise<string> {
-        const atomId = atom.id || this.generateAtomId();
-        const atomWithId = { ...atom, id: atomId };
-        this.atoms.set(atomId, atomWithId);
-        return atomId;
+        return this.insertAtom(atom);
     }
 
     async queryAtoms(pattern: AtomPattern): Promise<Atom[]> {
-        const results: Atom[] = [];
-        
-        for (const atom of this.atoms.values()) {
-            if (this.matchesPattern(atom, pattern)) {
-                results.push(atom);
-            }
-        }
-        
-        return results;
+        return this.executePlan(this.queryPlans.get(pattern), pattern);
     }
 
+    /**
+     * Remove an atom together with every link that (transitively) contains it,
+     * so no link is left pointing at a missing atom
+     */
     async removeAtom(atomId: string): Promise<boolean> {
-        return this.atoms.delete(atomId);
+        return this.deleteAtom(atomId);
     }
 
     async updateAtom(atomId: string, updates: Partial<Atom>): Promise<boolean> {
-        const existingAtom = this.atoms.get(atomId);
-        if (!existingAtom) {
+        return this.modifyAtom(atomId, updates);
+    }
+
+    async addAtoms(atoms: Atom[]): Promise<string[]> {
+        return this.applyBatch(() => atoms.map(atom => this.insertAtom(atom)));
+    }
+
+    async updateAtoms(updates: AtomUpdate[]): Promise<boolean[]> {
+        return this.applyBatch(() => updates.map(({ atomId, updates: changes }) => this.modifyAtom(atomId, changes)));
+    }
+
+    async removeAtoms(atomIds: string[]): Promise<boolean[]> {
+        return this.applyBatch(() => atomIds.map(atomId => this.deleteAtom(atomId)));
+    }
+
+    /**
+     * Run a batch of changes as a unit, restoring every touched atom if one of them fails
+     */
+    private applyBatch<T>(apply: () => T[]): T[] {
+        const journal = this.batchJournal = new Map();
+        try {
+            return apply();
+        } catch (error) {
+            this.batchJournal = undefined;
+            this.rollBack(journal);
+            throw error;
+        } finally {
+            this.batchJournal = undefined;
+        }
+    }
+
+    private rollBack(journal: Map<string, AtomRecord | undefined>): void {
+        for (const [atomId, previous] of journal) {
+            if (!previous) {
+                this.extractAtom(atomId);
+            }
+        }
+        // Restore children before the links that point to them
+        const restored = new Set<string>();
+        const restore = (atomId: string) => {
+            const previous = journal.get(atomId);
+            if (!previous || restored.has(atomId)) {
+                return;
+            }
+            restored.add(atomId);
+            for (const childId of previous.outgoing || []) {
+                restore(childId);
+            }
+            this.storeRecord(previous);
+        };
+        for (const atomId of journal.keys()) {
+            restore(atomId);
+        }
+    }
+
+    private recordPriorState(atomId: string, previous: AtomRecord | undefined): void {
+        if (this.batchJournal && !this.batchJournal.has(atomId)) {
+            this.batchJournal.set(atomId, previous);
+        }
+        if (this.views.size > 0) {
+            for (const view of this.views) {
+                view.preserve(atomId, previous);
+            }
+        }
+    }
+
+    private deleteAtom(atomId: string): boolean {
+        if (!this.atoms.has(atomId)) {
             return false;
         }
-        
-        const updatedAtom = { ...existingAtom, ...updates, id: atomId };
-        this.atoms.set(atomId, updatedAtom);
+        this.extractAtom(atomId);
         return true;
     }
 
+    private modifyAtom(atomId: string, updates: Partial<Atom>): boolean {
+        const existing = this.atoms.get(atomId);
+        if (!existing) {
+            return false;
+        }
+
+        const updated: AtomRecord = { ...existing, ...recordFields(updates), id: atomId };
+        if (updates.outgoing) {
+            updated.outgoing = updates.outgoing.map(child => this.internOutgoing(child));
+        }
+        this.replaceRecord(existing, updated);
+        return true;
+    }
+
+    async getIncoming(atomId: string): Promise<Atom[]> {
+        const links: Atom[] = [];
+        for (const linkId of this.incomingIndex.get(atomId)) {
+            const record = this.atoms.get(linkId);
+            if (record) {
+                links.push(this.toAtom(record));
+            }
+        }
+        return links;
+    }
+
+    async getAttentionalFocus(limit: number = 10): Promise<Atom[]> {
+        const focus: Atom[] = [];
+        for (const atomId of this.valueIndex.top('sti', limit)) {
+            const record = this.atoms.get(atomId);
+            if (record) {
+                focus.push(this.toAtom(record));
+            }
+        }
+        return focus;
+    }
+
+    async matchPattern(pattern: AtomPattern, limit?: number): Promise<PatternMatch[]> {
+        const plan = this.queryPlans.get(pattern);
+        if (!plan.template) {
+            return [];
+        }
+        const start = process.hrtime.bigint();
+        const groundings = this.patternMatcher.match(plan.template, limit);
+        plan.recordExecution(Number(process.hrtime.bigint() - start));
+
+        const toAtomById = (atomId: string) => this.toAtom(this.atoms.get(atomId)!);
+        return groundings.map(grounding => ({
+            bindings: Object.fromEntries(Object.entries(grounding.bindings).map(([variable, atomId]) => [variable, toAtomById(atomId)])),
+            groundings: grounding.clauses.map(toAtomById)
+        }));
+    }
+
+    async prepareQuery(pattern: AtomPattern): Promise<string> {
+        const handle = `query_${this.nextQueryId++}`;
+        this.preparedQueries.set(handle, { plan: this.queryPlans.get(pattern), pattern });
+        return handle;
+    }
+
+    async executePreparedQuery(handle: string): Promise<Atom[]> {
+        const prepared = this.preparedQueries.get(handle);
+        if (!prepared) {
+            throw new Error(`Unknown prepared query: ${handle}`);
+        }
+        prepared.plan.recordHit();
+        return this.executePlan(prepared.plan, prepared.pattern);
+    }
+
+    async releasePreparedQuery(handle: string): Promise<boolean> {
+        return this.preparedQueries.delete(handle);
+    }
+
+    async getQueryPlanStats(): Promise<QueryPlanStats[]> {
+        const stats = this.queryPlans.getStats();
+        const cached = new Set(stats.map(plan => plan.shape));
+        // Prepared queries keep their plan even after it is evicted from the cache
+        for (const { plan } of this.preparedQueries.values()) {
+            if (!cached.has(plan.shape)) {
+                cached.add(plan.shape);
+                stats.push(plan.getStats());
+            }
+        }
+        return stats.sort((a, b) => b.totalLatencyMs - a.totalLatencyMs);
+    }
+
+    async subscribeAtomSpaceChanges(pattern?: AtomPattern): Promise<string> {
+        return this.changeFeed.subscribe(pattern);
+    }
+
+    async unsubscribeAtomSpaceChanges(subscriptionId: string): Promise<boolean> {
+        return this.changeFeed.unsubscribe(subscriptionId);
+    }
+
     async reason(query: ReasoningQuery): Promise<ReasoningResult> {
         try {
             // Use specialized reasoning engines based on query type and context
@@ -350,8 +633,8 @@ export class AtomSpaceService implements OpenCogService {
             throw new Error(`Learning model ${modelId} not found`);
         }
         
-        // Add new training data
-        model.trainingData = [...(model.trainingData || []), ...trainingData];
+        // Add new training data, keeping the most recent records
+        model.trainingData = [...(model.trainingData || []), ...trainingData].slice(-AtomSpaceService.MAX_TRAINING_DATA);
         model.updatedAt = Date.now();
         model.version += 1;
         
@@ -395,6 +678,7 @@ export class AtomSpaceService implements OpenCogService {
 
     async getLearningStats(): Promise<{
         totalLearningRecords: number;
+        retainedLearningRecords: number;
         modelAccuracy: Record<string, number>;
         userAdaptations: number;
         behaviorPatterns: number;
@@ -408,13 +692,70 @@ export class AtomSpaceService implements OpenCogService {
             .reduce((sum, patterns) => sum + patterns.length, 0);
         
         return {
-            totalLearningRecords: this.learningHistory.length,
+            totalLearningRecords: this.learningHistory.totalRecorded,
+            retainedLearningRecords: this.learningHistory.length,
             modelAccuracy,
             userAdaptations: this.adaptationStrategies.size,
             behaviorPatterns: totalBehaviorPatterns
         };
     }
 
+    /**
+     * Estimate the heap held by each store from a sample of its records. The columnar
+     * store reports its column sizes exactly; metadata side tables are not included.
+     */
+    async getMemoryBreakdown(): Promise<MemoryBreakdown> {
+        const atomSpace: StoreMemoryUsage = {
+            entries: this.atoms.size,
+            bytes: this.atoms instanceof ColumnarAtomStore
+                ? this.atoms.columnBytes
+                : estimateCollectionBytes(this.atoms.values(), this.atoms.size)
+        };
+        const atomSpaceIndexes = AtomSpaceService.sumUsage([
+            this.atomIndex.memoryUsage(),
+            this.valueIndex.memoryUsage(),
+            this.incomingIndex.memoryUsage(),
+            this.interner.memoryUsage()
+        ]);
+        const atomSpaceViews = AtomSpaceService.sumUsage(Array.from(this.views, view => view.memoryUsage()));
+        // Prepared queries may share their plan with the cache, so both are measured with one `seen` set
+        const seen = new Set<object>();
+        const queryCache: StoreMemoryUsage = {
+            entries: this.queryPlans.size + this.preparedQueries.size,
+            bytes: estimateRetainedBytes(this.queryPlans, seen) + estimateRetainedBytes(this.preparedQueries, seen)
+        };
+        const learningHistory = AtomSpaceService.measureStore(this.learningHistory, this.learningHistory.length);
+        const patterns = Array.from(this.userBehaviorPatterns.values()).flat();
+        const userBehaviorPatterns = AtomSpaceService.measureStore(patterns, patterns.length);
+        const learningModels = AtomSpaceService.measureStore(this.learningModels.values(), this.learningModels.size);
+        const advancedLearningModels = AtomSpaceService.measureStore(this.advancedLearningModels.values(), this.advancedLearningModels.size);
+
+        const { heapUsed, heapTotal } = process.memoryUsage();
+        return {
+            atomSpace,
+            atomSpaceIndexes,
+            atomSpaceViews,
+            queryCache,
+            learningHistory,
+            userBehaviorPatterns,
+            learningModels,
+            advancedLearningModels,
+            accountedBytes: atomSpace.bytes + atomSpaceIndexes.bytes + atomSpaceViews.bytes + queryCache.bytes
+                + learningHistory.bytes + userBehaviorPatterns.bytes
+                + learningModels.bytes + advancedLearningModels.bytes,
+            heapUsed,
+            heapTotal
+        };
+    }
+
+    private static measureStore<T>(records: Iterable<T>, entries: number): StoreMemoryUsage {
+        return { entries, bytes: estimateCollectionBytes(records, entries) };
+    }
+
+    private static sumUsage(usages: StoreMemoryUsage[]): StoreMemoryUsage {
+        return usages.reduce((sum, usage) => ({ entries: sum.entries + usage.entries, bytes: sum.bytes + usage.bytes }), { entries: 0, bytes: 0 });
+    }
+
     async recognizePatterns(input: PatternInput): Promise<PatternResult[]> {
         try {
             // Use advanced pattern matching engine
@@ -429,23 +770,44 @@ export class AtomSpaceService implements OpenCogService {
     }
 
     async clearAtomSpace(): Promise<void> {
-        this.atoms.clear();
+        this.resetAtomSpace();
+        this.wal?.append({ op: 'clear' });
+        this.changeFeed.record('cleared');
+    }
+
+    private resetAtomSpace(): void {
+        if (this.views.size > 0) {
+            // Hand the current store to the open views instead of preserving every atom
+            for (const view of this.views) {
+                view.detach(this.atoms);
+            }
+            this.views.clear();
+            this.atoms = createAtomStore(this.atomStoreKind);
+        } else {
+            this.atoms.clear();
+        }
+        this.atomIndex.clear();
+        this.valueIndex.clear();
+        this.incomingIndex.clear();
+        this.interner.clear();
         this.nextAtomId = 1;
+        this.forwardChainer = undefined;
+        this.pendingInference.clear();
     }
 
     async exportAtomSpace(): Promise<string> {
-        const atomsArray = Array.from(this.atoms.values());
+        const atomsArray = Array.from(this.atoms.values(), record => this.toAtom(record));
         return JSON.stringify(atomsArray, null, 2);
     }
 
     async importAtomSpace(data: string): Promise<void> {
         try {
             const atomsArray: Atom[] = JSON.parse(data);
-            this.atoms.clear();
+            await this.clearAtomSpace();
             
             for (const atom of atomsArray) {
                 if (atom.id) {
-                    this.atoms.set(atom.id, atom);
+                    this.insertAtom(atom);
                 }
             }
         } catch (error) {
@@ -453,23 +815,653 @@ export class AtomSpaceService implements OpenCogService {
         }
     }
 
-    private generateAtomId(): string {
-        return `atom_${this.nextAtomId++}`;
+    /**
+     * Run attention allocation cycles in the background: STI spreading and decay,
+     * and forgetting once the AtomSpace exceeds `options.maxAtoms`
+     */
+    startAttentionAllocation(options: AttentionAllocationOptions = {}): void {
+        this.stopAttentionAllocation();
+        this.attentionAllocator = new AttentionAllocator(this.attentionBank, options);
+        this.attentionAllocator.start();
     }
 
-    private matchesPattern(atom: Atom, pattern: AtomPattern): boolean {
-        if (pattern.type && atom.type !== pattern.type) {
-            return false;
+    stopAttentionAllocation(): void {
+        this.attentionAllocator?.stop();
+        this.attentionAllocator = undefined;
+    }
+
+    /**
+     * Run one attention cycle now, with the running allocator's settings unless options are given
+     */
+    runAttentionCycle(options?: AttentionAllocationOptions): Promise<AttentionCycleStats> {
+        const allocator = options || !this.attentionAllocator ? new AttentionAllocator(this.attentionBank, options) : this.attentionAllocator;
+        return allocator.runCycle();
+    }
+
+    /**
+     * Forward-chain PLN modus ponens over the AtomSpace and store what is derived,
+     * under content-addressed IDs. The chainer is kept between calls: later calls
+     * only feed it the atoms added or changed since, so unchanged parts of the
+     * AtomSpace are not re-derived. Passing options starts over with a new chainer.
+     * Derivations are not retracted when their premises are removed.
+     */
+    async forwardChain(options?: ForwardChainerOptions): Promise<ForwardChainResult> {
+        if (options || !this.forwardChainer) {
+            this.forwardChainer = new PLNForwardChainer(options);
+            this.pendingInference.clear();
+            this.forwardChainer.add(Array.from(this.atoms.values(), record => this.toAtom(record)));
+        } else {
+            const changed: Atom[] = [];
+            for (const atomId of this.pendingInference) {
+                const record = this.atoms.get(atomId);
+                if (record) {
+                    changed.push(this.toAtom(record));
+                }
+            }
+            this.pendingInference.clear();
+            this.forwardChainer.add(changed);
         }
-        
-        if (pattern.name && atom.name !== pattern.name) {
+
+        const result = this.forwardChainer.run();
+        this.storingInferences = true;
+        try {
+            await this.addAtoms(result.derived);
+        } finally {
+            this.storingInferences = false;
+        }
+        return result;
+    }
+
+    getForwardChainingMetrics(): ForwardChainerMetrics | undefined {
+        return this.forwardChainer?.getMetrics();
+    }
+
+    private noteInferenceInput(atomId: string): void {
+        if (this.forwardChainer && !this.storingInferences) {
+            this.pendingInference.add(atomId);
+        }
+    }
+
+    /**
+     * Read-consistent view of the current AtomSpace version. Taking a view is O(1);
+     * later writes keep the previous version of each atom they change for as long as
+     * the view is open. Call `release()` when done.
+     */
+    snapshot(): AtomSpaceView {
+        const view = new AtomSpaceView(this.changeFeed.lastSequence, this.atoms, released => this.views.delete(released));
+        this.views.add(view);
+        return view;
+    }
+
+    /**
+     * Encode the AtomSpace as a binary snapshot
+     */
+    createAtomSpaceSnapshot(): Buffer {
+        return encodeAtomSnapshot(this.atoms.values());
+    }
+
+    /**
+     * Replace the AtomSpace with the contents of a binary snapshot
+     */
+    async restoreAtomSpaceSnapshot(snapshot: Buffer): Promise<number> {
+        const reader = new AtomSnapshotReader(snapshot);
+        // The clear is not logged: until the compaction below has replaced the log,
+        // recovery still finds the previous state rather than an empty AtomSpace
+        this.resetAtomSpace();
+        this.changeFeed.record('cleared');
+        // Records are unique and children come first, so they go straight into the
+        // store; the value index is then built with one sort per field
+        for (const record of reader.records()) {
+            this.atoms.set(record.id, record);
+            this.atomIndex.add(record);
+            this.incomingIndex.addLink(record.id, record.outgoing);
+            this.interner.register(record);
+            this.changeFeed.record('added', record);
+        }
+        this.valueIndex.load(this.atoms.values());
+        // The restored atoms are not logged one by one; the snapshot atomically replaces the log instead
+        await this.wal?.compact();
+        return reader.size;
+    }
+
+    /**
+     * Write a binary snapshot with a single buffered write, replacing the file atomically
+     */
+    async saveAtomSpaceSnapshot(filePath: string): Promise<number> {
+        const snapshot = this.createAtomSpaceSnapshot();
+        const temporaryPath = `${filePath}.tmp`;
+        await fs.writeFile(temporaryPath, snapshot);
+        await fs.rename(temporaryPath, filePath);
+        return this.atoms.size;
+    }
+
+    /**
+     * Load a binary snapshot with a single file read
+     */
+    async loadAtomSpaceSnapshot(filePath: string): Promise<number> {
+        return this.restoreAtomSpaceSnapshot(await fs.readFile(filePath));
+    }
+
+    /**
+     * Make the AtomSpace durable in `directory`: restore the last snapshot, replay the
+     * write-ahead log written after it, then log every further mutation. Returns the
+     * number of atoms recovered.
+     */
+    async enablePersistence(directory: string, options?: WriteAheadLogOptions): Promise<number> {
+        if (this.wal) {
+            throw new Error('AtomSpace persistence is already enabled');
+        }
+        const wal = new AtomWriteAheadLog(directory, () => this.createAtomSpaceSnapshot(), options);
+        const { snapshot, entries } = await wal.recover();
+        if (snapshot) {
+            await this.restoreAtomSpaceSnapshot(snapshot);
+        } else {
+            this.resetAtomSpace();
+        }
+        for (const entry of entries) {
+            this.replayLogEntry(entry);
+        }
+        await wal.open();
+        this.wal = wal;
+        if (entries.length > 0) {
+            await wal.compact();
+        }
+        return this.atoms.size;
+    }
+
+    /**
+     * Resolve once every mutation made so far has been synced to the write-ahead log
+     */
+    async flushPersistence(): Promise<void> {
+        this.journalAttention();
+        await this.wal?.flush();
+    }
+
+    async disablePersistence(): Promise<void> {
+        this.journalAttention();
+        const wal = this.wal;
+        this.wal = undefined;
+        await wal?.close();
+    }
+
+    /**
+     * Stop logging after synchronously writing and syncing every logged mutation,
+     * for shutdown hooks that cannot wait for a promise
+     */
+    disablePersistenceSync(): void {
+        this.journalAttention();
+        const wal = this.wal;
+        this.wal = undefined;
+        wal?.closeSync();
+    }
+
+    private replayLogEntry(entry: WalEntry): void {
+        switch (entry.op) {
+            case 'put':
+                this.storeRecord(entry.record);
+                break;
+            case 'remove':
+                this.extractAtom(entry.id);
+                break;
+            case 'clear':
+                this.resetAtomSpace();
+                break;
+            case 'attention': {
+                const existing = this.atoms.get(entry.id);
+                if (existing) {
+                    this.replaceAttention(existing, { ...existing, attentionValue: entry.attentionValue });
+                }
+                break;
+            }
+        }
+    }
+
+    /**
+     * Stream the AtomSpace as NDJSON chunks, one stored record per line. Links reference
+     * their outgoing atoms by ID. Wrap with `Readable.from` for a Node stream.
+     */
+    async *exportAtomSpaceStream(options: AtomStreamOptions = {}): AsyncIterableIterator<string> {
+        // Read from a view so that writes made between chunks do not tear the export
+        const view = this.snapshot();
+        try {
+            yield* encodeAtomRecords(view.values(), view.size, options);
+        } finally {
+            view.release();
+        }
+    }
+
+    /**
+     * Replace the AtomSpace with the atoms of an NDJSON stream, yielding to the event
+     * loop between batches. Resolves to the number of lines read.
+     */
+    async importAtomSpaceStream(source: AsyncIterable<string | Uint8Array>, options: AtomStreamOptions = {}): Promise<number> {
+        const batchSize = options.batchSize || DEFAULT_STREAM_BATCH_SIZE;
+        await this.clearAtomSpace();
+        const importer = this.createStreamImporter();
+
+        try {
+            for await (const line of readNdjsonLines(source)) {
+                importer.acceptLine(line);
+                if (importer.processed % batchSize === 0) {
+                    options.onProgress?.({ processed: importer.processed });
+                    await yieldToEventLoop();
+                }
+            }
+            importer.finish();
+        } catch (error) {
+            throw new Error(`Failed to import AtomSpace: ${error}`);
+        }
+        options.onProgress?.({ processed: importer.processed });
+        return importer.processed;
+    }
+
+    async beginAtomSpaceExport(chunkSize?: number): Promise<string> {
+        const exportId = this.openTransfer();
+        // Take the view now rather than on the first read, so that `total` is the size of what is exported
+        const view = this.snapshot();
+        this.transfers.set(exportId, {
+            lastAccess: Date.now(),
+            view,
+            chunks: encodeAtomRecords(view.values(), view.size, { batchSize: chunkSize }),
+            processed: 0,
+            total: view.size
+        });
+        return exportId;
+    }
+
+    async readAtomSpaceExportChunk(exportId: string): Promise<AtomSpaceExportChunk> {
+        const transfer = this.getTransfer(exportId);
+        if (!transfer.chunks) {
+            throw new Error(`Transfer ${exportId} is not an export`);
+        }
+        let next: IteratorResult<string>;
+        try {
+            next = await transfer.chunks.next();
+        } catch (error) {
+            this.closeTransfer(exportId, transfer);
+            throw error;
+        }
+        if (next.done) {
+            this.closeTransfer(exportId, transfer);
+            return { data: '', done: true, processed: transfer.processed, total: transfer.total };
+        }
+        transfer.processed += countLines(next.value);
+        return { data: next.value, done: false, processed: transfer.processed, total: transfer.total };
+    }
+
+    async beginAtomSpaceImport(): Promise<string> {
+        const importId = this.openTransfer();
+        await this.clearAtomSpace();
+        this.transfers.set(importId, {
+            lastAccess: Date.now(),
+            importer: this.createStreamImporter(),
+            lines: new NdjsonLineBuffer(),
+            processed: 0
+        });
+        return importId;
+    }
+
+    async writeAtomSpaceImportChunk(importId: string, data: string): Promise<AtomSpaceTransferProgress> {
+        const transfer = this.getTransfer(importId);
+        if (!transfer.importer || !transfer.lines) {
+            throw new Error(`Transfer ${importId} is not an import`);
+        }
+        try {
+            for (const line of transfer.lines.push(data)) {
+                transfer.importer.acceptLine(line);
+            }
+        } catch (error) {
+            this.transfers.delete(importId);
+            throw new Error(`Failed to import AtomSpace: ${error}`);
+        }
+        transfer.processed = transfer.importer.processed;
+        return { processed: transfer.processed };
+    }
+
+    async finishAtomSpaceImport(importId: string): Promise<number> {
+        const transfer = this.getTransfer(importId);
+        if (!transfer.importer || !transfer.lines) {
+            throw new Error(`Transfer ${importId} is not an import`);
+        }
+        this.transfers.delete(importId);
+        try {
+            for (const line of transfer.lines.flush()) {
+                transfer.importer.acceptLine(line);
+            }
+            transfer.importer.finish();
+        } catch (error) {
+            throw new Error(`Failed to import AtomSpace: ${error}`);
+        }
+        return transfer.importer.processed;
+    }
+
+    async cancelAtomSpaceTransfer(transferId: string): Promise<boolean> {
+        const transfer = this.transfers.get(transferId);
+        if (!transfer) {
             return false;
         }
-        
-        // Additional pattern matching logic would go here
+        await this.closeTransfer(transferId, transfer);
         return true;
     }
 
+    private createStreamImporter(): AtomStreamImporter {
+        return new AtomStreamImporter({
+            has: atomId => this.atoms.has(atomId),
+            storeRecord: record => this.storeRecord(record),
+            addAtom: atom => this.insertAtom(atom)
+        });
+    }
+
+    private openTransfer(): string {
+        this.scheduleTransferExpiry();
+        return `transfer_${this.nextTransferId++}`;
+    }
+
+    /**
+     * End a transfer and release the view an export holds; an export that was never
+     * read has not started its generator, so the view is released here rather than by it
+     */
+    private closeTransfer(transferId: string, transfer: AtomSpaceTransfer): Promise<unknown> {
+        this.transfers.delete(transferId);
+        transfer.view?.release();
+        return transfer.chunks?.return?.(undefined) ?? Promise.resolve();
+    }
+
+    /**
+     * Drop sessions abandoned by their clients, checking on a timer while any transfer is
+     * open; an abandoned export would otherwise keep its view, and every atom written
+     * since, alive
+     */
+    private scheduleTransferExpiry(): void {
+        if (this.transferExpiryTimer) {
+            return;
+        }
+        this.transferExpiryTimer = setTimeout(() => {
+            this.transferExpiryTimer = undefined;
+            const expiry = Date.now() - AtomSpaceService.TRANSFER_TIMEOUT_MS;
+            for (const [transferId, transfer] of this.transfers) {
+                if (transfer.lastAccess < expiry) {
+                    this.closeTransfer(transferId, transfer);
+                }
+            }
+            if (this.transfers.size > 0) {
+                this.scheduleTransferExpiry();
+            }
+        }, AtomSpaceService.TRANSFER_EXPIRY_CHECK_MS);
+        // The check must not keep the backend process alive on its own
+        this.transferExpiryTimer.unref?.();
+    }
+
+    private getTransfer(transferId: string): AtomSpaceTransfer {
+        const transfer = this.transfers.get(transferId);
+        if (!transfer) {
+            throw new Error(`Unknown AtomSpace transfer: ${transferId}`);
+        }
+        transfer.lastAccess = Date.now();
+        return transfer;
+    }
+
+    private generateAtomId(): string {
+        let atomId = `atom_${this.nextAtomId++}`;
+        // Imported spaces may already hold IDs ahead of the counter
+        while (this.atoms.has(atomId)) {
+            atomId = `atom_${this.nextAtomId++}`;
+        }
+        return atomId;
+    }
+
+    /**
+     * Store an atom, interning its outgoing set first. Atoms without an explicit ID,
+     * or with a content-addressed one, are hash-consed on type, name and outgoing IDs:
+     * re-adding an existing atom merges its values into the stored one and returns the
+     * existing ID.
+     */
+    private insertAtom(atom: Atom): string {
+        const fields = recordFields(atom);
+        const outgoingIds = atom.outgoing ? atom.outgoing.map(child => this.internOutgoing(child)) : undefined;
+
+        if (!atom.id || isContentAtomId(atom.id)) {
+            const existingId = this.interner.lookup(atom.type, atom.name, outgoingIds)
+                ?? (atom.id && this.atoms.has(atom.id) ? atom.id : undefined);
+            if (existingId) {
+                this.mergeAtom(existingId, fields);
+                return existingId;
+            }
+        }
+
+        const record: AtomRecord = { ...fields, type: atom.type, id: atom.id || this.generateAtomId() };
+        if (outgoingIds) {
+            record.outgoing = outgoingIds;
+        }
+        this.storeRecord(record);
+        return record.id;
+    }
+
+    /**
+     * Store a record whose outgoing atoms are already present, replacing any atom with the same ID
+     */
+    private storeRecord(record: AtomRecord): void {
+        const previous = this.atoms.get(record.id);
+        if (previous) {
+            this.replaceRecord(previous, record);
+        } else {
+            this.recordPriorState(record.id, undefined);
+            this.atoms.set(record.id, record);
+            this.indexAtom(record);
+            this.noteInferenceInput(record.id);
+            this.wal?.append({ op: 'put', record });
+            this.changeFeed.record('added', record);
+        }
+    }
+
+    /**
+     * Resolve an outgoing element to an atom ID, adding it when it is not stored yet
+     */
+    private internOutgoing(child: Atom): string {
+        if (child.id && this.atoms.has(child.id)) {
+            return child.id;
+        }
+        return this.insertAtom(child);
+    }
+
+    /**
+     * Merge the values of a re-added atom into its canonical record. The truth value
+     * with the higher confidence wins; attention values and metadata are overlaid.
+     */
+    private mergeAtom(atomId: string, fields: Partial<AtomRecord>): void {
+        const existing = this.atoms.get(atomId)!;
+        const merged: AtomRecord = { ...existing };
+
+        if (fields.truthValue && (!existing.truthValue || fields.truthValue.confidence >= existing.truthValue.confidence)) {
+            merged.truthValue = fields.truthValue;
+        }
+        if (fields.attentionValue) {
+            merged.attentionValue = fields.attentionValue;
+        }
+        if (fields.metadata) {
+            merged.metadata = { ...existing.metadata, ...fields.metadata };
+        }
+        this.replaceRecord(existing, merged);
+    }
+
+    private replaceRecord(previous: AtomRecord, next: AtomRecord): void {
+        this.recordPriorState(previous.id, previous);
+        this.atoms.set(next.id, next);
+        this.noteInferenceInput(next.id);
+        this.wal?.append({ op: 'put', record: next });
+        this.changeFeed.record('updated', next, previous);
+        this.atomIndex.update(previous, next);
+        this.valueIndex.update(previous, next);
+
+        const outgoingChanged = !sameOutgoing(previous.outgoing, next.outgoing);
+        if (outgoingChanged) {
+            this.incomingIndex.removeLink(previous.id, previous.outgoing);
+            this.incomingIndex.addLink(next.id, next.outgoing);
+        }
+        if (previous.type !== next.type || previous.name !== next.name || outgoingChanged) {
+            this.interner.unregister(previous);
+            this.interner.register(next);
+        }
+    }
+
+    /**
+     * Swap in a record that differs only in its attention value. Attention is
+     * bookkeeping rather than knowledge, so it is neither reported as a change nor
+     * queued for inference, and a cycle rewrites most atoms, so it is journaled once
+     * per cycle with one entry per changed atom rather than on every update.
+     */
+    private replaceAttention(previous: AtomRecord, next: AtomRecord): void {
+        this.recordPriorState(previous.id, previous);
+        this.atoms.set(next.id, next);
+        this.valueIndex.update(previous, next);
+        if (this.wal) {
+            this.attentionChanges.add(next.id);
+        }
+    }
+
+    /**
+     * Log the current attention value of every atom whose attention changed since the
+     * last call; atoms removed since then were logged by their removal
+     */
+    private journalAttention(): void {
+        if (this.wal) {
+            for (const atomId of this.attentionChanges) {
+                const attentionValue = this.atoms.get(atomId)?.attentionValue;
+                if (attentionValue) {
+                    this.wal.append({ op: 'attention', id: atomId, attentionValue });
+                }
+            }
+        }
+        this.attentionChanges.clear();
+    }
+
+    /**
+     * Remove an atom and, recursively, every link in its incoming set
+     */
+    private extractAtom(atomId: string): void {
+        const record = this.atoms.get(atomId);
+        if (!record) {
+            return;
+        }
+        for (const linkId of Array.from(this.incomingIndex.get(atomId))) {
+            this.extractAtom(linkId);
+        }
+        this.recordPriorState(atomId, record);
+        this.unindexAtom(record);
+        this.atoms.delete(atomId);
+        this.wal?.append({ op: 'remove', id: atomId });
+        this.changeFeed.record('removed', record);
+    }
+
+    /**
+     * Shallow `Atom` for change notifications, with outgoing atoms as `{ id, type }` references
+     */
+    private toChangeAtom(record: AtomRecord): Atom {
+        const { outgoing, ...fields } = record;
+        if (!outgoing) {
+            return fields;
+        }
+        return {
+            ...fields,
+            outgoing: outgoing.map(childId => ({ id: childId, type: this.atoms.get(childId)?.type ?? 'Atom' }))
+        };
+    }
+
+    /**
+     * Materialize a stored record as an `Atom`, resolving outgoing IDs to atoms
+     */
+    private toAtom(record: AtomRecord): Atom {
+        const { outgoing, ...fields } = record;
+        if (!outgoing) {
+            return fields;
+        }
+
+        const children: Atom[] = [];
+        for (const childId of outgoing) {
+            const child = this.atoms.get(childId);
+            if (child) {
+                children.push(this.toAtom(child));
+            }
+        }
+        return { ...fields, outgoing: children };
+    }
+
+    /**
+     * Run a query plan, timing the execution against the plan's statistics
+     */
+    private executePlan(plan: QueryPlan, pattern: AtomPattern): Atom[] {
+        const start = process.hrtime.bigint();
+        const results: Atom[] = [];
+        const [candidateIds, usedRange] = this.planCandidates(plan, pattern);
+
+        if (candidateIds) {
+            for (const atomId of candidateIds) {
+                const record = this.atoms.get(atomId);
+                if (record && plan.matches(record, pattern, usedRange)) {
+                    results.push(this.toAtom(record));
+                }
+            }
+        } else {
+            for (const record of this.atoms.values()) {
+                if (plan.matches(record, pattern, true)) {
+                    results.push(this.toAtom(record));
+                }
+            }
+        }
+
+        plan.recordExecution(Number(process.hrtime.bigint() - start));
+        return results;
+    }
+
+    /**
+     * Candidate IDs for the plan's access path, or `undefined` when only a full scan
+     * can answer the pattern. The flag tells whether a range index supplied them.
+     */
+    private planCandidates(plan: QueryPlan, pattern: AtomPattern): [Iterable<string> | undefined, boolean] {
+        switch (plan.access) {
+            case 'template':
+                return [this.groundedAtoms(plan.template!), false];
+            case 'scan':
+                return [undefined, true];
+            case 'threshold':
+                return [this.valueIndex.select(pattern)?.ids(), true];
+        }
+
+        const hashCandidates = this.atomIndex.select(pattern)!;
+        if (plan.compareRange) {
+            const rangeCandidates = this.valueIndex.select(pattern);
+            if (rangeCandidates && rangeCandidates.size < hashCandidates.size) {
+                return [rangeCandidates.ids(), true];
+            }
+        }
+        return [hashCandidates, false];
+    }
+
+    /**
+     * Distinct atoms grounding any clause of the pattern's template
+     */
+    private groundedAtoms(template: CompiledPattern): Set<string> {
+        const atomIds = new Set<string>();
+        for (const grounding of this.patternMatcher.match(template)) {
+            grounding.clauses.forEach(atomId => atomIds.add(atomId));
+        }
+        return atomIds;
+    }
+
+    private indexAtom(record: AtomRecord): void {
+        this.atomIndex.add(record);
+        this.valueIndex.add(record);
+        this.incomingIndex.addLink(record.id, record.outgoing);
+        this.interner.register(record);
+    }
+
+    private unindexAtom(record: AtomRecord): void {
+        this.atomIndex.remove(record);
+        this.valueIndex.remove(record);
+        this.incomingIndex.removeLink(record.id, record.outgoing);
+        this.interner.unregister(record);
+    }
+
     /**
      * Perform advanced code completion using cognitive reasoning
      */
@@ -1275,19 +2267,17 @@ export class AtomSpaceService implements OpenCogService {
         confidence: number;
     }> {
         // Analyze user data to generate adaptation recommendations
-        const userHistory = this.learningHistory.filter(
-            item => item.context?.userId === userId
-        );
+        const userSummary = this.learningHistory.userSummary(userId);
         
         const recommendations: Record<string, any> = {};
         let confidence = 0.5;
         
-        if (userHistory.length > 10) {
+        if (userSummary && userSummary.count > 10) {
             // Sufficient data for analysis
             confidence = 0.8;
-            recommendations.experienceLevel = this.determineExperienceLevel(userHistory);
-            recommendations.preferredWorkflow = this.identifyPreferredWorkflow(userHistory);
-            recommendations.optimizationAreas = this.identifyOptimizationAreas(userHistory);
+            recommendations.experienceLevel = this.determineExperienceLevel(userSummary);
+            recommendations.preferredWorkflow = this.identifyPreferredWorkflow(userSummary);
+            recommendations.optimizationAreas = this.identifyOptimizationAreas(userSummary);
         }
         
         return { recommendations, confidence };
@@ -1419,10 +2409,10 @@ export class AtomSpaceService implements OpenCogService {
         this.userPersonalization.set(userId, updated);
     }
 
-    private determineExperienceLevel(history: LearningData[]): string {
+    private determineExperienceLevel(summary: LearningUserSummary): string {
         // Determine user experience level from history
-        const totalActions = history.length;
-        const successRate = history.filter(h => h.feedback?.helpful).length / totalActions;
+        const totalActions = summary.count;
+        const successRate = summary.helpful / totalActions;
         
         if (totalActions < 10) return 'beginner';
         if (totalActions < 50) return 'intermediate';
@@ -1430,31 +2420,14 @@ export class AtomSpaceService implements OpenCogService {
         return 'advanced';
     }
 
-    private identifyPreferredWorkflow(history: LearningData[]): Record<string, any> {
+    private identifyPreferredWorkflow(summary: LearningUserSummary): Record<string, any> {
         // Identify user's preferred workflow patterns
-        const workflows: Record<string, number> = {};
-        
-        for (const item of history) {
-            if (item.context?.currentTask) {
-                workflows[item.context.currentTask] = (workflows[item.context.currentTask] || 0) + 1;
-            }
-        }
-        
-        return workflows;
+        return Object.fromEntries(summary.tasks);
     }
 
-    private identifyOptimizationAreas(history: LearningData[]): string[] {
+    private identifyOptimizationAreas(summary: LearningUserSummary): string[] {
         // Identify areas where user could improve
-        const areas: string[] = [];
-        const feedbackItems = history.filter(h => h.feedback && !h.feedback.helpful);
-        
-        for (const item of feedbackItems) {
-            if (item.context?.currentTask && !areas.includes(item.context.currentTask)) {
-                areas.push(item.context.currentTask);
-            }
-        }
-        
-        return areas;
+        return Array.from(summary.unhelpfulTasks.keys());
     }
 
     // ===== PHASE 5: MULTI-MODAL COGNITIVE PROCESSING METHODS =====
@@ -2643,4 +3616,22 @@ export class AtomSpaceService implements OpenCogService {
             memoryUsage: models.length * 1024 // Estimated memory usage
         };
     }
-}
\ No newline at end of file
+}
+
+function sameOutgoing(a: string[] | undefined, b: string[] | undefined): boolean {
+    if (a === b) {
+        return true;
+    }
+    if (!a || !b || a.length !== b.length) {
+        return false;
+    }
+    return a.every((id, i) => id === b[i]);
+}
+
+function countLines(chunk: string): number {
+    let count = 0;
+    for (let i = chunk.indexOf('\n'); i !== -1; i = chunk.indexOf('\n', i + 1)) {
+        count++;
+    }
+    return count;
+}
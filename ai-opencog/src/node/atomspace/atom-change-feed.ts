@@ -0,0 +1,114 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { Atom, AtomPattern, AtomSpaceChange, AtomSpaceChangeBatch, AtomSpaceChangeKind } from '../../common/opencog-types';
+import { AtomRecord } from './atom-record';
+import { AtomValueIndex } from './value-index';
+import { PatternMatcher } from './pattern-matcher';
+
+interface ChangeSubscription {
+    pattern: AtomPattern | undefined;
+    pending: AtomSpaceChange[];
+}
+
+/**
+ * Change-data capture for the AtomSpace. Every mutation gets the next sequence
+ * number; changes matching a subscription's filter are queued for it and delivered
+ * in one batch per subscription once the current event-loop turn ends, so a bulk
+ * operation produces one notification rather than one per atom. With no
+ * subscribers, recording a change only advances the sequence.
+ */
+export class AtomChangeFeed {
+
+    private readonly subscriptions = new Map<string, ChangeSubscription>();
+    private nextSubscriptionId = 1;
+    private sequence = 0;
+    private deliveryScheduled = false;
+
+    constructor(
+        private readonly deliver: (batch: AtomSpaceChangeBatch) => void,
+        private readonly materialize: (record: AtomRecord) => Atom
+    ) { }
+
+    get lastSequence(): number {
+        return this.sequence;
+    }
+
+    /**
+     * Subscribe to changes of atoms matching the pattern's type, name and value
+     * thresholds; without a pattern every change is delivered
+     */
+    subscribe(pattern?: AtomPattern): string {
+        if (pattern && PatternMatcher.hasTemplate(pattern)) {
+            throw new Error('Change subscriptions filter on type, name and value thresholds; templates are not supported');
+        }
+        const subscriptionId = `changes_${this.nextSubscriptionId++}`;
+        this.subscriptions.set(subscriptionId, { pattern, pending: [] });
+        return subscriptionId;
+    }
+
+    unsubscribe(subscriptionId: string): boolean {
+        return this.subscriptions.delete(subscriptionId);
+    }
+
+    /**
+     * Record a change. An update is delivered when the atom matches the filter before
+     * or after it, so subscribers also see atoms leaving their filter.
+     */
+    record(kind: AtomSpaceChangeKind, record?: AtomRecord, previous?: AtomRecord): void {
+        const sequence = ++this.sequence;
+        if (this.subscriptions.size === 0) {
+            return;
+        }
+
+        let change: AtomSpaceChange | undefined;
+        for (const subscription of this.subscriptions.values()) {
+            if (kind === 'cleared' || AtomChangeFeed.matches(subscription.pattern, record!)
+                || (previous !== undefined && AtomChangeFeed.matches(subscription.pattern, previous))) {
+                change ??= record ? { sequence, kind, atom: this.materialize(record) } : { sequence, kind };
+                subscription.pending.push(change);
+            }
+        }
+        if (change && !this.deliveryScheduled) {
+            this.deliveryScheduled = true;
+            setImmediate(() => this.flush());
+        }
+    }
+
+    private flush(): void {
+        this.deliveryScheduled = false;
+        for (const [subscriptionId, subscription] of this.subscriptions) {
+            if (subscription.pending.length > 0) {
+                const changes = subscription.pending;
+                subscription.pending = [];
+                this.deliver({ subscriptionId, changes });
+            }
+        }
+    }
+
+    private static matches(pattern: AtomPattern | undefined, record: AtomRecord): boolean {
+        if (!pattern) {
+            return true;
+        }
+        if (pattern.type && record.type !== pattern.type) {
+            return false;
+        }
+        if (pattern.name && record.name !== pattern.name) {
+            return false;
+        }
+        return AtomValueIndex.meetsThresholds(record, pattern);
+    }
+}
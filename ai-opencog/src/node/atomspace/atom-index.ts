@@ -0,0 +1,162 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { AtomPattern, StoreMemoryUsage } from '../../common/opencog-types';
+import { estimateIndexBytes } from '../../common/memory-estimate';
+import { AtomRecord } from './atom-record';
+
+/**
+ * IDs under one index key. Most names belong to a single atom, so a lone ID is
+ * stored as a plain string and only promoted to a set when a second one arrives.
+ */
+type Bucket = string | Set<string>;
+
+/**
+ * Hash indexes over the AtomSpace used to answer `queryAtoms` without a full scan.
+ *
+ * Atoms are indexed by type, by name and by the composite (type, name) key.
+ * The index only stores atom IDs; the owning store stays the source of truth.
+ */
+export class AtomIndex {
+
+    private readonly byType = new Map<string, Bucket>();
+    private readonly byName = new Map<string, Bucket>();
+    private readonly byTypeAndName = new Map<string, Bucket>();
+
+    /**
+     * Register an atom in all hash indexes
+     */
+    add(atom: AtomRecord): void {
+        this.addTo(this.byType, atom.type, atom.id);
+        if (atom.name !== undefined) {
+            this.addTo(this.byName, atom.name, atom.id);
+            this.addTo(this.byTypeAndName, AtomIndex.compositeKey(atom.type, atom.name), atom.id);
+        }
+    }
+
+    /**
+     * Remove an atom from all hash indexes
+     */
+    remove(atom: AtomRecord): void {
+        this.removeFrom(this.byType, atom.type, atom.id);
+        if (atom.name !== undefined) {
+            this.removeFrom(this.byName, atom.name, atom.id);
+            this.removeFrom(this.byTypeAndName, AtomIndex.compositeKey(atom.type, atom.name), atom.id);
+        }
+    }
+
+    /**
+     * Re-index an atom whose indexed fields may have changed
+     */
+    update(previous: AtomRecord, next: AtomRecord): void {
+        if (previous.type === next.type && previous.name === next.name) {
+            return;
+        }
+        this.remove(previous);
+        this.add(next);
+    }
+
+    /**
+     * Index keys and their estimated size; type and name keys are shared with the records
+     */
+    memoryUsage(): StoreMemoryUsage {
+        return {
+            entries: this.byType.size + this.byName.size + this.byTypeAndName.size,
+            bytes: estimateIndexBytes(this.byType, true) + estimateIndexBytes(this.byName, true) + estimateIndexBytes(this.byTypeAndName)
+        };
+    }
+
+    clear(): void {
+        this.byType.clear();
+        this.byName.clear();
+        this.byTypeAndName.clear();
+    }
+
+    /**
+     * Return the smallest candidate ID set able to answer the pattern, or
+     * `undefined` when the pattern constrains no indexed field and a scan is required.
+     */
+    select(pattern: AtomPattern): ReadonlySet<string> | undefined {
+        if (pattern.type && pattern.name) {
+            return asSet(this.byTypeAndName.get(AtomIndex.compositeKey(pattern.type, pattern.name)));
+        }
+        if (pattern.type) {
+            return asSet(this.byType.get(pattern.type));
+        }
+        if (pattern.name) {
+            return asSet(this.byName.get(pattern.name));
+        }
+        return undefined;
+    }
+
+    /**
+     * Number of atoms the index would hand back for the pattern, or `undefined` for a full scan
+     */
+    estimate(pattern: AtomPattern): number | undefined {
+        const candidates = this.select(pattern);
+        return candidates ? candidates.size : undefined;
+    }
+
+    /**
+     * Distinct atom types currently indexed
+     */
+    getTypes(): string[] {
+        return Array.from(this.byType.keys());
+    }
+
+    private addTo(index: Map<string, Bucket>, key: string, atomId: string): void {
+        const ids = index.get(key);
+        if (ids === undefined) {
+            index.set(key, atomId);
+        } else if (typeof ids === 'string') {
+            if (ids !== atomId) {
+                index.set(key, new Set([ids, atomId]));
+            }
+        } else {
+            ids.add(atomId);
+        }
+    }
+
+    private removeFrom(index: Map<string, Bucket>, key: string, atomId: string): void {
+        const ids = index.get(key);
+        if (ids === undefined) {
+            return;
+        }
+        if (typeof ids === 'string') {
+            if (ids === atomId) {
+                index.delete(key);
+            }
+            return;
+        }
+        ids.delete(atomId);
+        if (ids.size === 1) {
+            index.set(key, ids.values().next().value!);
+        }
+    }
+
+    private static compositeKey(type: string, name: string): string {
+        return `${type}\u0000${name}`;
+    }
+}
+
+const EMPTY_SET: ReadonlySet<string> = new Set<string>();
+
+function asSet(ids: Bucket | undefined): ReadonlySet<string> {
+    if (ids === undefined) {
+        return EMPTY_SET;
+    }
+    return typeof ids === 'string' ? new Set([ids]) : ids;
+}
@@ -0,0 +1,116 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { createHash } from 'crypto';
+import { Atom, StoreMemoryUsage } from '../../common/opencog-types';
+import { estimateIndexBytes } from '../../common/memory-estimate';
+
+const CONTENT_ID_PREFIX = 'atom_c';
+
+/**
+ * Stored form of an atom: links reference their outgoing set by atom ID
+ * instead of embedding copies of the child atoms.
+ */
+export interface AtomRecord extends Omit<Atom, 'id' | 'outgoing' | 'incoming'> {
+    id: string;
+    outgoing?: string[];
+}
+
+/**
+ * Copy the value fields of an atom, dropping its ID and link structure
+ */
+export function recordFields(atom: Partial<Atom>): Partial<AtomRecord> {
+    const fields: Record<string, any> = { ...atom };
+    delete fields.id;
+    delete fields.outgoing;
+    delete fields.incoming;
+    return fields;
+}
+
+/**
+ * Content key used for hash-consing: two atoms with the same type, name and
+ * outgoing IDs are the same atom.
+ */
+export function atomContentKey(type: string, name: string | undefined, outgoing: string[] | undefined): string {
+    const base = `${type}\u0000${name ?? ''}`;
+    return outgoing && outgoing.length > 0 ? `${base}\u0000${outgoing.join('\u0001')}` : base;
+}
+
+/**
+ * Content-addressed atom ID: the same type, name and outgoing IDs always give the
+ * same ID, so an atom derived twice is stored once. The ID is the first 64 bits of
+ * the SHA-1 of the content key.
+ */
+export function contentAtomId(type: string, name: string | undefined, outgoing: string[] | undefined): string {
+    const digest = createHash('sha1').update(atomContentKey(type, name, outgoing)).digest('hex');
+    return `${CONTENT_ID_PREFIX}${digest.substring(0, 16)}`;
+}
+
+/**
+ * Content-addressed ID of a derived atom; outgoing atoms without an ID are addressed by content too
+ */
+export function derivedAtomId(atom: Atom): string {
+    const outgoing = atom.outgoing?.map(child => child.id || derivedAtomId(child));
+    return contentAtomId(atom.type, atom.name, outgoing);
+}
+
+export function isContentAtomId(atomId: string): boolean {
+    return atomId.startsWith(CONTENT_ID_PREFIX);
+}
+
+/**
+ * Hash-consing table mapping atom content keys to the canonical atom ID
+ */
+export class AtomInterner {
+
+    private readonly canonical = new Map<string, string>();
+
+    lookup(type: string, name: string | undefined, outgoing: string[] | undefined): string | undefined {
+        return this.canonical.get(atomContentKey(type, name, outgoing));
+    }
+
+    /**
+     * Claim the content key for the record unless another atom already owns it
+     */
+    register(record: AtomRecord): void {
+        const key = atomContentKey(record.type, record.name, record.outgoing);
+        if (!this.canonical.has(key)) {
+            this.canonical.set(key, record.id);
+        }
+    }
+
+    /**
+     * Release the content key if the record currently owns it
+     */
+    unregister(record: AtomRecord): void {
+        const key = atomContentKey(record.type, record.name, record.outgoing);
+        if (this.canonical.get(key) === record.id) {
+            this.canonical.delete(key);
+        }
+    }
+
+    memoryUsage(): StoreMemoryUsage {
+        return { entries: this.canonical.size, bytes: estimateIndexBytes(this.canonical) };
+    }
+
+    clear(): void {
+        this.canonical.clear();
+    }
+
+    get size(): number {
+        return this.canonical.size;
+    }
+}
@@ -0,0 +1,322 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { AtomRecord } from './atom-record';
+
+/*
+ * Binary AtomSpace snapshot, little-endian, every section 8-byte aligned:
+ *
+ *   header      48 bytes  magic 'OCAS', version, counts and section offsets
+ *   strings     (count + 1) u32 byte offsets, then the UTF-8 string data
+ *   records     fixed 72-byte atom records
+ *   outgoing    u32 record indexes referenced by the records
+ *
+ * Atom record layout:
+ *
+ *   0  u32 id string       16 u32 flags              32 f64 strength
+ *   4  u32 type string     20 u32 first outgoing     40 f64 confidence
+ *   8  u32 name string     24 u32 outgoing count     48 f64 sti
+ *   12 u32 metadata JSON   28 u32 reserved           56 f64 lti
+ *                                                    64 f64 vlti
+ *
+ * Records are written children first, so loading them in order never meets a link
+ * before the atoms it points to. Fixed-width records let a reader decode any atom
+ * in place without parsing the rest of the snapshot.
+ */
+
+export const SNAPSHOT_MAGIC = 'OCAS';
+export const SNAPSHOT_VERSION = 1;
+
+const HEADER_SIZE = 48;
+const RECORD_SIZE = 72;
+const NO_STRING = 0xFFFFFFFF;
+
+const FLAG_TRUTH_VALUE = 1;
+const FLAG_ATTENTION_VALUE = 2;
+
+/**
+ * Encode records into a snapshot held in a single buffer
+ */
+export function encodeAtomSnapshot(records: Iterable<AtomRecord>): Buffer {
+    const ordered = childrenFirst(Array.from(records));
+    const indexById = new Map<string, number>();
+    ordered.forEach((record, index) => indexById.set(record.id, index));
+
+    const strings = new StringTableBuilder();
+    let outgoingCount = 0;
+    const metadataJson: Array<string | undefined> = new Array(ordered.length);
+    ordered.forEach((record, index) => {
+        strings.add(record.id);
+        strings.add(record.type);
+        if (record.name !== undefined) {
+            strings.add(record.name);
+        }
+        if (record.metadata !== undefined) {
+            metadataJson[index] = JSON.stringify(record.metadata);
+            strings.add(metadataJson[index]!);
+        }
+        outgoingCount += record.outgoing ? record.outgoing.length : 0;
+    });
+
+    const stringOffsetsOffset = HEADER_SIZE;
+    const stringDataOffset = stringOffsetsOffset + (strings.count + 1) * 4;
+    const recordsOffset = align8(stringDataOffset + strings.byteLength);
+    const outgoingOffset = recordsOffset + ordered.length * RECORD_SIZE;
+    const totalLength = align8(outgoingOffset + outgoingCount * 4);
+    if (totalLength > 0xFFFFFFFF) {
+        throw new Error('AtomSpace is too large for a version 1 snapshot');
+    }
+
+    const buffer = Buffer.alloc(totalLength);
+    buffer.write(SNAPSHOT_MAGIC, 0, 'latin1');
+    buffer.writeUInt16LE(SNAPSHOT_VERSION, 4);
+    buffer.writeUInt16LE(HEADER_SIZE, 6);
+    buffer.writeUInt32LE(ordered.length, 8);
+    buffer.writeUInt32LE(strings.count, 12);
+    buffer.writeUInt32LE(outgoingCount, 16);
+    buffer.writeUInt32LE(stringOffsetsOffset, 20);
+    buffer.writeUInt32LE(stringDataOffset, 24);
+    buffer.writeUInt32LE(recordsOffset, 28);
+    buffer.writeUInt32LE(outgoingOffset, 32);
+    buffer.writeUInt32LE(totalLength, 36);
+    buffer.writeUInt32LE(RECORD_SIZE, 40);
+
+    strings.writeTo(buffer, stringOffsetsOffset, stringDataOffset);
+
+    let nextOutgoing = 0;
+    ordered.forEach((record, index) => {
+        const offset = recordsOffset + index * RECORD_SIZE;
+        let flags = 0;
+        buffer.writeUInt32LE(strings.indexOf(record.id), offset);
+        buffer.writeUInt32LE(strings.indexOf(record.type), offset + 4);
+        buffer.writeUInt32LE(record.name !== undefined ? strings.indexOf(record.name) : NO_STRING, offset + 8);
+        buffer.writeUInt32LE(metadataJson[index] !== undefined ? strings.indexOf(metadataJson[index]!) : NO_STRING, offset + 12);
+
+        if (record.truthValue) {
+            flags |= FLAG_TRUTH_VALUE;
+            buffer.writeDoubleLE(record.truthValue.strength, offset + 32);
+            buffer.writeDoubleLE(record.truthValue.confidence, offset + 40);
+        }
+        if (record.attentionValue) {
+            flags |= FLAG_ATTENTION_VALUE;
+            buffer.writeDoubleLE(record.attentionValue.sti, offset + 48);
+            buffer.writeDoubleLE(record.attentionValue.lti, offset + 56);
+            buffer.writeDoubleLE(record.attentionValue.vlti, offset + 64);
+        }
+        buffer.writeUInt32LE(flags, offset + 16);
+
+        const outgoing = record.outgoing || [];
+        buffer.writeUInt32LE(nextOutgoing, offset + 20);
+        buffer.writeUInt32LE(outgoing.length, offset + 24);
+        for (const childId of outgoing) {
+            const childIndex = indexById.get(childId);
+            if (childIndex === undefined) {
+                throw new Error(`Atom ${record.id} links to missing atom ${childId}`);
+            }
+            buffer.writeUInt32LE(childIndex, outgoingOffset + nextOutgoing * 4);
+            nextOutgoing++;
+        }
+    });
+
+    return buffer;
+}
+
+/**
+ * Random-access view over a snapshot buffer; records are decoded only when requested
+ */
+export class AtomSnapshotReader {
+
+    readonly size: number;
+
+    private readonly stringCount: number;
+    private readonly stringOffsetsOffset: number;
+    private readonly stringDataOffset: number;
+    private readonly recordsOffset: number;
+    private readonly outgoingOffset: number;
+    private readonly typeCache = new Map<number, string>();
+
+    constructor(private readonly buffer: Buffer) {
+        if (buffer.length < HEADER_SIZE || buffer.toString('latin1', 0, 4) !== SNAPSHOT_MAGIC) {
+            throw new Error('Not an AtomSpace snapshot');
+        }
+        const version = buffer.readUInt16LE(4);
+        if (version !== SNAPSHOT_VERSION) {
+            throw new Error(`Unsupported AtomSpace snapshot version ${version}`);
+        }
+        if (buffer.readUInt32LE(36) !== buffer.length || buffer.readUInt32LE(40) !== RECORD_SIZE) {
+            throw new Error('Truncated or corrupt AtomSpace snapshot');
+        }
+        this.size = buffer.readUInt32LE(8);
+        this.stringCount = buffer.readUInt32LE(12);
+        this.stringOffsetsOffset = buffer.readUInt32LE(20);
+        this.stringDataOffset = buffer.readUInt32LE(24);
+        this.recordsOffset = buffer.readUInt32LE(28);
+        this.outgoingOffset = buffer.readUInt32LE(32);
+    }
+
+    id(index: number): string {
+        return this.string(this.buffer.readUInt32LE(this.recordOffset(index)));
+    }
+
+    record(index: number): AtomRecord {
+        const offset = this.recordOffset(index);
+        const buffer = this.buffer;
+
+        const typeIndex = buffer.readUInt32LE(offset + 4);
+        let type = this.typeCache.get(typeIndex);
+        if (type === undefined) {
+            type = this.string(typeIndex);
+            this.typeCache.set(typeIndex, type);
+        }
+        const record: AtomRecord = { id: this.string(buffer.readUInt32LE(offset)), type };
+
+        const nameIndex = buffer.readUInt32LE(offset + 8);
+        if (nameIndex !== NO_STRING) {
+            record.name = this.string(nameIndex);
+        }
+        const flags = buffer.readUInt32LE(offset + 16);
+        if (flags & FLAG_TRUTH_VALUE) {
+            record.truthValue = {
+                strength: buffer.readDoubleLE(offset + 32),
+                confidence: buffer.readDoubleLE(offset + 40)
+            };
+        }
+        if (flags & FLAG_ATTENTION_VALUE) {
+            record.attentionValue = {
+                sti: buffer.readDoubleLE(offset + 48),
+                lti: buffer.readDoubleLE(offset + 56),
+                vlti: buffer.readDoubleLE(offset + 64)
+            };
+        }
+
+        const outgoingCount = buffer.readUInt32LE(offset + 24);
+        if (outgoingCount > 0) {
+            const first = this.outgoingOffset + buffer.readUInt32LE(offset + 20) * 4;
+            record.outgoing = new Array(outgoingCount);
+            for (let i = 0; i < outgoingCount; i++) {
+                record.outgoing[i] = this.id(buffer.readUInt32LE(first + i * 4));
+            }
+        }
+        const metadataIndex = buffer.readUInt32LE(offset + 12);
+        if (metadataIndex !== NO_STRING) {
+            record.metadata = JSON.parse(this.string(metadataIndex));
+        }
+        return record;
+    }
+
+    /**
+     * Records in snapshot order, children before the links that contain them
+     */
+    *records(): IterableIterator<AtomRecord> {
+        for (let index = 0; index < this.size; index++) {
+            yield this.record(index);
+        }
+    }
+
+    private recordOffset(index: number): number {
+        if (index < 0 || index >= this.size) {
+            throw new RangeError(`Snapshot record ${index} out of range`);
+        }
+        return this.recordsOffset + index * RECORD_SIZE;
+    }
+
+    private string(index: number): string {
+        if (index >= this.stringCount) {
+            throw new RangeError(`Snapshot string ${index} out of range`);
+        }
+        const entry = this.stringOffsetsOffset + index * 4;
+        const start = this.stringDataOffset + this.buffer.readUInt32LE(entry);
+        const end = this.stringDataOffset + this.buffer.readUInt32LE(entry + 4);
+        return this.buffer.toString('utf8', start, end);
+    }
+}
+
+class StringTableBuilder {
+
+    private readonly indexes = new Map<string, number>();
+    private readonly strings: string[] = [];
+    private bytes = 0;
+
+    get count(): number {
+        return this.strings.length;
+    }
+
+    get byteLength(): number {
+        return this.bytes;
+    }
+
+    add(value: string): void {
+        if (!this.indexes.has(value)) {
+            this.indexes.set(value, this.strings.length);
+            this.strings.push(value);
+            this.bytes += Buffer.byteLength(value, 'utf8');
+        }
+    }
+
+    indexOf(value: string): number {
+        return this.indexes.get(value)!;
+    }
+
+    writeTo(buffer: Buffer, offsetsOffset: number, dataOffset: number): void {
+        let position = 0;
+        this.strings.forEach((value, index) => {
+            buffer.writeUInt32LE(position, offsetsOffset + index * 4);
+            position += buffer.write(value, dataOffset + position, 'utf8');
+        });
+        buffer.writeUInt32LE(position, offsetsOffset + this.strings.length * 4);
+    }
+}
+
+/**
+ * Order records so that every atom comes after the atoms in its outgoing set
+ */
+function childrenFirst(records: AtomRecord[]): AtomRecord[] {
+    const byId = new Map<string, AtomRecord>();
+    for (const record of records) {
+        byId.set(record.id, record);
+    }
+
+    const ordered: AtomRecord[] = [];
+    const visited = new Set<string>();
+    for (const root of records) {
+        if (visited.has(root.id)) {
+            continue;
+        }
+        visited.add(root.id);
+        const stack: Array<[AtomRecord, number]> = [[root, 0]];
+        while (stack.length > 0) {
+            const top = stack[stack.length - 1];
+            const [record, position] = top;
+            const outgoing = record.outgoing || [];
+            if (position < outgoing.length) {
+                top[1]++;
+                const child = byId.get(outgoing[position]);
+                if (child && !visited.has(child.id)) {
+                    visited.add(child.id);
+                    stack.push([child, 0]);
+                }
+            } else {
+                ordered.push(record);
+                stack.pop();
+            }
+        }
+    }
+    return ordered;
+}
+
+function align8(offset: number): number {
+    return Math.ceil(offset / 8) * 8;
+}
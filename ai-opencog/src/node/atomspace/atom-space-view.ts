@@ -0,0 +1,146 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { Atom, StoreMemoryUsage } from '../../common/opencog-types';
+import { estimateCollectionBytes, estimateIndexBytes } from '../../common/memory-estimate';
+import { AtomRecord } from './atom-record';
+import { AtomStore } from './atom-store';
+
+/**
+ * Read-consistent view of the AtomSpace as of one version.
+ *
+ * Creating a view copies nothing. Stored records are immutable, so the view reads
+ * through to the live store; before the writer changes an atom for the first time
+ * after the view was taken, it hands the view the atom's previous record (or
+ * `undefined` when the atom did not exist yet). The view therefore holds one entry
+ * per atom changed since its version, and writers never wait for readers.
+ *
+ * A view must be released when the reader is done, otherwise it keeps collecting
+ * the previous versions of changed atoms.
+ */
+export class AtomSpaceView {
+
+    private readonly preserved = new Map<string, AtomRecord | undefined>();
+    private store: AtomStore;
+    private released = false;
+
+    constructor(readonly version: number, live: AtomStore, private readonly onRelease: (view: AtomSpaceView) => void) {
+        this.store = live;
+    }
+
+    get size(): number {
+        let size = this.store.size;
+        for (const [atomId, previous] of this.preserved) {
+            size += (previous ? 1 : 0) - (this.store.has(atomId) ? 1 : 0);
+        }
+        return size;
+    }
+
+    get(atomId: string): AtomRecord | undefined {
+        this.checkReleased();
+        return this.preserved.has(atomId) ? this.preserved.get(atomId) : this.store.get(atomId);
+    }
+
+    has(atomId: string): boolean {
+        return this.get(atomId) !== undefined;
+    }
+
+    /**
+     * Records as of the view's version. The live key list is captured when iteration
+     * starts, so writes made while the iterator is suspended do not affect it.
+     */
+    *values(): IterableIterator<AtomRecord> {
+        this.checkReleased();
+        const liveIds = Array.from(this.store.keys());
+        const removed: AtomRecord[] = [];
+        for (const [atomId, previous] of this.preserved) {
+            if (previous && !this.store.has(atomId)) {
+                removed.push(previous);
+            }
+        }
+
+        yield* removed;
+        for (const atomId of liveIds) {
+            const record = this.get(atomId);
+            if (record) {
+                yield record;
+            }
+        }
+    }
+
+    /**
+     * Materialize an atom as of the view's version, resolving outgoing IDs to atoms
+     */
+    getAtom(atomId: string): Atom | undefined {
+        const record = this.get(atomId);
+        if (!record) {
+            return undefined;
+        }
+        const { outgoing, ...fields } = record;
+        if (!outgoing) {
+            return fields;
+        }
+        const children: Atom[] = [];
+        for (const childId of outgoing) {
+            const child = this.getAtom(childId);
+            if (child) {
+                children.push(child);
+            }
+        }
+        return { ...fields, outgoing: children };
+    }
+
+    /**
+     * Preserved previous versions and their estimated size; the view is their only holder
+     */
+    memoryUsage(): StoreMemoryUsage {
+        const records = Array.from(this.preserved.values()).filter((record): record is AtomRecord => record !== undefined);
+        return {
+            entries: this.preserved.size,
+            bytes: estimateIndexBytes(this.preserved, true) + estimateCollectionBytes(records, records.length)
+        };
+    }
+
+    release(): void {
+        if (!this.released) {
+            this.released = true;
+            this.preserved.clear();
+            this.onRelease(this);
+        }
+    }
+
+    /**
+     * Keep the state an atom had at this view's version; called by the writer before the atom changes
+     */
+    preserve(atomId: string, previous: AtomRecord | undefined): void {
+        if (!this.preserved.has(atomId)) {
+            this.preserved.set(atomId, previous);
+        }
+    }
+
+    /**
+     * Stop reading through to a store that the writer has replaced and will no longer change
+     */
+    detach(frozen: AtomStore): void {
+        this.store = frozen;
+    }
+
+    private checkReleased(): void {
+        if (this.released) {
+            throw new Error(`AtomSpace view ${this.version} has been released`);
+        }
+    }
+}
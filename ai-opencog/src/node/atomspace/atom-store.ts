@@ -0,0 +1,447 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { AtomRecord } from './atom-record';
+
+/**
+ * Storage engine behind the AtomSpace. A plain `Map<string, AtomRecord>` satisfies
+ * this interface and is the default engine; `ColumnarAtomStore` is the compact one.
+ */
+export interface AtomStore {
+    readonly size: number;
+    get(atomId: string): AtomRecord | undefined;
+    has(atomId: string): boolean;
+    set(atomId: string, record: AtomRecord): unknown;
+    delete(atomId: string): boolean;
+    values(): IterableIterator<AtomRecord>;
+    keys(): IterableIterator<string>;
+    clear(): void;
+}
+
+export type AtomStoreKind = 'map' | 'columnar';
+
+const FLAG_LIVE = 1;
+const FLAG_TRUTH_VALUE = 2;
+const FLAG_ATTENTION_VALUE = 4;
+const FLAG_CUSTOM_ID = 8;
+const FLAG_NAME = 16;
+
+const NO_ROW = -1;
+const GENERATED_ID = /^atom_(0|[1-9]\d{0,8})$/;
+const MAX_NUMERIC_ID = 1 << 26;
+/** The dense ID lookup grows to at most this many slots per row of capacity */
+const MAX_ID_SPREAD = 8;
+const MIN_COMPACT_BYTES = 1 << 16;
+const KNOWN_FIELDS = new Set(['id', 'type', 'name', 'truthValue', 'attentionValue', 'outgoing', 'metadata']);
+
+/**
+ * Column-oriented atom store with a fixed per-atom layout.
+ *
+ * Every atom occupies one row across typed-array columns: numeric ID, interned type,
+ * name-table offset and length, strength, confidence, STI, LTI and VLTI. Names are kept
+ * as UTF-8 in a single byte table that is compacted once half of it is garbage. IDs of
+ * the generated `atom_<n>` form are kept as numbers and rebuilt on read; outgoing sets
+ * are stored as row numbers; metadata and any non-standard fields live in sparse side tables.
+ * `get` and `values` return short-lived plain `AtomRecord` views of a row.
+ *
+ * Truth and attention values are held in single precision.
+ */
+export class ColumnarAtomStore implements AtomStore {
+
+    private static readonly INITIAL_CAPACITY = 1024;
+
+    private capacity = 0;
+    private highWater = 0;
+    private liveCount = 0;
+    private freeRows: number[] = [];
+
+    private flags = new Uint8Array(0);
+    private numericIds = new Uint32Array(0);
+    private typeIds = new Uint16Array(0);
+    private nameOffsets = new Uint32Array(0);
+    private nameLengths = new Uint32Array(0);
+    private strength = new Float32Array(0);
+    private confidence = new Float32Array(0);
+    private sti = new Float32Array(0);
+    private lti = new Float32Array(0);
+    private vlti = new Float32Array(0);
+
+    private rowByNumericId = new Int32Array(0);
+    /** Rows of numeric IDs too far apart for the dense lookup */
+    private readonly rowBySparseId = new Map<number, number>();
+    private readonly rowByCustomId = new Map<string, number>();
+    private readonly customIds = new Map<number, string>();
+
+    private readonly typeTable: string[] = [];
+    private readonly typeLookup = new Map<string, number>();
+
+    private nameBytes = new Uint8Array(0);
+    private nameBytesUsed = 0;
+    private nameBytesGarbage = 0;
+    private readonly encoder = new TextEncoder();
+    private readonly decoder = new TextDecoder();
+
+    private readonly outgoingRows = new Map<number, Uint32Array>();
+    private readonly metadata = new Map<number, Record<string, any>>();
+    private readonly extraFields = new Map<number, Record<string, any>>();
+
+    constructor() {
+        this.grow(ColumnarAtomStore.INITIAL_CAPACITY);
+    }
+
+    get size(): number {
+        return this.liveCount;
+    }
+
+    has(atomId: string): boolean {
+        return this.rowOf(atomId) !== NO_ROW;
+    }
+
+    get(atomId: string): AtomRecord | undefined {
+        const row = this.rowOf(atomId);
+        return row === NO_ROW ? undefined : this.view(row, atomId);
+    }
+
+    set(atomId: string, record: AtomRecord): this {
+        let row = this.rowOf(atomId);
+        if (row === NO_ROW) {
+            row = this.allocateRow(atomId);
+        } else {
+            this.releaseRowData(row);
+        }
+        this.writeRow(row, record);
+        return this;
+    }
+
+    delete(atomId: string): boolean {
+        const row = this.rowOf(atomId);
+        if (row === NO_ROW) {
+            return false;
+        }
+
+        this.releaseRowData(row);
+        if (this.flags[row] & FLAG_CUSTOM_ID) {
+            this.rowByCustomId.delete(atomId);
+            this.customIds.delete(row);
+        } else {
+            this.unmapNumericId(this.numericIds[row]);
+        }
+        this.flags[row] = 0;
+        this.freeRows.push(row);
+        this.liveCount--;
+        return true;
+    }
+
+    *values(): IterableIterator<AtomRecord> {
+        for (let row = 0; row < this.highWater; row++) {
+            if (this.flags[row] & FLAG_LIVE) {
+                yield this.view(row, this.idOf(row));
+            }
+        }
+    }
+
+    *keys(): IterableIterator<string> {
+        for (let row = 0; row < this.highWater; row++) {
+            if (this.flags[row] & FLAG_LIVE) {
+                yield this.idOf(row);
+            }
+        }
+    }
+
+    clear(): void {
+        this.capacity = 0;
+        this.highWater = 0;
+        this.liveCount = 0;
+        this.freeRows = [];
+        this.rowByNumericId = new Int32Array(0);
+        this.rowBySparseId.clear();
+        this.rowByCustomId.clear();
+        this.customIds.clear();
+        this.typeTable.length = 0;
+        this.typeLookup.clear();
+        this.nameBytes = new Uint8Array(0);
+        this.nameBytesUsed = 0;
+        this.nameBytesGarbage = 0;
+        this.outgoingRows.clear();
+        this.metadata.clear();
+        this.extraFields.clear();
+        this.grow(ColumnarAtomStore.INITIAL_CAPACITY);
+    }
+
+    /**
+     * Bytes held by the typed-array columns, the name table and lookup arrays
+     */
+    get columnBytes(): number {
+        let bytes = this.flags.byteLength + this.numericIds.byteLength + this.typeIds.byteLength +
+            this.nameOffsets.byteLength + this.nameLengths.byteLength + this.strength.byteLength +
+            this.confidence.byteLength + this.sti.byteLength + this.lti.byteLength + this.vlti.byteLength +
+            this.rowByNumericId.byteLength + this.nameBytes.byteLength;
+        for (const rows of this.outgoingRows.values()) {
+            bytes += rows.byteLength;
+        }
+        return bytes;
+    }
+
+    private rowOf(atomId: string): number {
+        const numericId = ColumnarAtomStore.parseNumericId(atomId);
+        if (numericId !== undefined) {
+            const row = numericId < this.rowByNumericId.length ? this.rowByNumericId[numericId] : NO_ROW;
+            return row !== NO_ROW ? row : this.rowBySparseId.get(numericId) ?? NO_ROW;
+        }
+        return this.rowByCustomId.get(atomId) ?? NO_ROW;
+    }
+
+    private idOf(row: number): string {
+        return this.flags[row] & FLAG_CUSTOM_ID ? this.customIds.get(row)! : `atom_${this.numericIds[row]}`;
+    }
+
+    private allocateRow(atomId: string): number {
+        let row = this.freeRows.pop();
+        if (row === undefined) {
+            if (this.highWater >= this.capacity) {
+                this.grow(this.capacity * 2);
+            }
+            row = this.highWater++;
+        }
+
+        const numericId = ColumnarAtomStore.parseNumericId(atomId);
+        if (numericId !== undefined) {
+            this.mapNumericId(numericId, row);
+            this.numericIds[row] = numericId;
+            this.flags[row] = FLAG_LIVE;
+        } else {
+            this.rowByCustomId.set(atomId, row);
+            this.customIds.set(row, atomId);
+            this.numericIds[row] = 0;
+            this.flags[row] = FLAG_LIVE | FLAG_CUSTOM_ID;
+        }
+        this.liveCount++;
+        return row;
+    }
+
+    private writeRow(row: number, record: AtomRecord): void {
+        let flags = this.flags[row] & (FLAG_LIVE | FLAG_CUSTOM_ID);
+
+        this.typeIds[row] = this.internType(record.type);
+        if (record.name !== undefined) {
+            flags |= FLAG_NAME;
+            this.writeName(row, record.name);
+        }
+
+        if (record.truthValue) {
+            flags |= FLAG_TRUTH_VALUE;
+            this.strength[row] = record.truthValue.strength;
+            this.confidence[row] = record.truthValue.confidence;
+        }
+        if (record.attentionValue) {
+            flags |= FLAG_ATTENTION_VALUE;
+            this.sti[row] = record.attentionValue.sti;
+            this.lti[row] = record.attentionValue.lti;
+            this.vlti[row] = record.attentionValue.vlti;
+        }
+        this.flags[row] = flags;
+
+        if (record.outgoing) {
+            const rows = new Uint32Array(record.outgoing.length);
+            record.outgoing.forEach((childId, i) => {
+                const childRow = this.rowOf(childId);
+                if (childRow === NO_ROW) {
+                    throw new Error(`Outgoing atom ${childId} is not stored`);
+                }
+                rows[i] = childRow;
+            });
+            this.outgoingRows.set(row, rows);
+        }
+        if (record.metadata !== undefined) {
+            this.metadata.set(row, record.metadata);
+        }
+
+        let extras: Record<string, any> | undefined;
+        for (const key of Object.keys(record)) {
+            if (!KNOWN_FIELDS.has(key)) {
+                extras = extras || {};
+                extras[key] = (record as Record<string, any>)[key];
+            }
+        }
+        if (extras) {
+            this.extraFields.set(row, extras);
+        }
+    }
+
+    /**
+     * Drop the side-table entries and name bytes held by a row before it is rewritten or freed
+     */
+    private releaseRowData(row: number): void {
+        if (this.flags[row] & FLAG_NAME) {
+            this.nameBytesGarbage += this.nameLengths[row];
+            this.nameLengths[row] = 0;
+        }
+        this.outgoingRows.delete(row);
+        this.metadata.delete(row);
+        this.extraFields.delete(row);
+    }
+
+    private view(row: number, atomId: string): AtomRecord {
+        const flags = this.flags[row];
+        const record: AtomRecord = { id: atomId, type: this.typeTable[this.typeIds[row]] };
+
+        if (flags & FLAG_NAME) {
+            record.name = this.readName(row);
+        }
+        if (flags & FLAG_TRUTH_VALUE) {
+            record.truthValue = { strength: this.strength[row], confidence: this.confidence[row] };
+        }
+        if (flags & FLAG_ATTENTION_VALUE) {
+            record.attentionValue = { sti: this.sti[row], lti: this.lti[row], vlti: this.vlti[row] };
+        }
+
+        const outgoing = this.outgoingRows.get(row);
+        if (outgoing) {
+            record.outgoing = Array.from(outgoing, childRow => this.idOf(childRow));
+        }
+        const metadata = this.metadata.get(row);
+        if (metadata !== undefined) {
+            record.metadata = metadata;
+        }
+        const extras = this.extraFields.get(row);
+        return extras ? { ...extras, ...record } : record;
+    }
+
+    private internType(type: string): number {
+        let typeId = this.typeLookup.get(type);
+        if (typeId === undefined) {
+            if (this.typeTable.length >= 0xFFFF) {
+                throw new Error('Columnar atom store supports at most 65535 atom types');
+            }
+            typeId = this.typeTable.length;
+            this.typeTable.push(type);
+            this.typeLookup.set(type, typeId);
+        }
+        return typeId;
+    }
+
+    private readName(row: number): string {
+        const offset = this.nameOffsets[row];
+        return this.decoder.decode(this.nameBytes.subarray(offset, offset + this.nameLengths[row]));
+    }
+
+    private writeName(row: number, name: string): void {
+        // UTF-8 needs at most three bytes per UTF-16 code unit
+        const maxBytes = name.length * 3;
+        if (this.nameBytesUsed + maxBytes > this.nameBytes.length) {
+            this.reserveNameBytes(maxBytes);
+        }
+        const { written } = this.encoder.encodeInto(name, this.nameBytes.subarray(this.nameBytesUsed));
+        this.nameOffsets[row] = this.nameBytesUsed;
+        this.nameLengths[row] = written!;
+        this.nameBytesUsed += written!;
+    }
+
+    /**
+     * Make room for `needed` more name bytes, compacting the table first when at least
+     * half of it belongs to overwritten or deleted names
+     */
+    private reserveNameBytes(needed: number): void {
+        if (this.nameBytesGarbage >= MIN_COMPACT_BYTES && this.nameBytesGarbage * 2 >= this.nameBytesUsed) {
+            this.compactNames();
+        }
+        if (this.nameBytesUsed + needed <= this.nameBytes.length) {
+            return;
+        }
+        const bytes = new Uint8Array(Math.max(this.nameBytes.length * 2, this.nameBytesUsed + needed, 4096));
+        bytes.set(this.nameBytes.subarray(0, this.nameBytesUsed));
+        this.nameBytes = bytes;
+    }
+
+    private compactNames(): void {
+        const bytes = new Uint8Array(this.nameBytes.length);
+        let used = 0;
+        for (let row = 0; row < this.highWater; row++) {
+            if ((this.flags[row] & (FLAG_LIVE | FLAG_NAME)) === (FLAG_LIVE | FLAG_NAME)) {
+                const offset = this.nameOffsets[row];
+                const length = this.nameLengths[row];
+                bytes.set(this.nameBytes.subarray(offset, offset + length), used);
+                this.nameOffsets[row] = used;
+                used += length;
+            }
+        }
+        this.nameBytes = bytes;
+        this.nameBytesUsed = used;
+        this.nameBytesGarbage = 0;
+    }
+
+    private grow(capacity: number): void {
+        this.flags = ColumnarAtomStore.resize(this.flags, new Uint8Array(capacity));
+        this.numericIds = ColumnarAtomStore.resize(this.numericIds, new Uint32Array(capacity));
+        this.typeIds = ColumnarAtomStore.resize(this.typeIds, new Uint16Array(capacity));
+        this.nameOffsets = ColumnarAtomStore.resize(this.nameOffsets, new Uint32Array(capacity));
+        this.nameLengths = ColumnarAtomStore.resize(this.nameLengths, new Uint32Array(capacity));
+        this.strength = ColumnarAtomStore.resize(this.strength, new Float32Array(capacity));
+        this.confidence = ColumnarAtomStore.resize(this.confidence, new Float32Array(capacity));
+        this.sti = ColumnarAtomStore.resize(this.sti, new Float32Array(capacity));
+        this.lti = ColumnarAtomStore.resize(this.lti, new Float32Array(capacity));
+        this.vlti = ColumnarAtomStore.resize(this.vlti, new Float32Array(capacity));
+        this.capacity = capacity;
+    }
+
+    /**
+     * Record the row of a numeric ID in the dense lookup, growing it while IDs stay
+     * compact relative to the row capacity, or in the sparse map otherwise
+     */
+    private mapNumericId(numericId: number, row: number): void {
+        if (numericId >= this.rowByNumericId.length) {
+            const limit = this.capacity * MAX_ID_SPREAD;
+            if (numericId >= limit) {
+                this.rowBySparseId.set(numericId, row);
+                return;
+            }
+            const lookup = new Int32Array(Math.min(Math.max(numericId + 1, this.rowByNumericId.length * 2, 1024), limit));
+            lookup.fill(NO_ROW);
+            lookup.set(this.rowByNumericId);
+            this.rowByNumericId = lookup;
+        }
+        this.rowByNumericId[numericId] = row;
+    }
+
+    private unmapNumericId(numericId: number): void {
+        if (numericId < this.rowByNumericId.length && this.rowByNumericId[numericId] !== NO_ROW) {
+            this.rowByNumericId[numericId] = NO_ROW;
+        } else {
+            this.rowBySparseId.delete(numericId);
+        }
+    }
+
+    private static resize<T extends Uint8Array | Uint16Array | Uint32Array | Float32Array>(previous: T, next: T): T {
+        next.set(previous as ArrayLike<number>);
+        return next;
+    }
+
+    private static parseNumericId(atomId: string): number | undefined {
+        const match = GENERATED_ID.exec(atomId);
+        if (!match) {
+            return undefined;
+        }
+        const numericId = Number(match[1]);
+        return numericId < MAX_NUMERIC_ID ? numericId : undefined;
+    }
+}
+
+/**
+ * Create the storage engine selected by kind
+ */
+export function createAtomStore(kind: AtomStoreKind = 'map'): AtomStore {
+    return kind === 'columnar' ? new ColumnarAtomStore() : new Map<string, AtomRecord>();
+}
@@ -0,0 +1,206 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { Atom, AtomSpaceTransferProgress } from '../../common/opencog-types';
+import { AtomRecord } from './atom-record';
+
+/**
+ * Options for streaming AtomSpace export and import
+ */
+export interface AtomStreamOptions {
+    /** Atoms per NDJSON chunk, and per event-loop turn when importing */
+    batchSize?: number;
+    onProgress?: (progress: AtomSpaceTransferProgress) => void;
+}
+
+export const DEFAULT_STREAM_BATCH_SIZE = 1000;
+
+/**
+ * Let pending I/O and RPC callbacks run between batches
+ */
+export function yieldToEventLoop(): Promise<void> {
+    return new Promise(resolve => setImmediate(resolve));
+}
+
+/**
+ * Encode stored records as NDJSON, one record per line with links referencing their
+ * outgoing set by ID. Chunks are produced on demand, so a slow consumer holds back
+ * the producer, and the event loop is released after every chunk.
+ */
+export async function* encodeAtomRecords(records: Iterable<AtomRecord>, total: number, options: AtomStreamOptions = {}): AsyncIterableIterator<string> {
+    const batchSize = options.batchSize || DEFAULT_STREAM_BATCH_SIZE;
+    let lines: string[] = [];
+    let processed = 0;
+
+    for (const record of records) {
+        lines.push(JSON.stringify(record));
+        if (lines.length >= batchSize) {
+            processed += lines.length;
+            yield `${lines.join('\n')}\n`;
+            lines = [];
+            options.onProgress?.({ processed, total });
+            await yieldToEventLoop();
+        }
+    }
+    if (lines.length > 0) {
+        processed += lines.length;
+        yield `${lines.join('\n')}\n`;
+        options.onProgress?.({ processed, total });
+    }
+}
+
+/**
+ * Splits pushed text chunks into complete lines, carrying partial lines over to the next chunk
+ */
+export class NdjsonLineBuffer {
+
+    private partial = '';
+
+    push(chunk: string): string[] {
+        const text = this.partial + chunk;
+        const lines = text.split('\n');
+        this.partial = lines.pop()!;
+        return lines.filter(line => line.trim().length > 0);
+    }
+
+    flush(): string[] {
+        const rest = this.partial.trim();
+        this.partial = '';
+        return rest ? [rest] : [];
+    }
+}
+
+/**
+ * Lines of an NDJSON byte or text stream
+ */
+export async function* readNdjsonLines(source: AsyncIterable<string | Uint8Array>): AsyncIterableIterator<string> {
+    const decoder = new TextDecoder();
+    const buffer = new NdjsonLineBuffer();
+    for await (const chunk of source) {
+        yield* buffer.push(typeof chunk === 'string' ? chunk : decoder.decode(chunk, { stream: true }));
+    }
+    yield* buffer.push(decoder.decode());
+    yield* buffer.flush();
+}
+
+/**
+ * Destination of streamed atoms
+ */
+export interface AtomStreamSink {
+    has(atomId: string): boolean;
+    /** Store a record whose outgoing atoms are all present */
+    storeRecord(record: AtomRecord): void;
+    /** Add an atom in nested form, as produced by the JSON export */
+    addAtom(atom: Atom): void;
+}
+
+/**
+ * Feeds parsed NDJSON lines into a sink. A link may arrive before the atoms it
+ * points to; it is parked until all of them have been stored.
+ */
+export class AtomStreamImporter {
+
+    private readonly waiting = new Map<string, AtomRecord[]>();
+    private readonly missingCounts = new Map<AtomRecord, number>();
+    private lineNumber = 0;
+
+    constructor(private readonly sink: AtomStreamSink) { }
+
+    get processed(): number {
+        return this.lineNumber;
+    }
+
+    acceptLine(line: string): void {
+        this.lineNumber++;
+        let parsed: Atom | AtomRecord;
+        try {
+            parsed = JSON.parse(line);
+        } catch (error) {
+            throw new Error(`Invalid atom on line ${this.lineNumber}: ${error}`);
+        }
+        if (!parsed || typeof parsed.type !== 'string') {
+            throw new Error(`Invalid atom on line ${this.lineNumber}: missing type`);
+        }
+        this.accept(parsed);
+    }
+
+    accept(atom: Atom | AtomRecord): void {
+        const outgoing = atom.outgoing as unknown[] | undefined;
+        if (!atom.id || (outgoing && outgoing.some(child => typeof child !== 'string'))) {
+            this.sink.addAtom(atom as Atom);
+            if (atom.id) {
+                this.release(atom.id);
+            }
+            return;
+        }
+
+        const record = atom as AtomRecord;
+        const missing = new Set((record.outgoing || []).filter(childId => !this.sink.has(childId)));
+        if (missing.size === 0) {
+            this.store(record);
+            return;
+        }
+        this.missingCounts.set(record, missing.size);
+        for (const childId of missing) {
+            const records = this.waiting.get(childId);
+            if (records) {
+                records.push(record);
+            } else {
+                this.waiting.set(childId, [record]);
+            }
+        }
+    }
+
+    /**
+     * Verify that every parked link was resolved
+     */
+    finish(): void {
+        if (this.waiting.size > 0) {
+            const missing = Array.from(this.waiting.keys()).slice(0, 5).join(', ');
+            throw new Error(`Links reference atoms missing from the stream: ${missing}`);
+        }
+    }
+
+    private store(record: AtomRecord): void {
+        this.sink.storeRecord(record);
+        this.release(record.id);
+    }
+
+    /**
+     * Store the parked links that were only waiting for `atomId`
+     */
+    private release(atomId: string): void {
+        const stack = [atomId];
+        while (stack.length > 0) {
+            const id = stack.pop()!;
+            const records = this.waiting.get(id);
+            if (!records) {
+                continue;
+            }
+            this.waiting.delete(id);
+            for (const record of records) {
+                const remaining = this.missingCounts.get(record)! - 1;
+                if (remaining > 0) {
+                    this.missingCounts.set(record, remaining);
+                } else {
+                    this.missingCounts.delete(record);
+                    this.sink.storeRecord(record);
+                    stack.push(record.id);
+                }
+            }
+        }
+    }
+}
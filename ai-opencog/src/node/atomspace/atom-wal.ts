@@ -0,0 +1,278 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { promises as fs, closeSync, fdatasyncSync, openSync, writeSync } from 'fs';
+import * as path from 'path';
+import { AttentionValue } from '../../common/opencog-types';
+import { AtomRecord } from './atom-record';
+
+/**
+ * One logged AtomSpace mutation. Entries carry the resulting state rather than the
+ * requested change, so replaying an entry twice is harmless.
+ */
+export type WalEntry =
+    | { op: 'put'; record: AtomRecord }
+    | { op: 'remove'; id: string }
+    | { op: 'clear' }
+    /** The attention value an attention cycle left an atom with */
+    | { op: 'attention'; id: string; attentionValue: AttentionValue };
+
+export interface WriteAheadLogOptions {
+    /** Window in which appended entries are gathered into one write and one sync */
+    groupCommitMs?: number;
+    /** Logged entries after which the log is folded into a fresh snapshot */
+    compactAfterEntries?: number;
+}
+
+/**
+ * Durable state found in the log directory: the last snapshot and the entries logged after it
+ */
+export interface WalRecovery {
+    snapshot?: Buffer;
+    entries: WalEntry[];
+}
+
+export const WAL_SNAPSHOT_FILE = 'atomspace.ocas';
+
+const SEGMENT_FILE = /^atomspace-(\d+)\.wal$/;
+
+/**
+ * Append-only log of AtomSpace mutations, kept as NDJSON segment files next to a
+ * binary snapshot.
+ *
+ * `append` only queues the entry; entries are serialized, written and synced in
+ * batches from a timer, so a mutation never waits for the disk and a burst of
+ * mutations costs one `fdatasync`. `flush` resolves once everything appended so far
+ * is durable. Compaction seals the current segment, writes a snapshot captured at
+ * that point and deletes the sealed segments, so recovery reads one snapshot plus
+ * the entries logged since.
+ */
+export class AtomWriteAheadLog {
+
+    private readonly groupCommitMs: number;
+    private readonly compactAfterEntries: number;
+
+    private pending: WalEntry[] = [];
+    /** Entries taken by a write that has not been synced yet */
+    private writing: WalEntry[] = [];
+    private flushTimer: ReturnType<typeof setTimeout> | undefined;
+    private queue: Promise<void> = Promise.resolve();
+    private segmentFile: fs.FileHandle | undefined;
+    private segment = 0;
+    private loggedSinceSnapshot = 0;
+    private compacting = false;
+
+    constructor(private readonly directory: string, private readonly captureSnapshot: () => Buffer, options: WriteAheadLogOptions = {}) {
+        this.groupCommitMs = options.groupCommitMs ?? 5;
+        this.compactAfterEntries = options.compactAfterEntries ?? 100000;
+    }
+
+    /**
+     * Read the snapshot and the logged entries. A partially written last line, left
+     * by a crash in the middle of a write, is dropped; any other damage is an error.
+     */
+    async recover(): Promise<WalRecovery> {
+        await fs.mkdir(this.directory, { recursive: true });
+        let snapshot: Buffer | undefined;
+        try {
+            snapshot = await fs.readFile(this.snapshotPath());
+        } catch (error) {
+            if ((error as NodeJS.ErrnoException).code !== 'ENOENT') {
+                throw error;
+            }
+        }
+
+        const segments = await this.listSegments();
+        const entries: WalEntry[] = [];
+        for (const segment of segments) {
+            const lines = (await fs.readFile(this.segmentPath(segment), 'utf8')).split('\n');
+            const lastSegment = segment === segments[segments.length - 1];
+            for (let i = 0; i < lines.length; i++) {
+                if (lines[i].length === 0) {
+                    continue;
+                }
+                try {
+                    entries.push(JSON.parse(lines[i]));
+                } catch (error) {
+                    if (lastSegment && lines.slice(i + 1).every(line => line.length === 0)) {
+                        break;
+                    }
+                    throw new Error(`Corrupt write-ahead log ${this.segmentPath(segment)} at line ${i + 1}: ${error}`);
+                }
+            }
+        }
+        this.segment = segments.length > 0 ? segments[segments.length - 1] : 0;
+        this.loggedSinceSnapshot = entries.length;
+        return { snapshot, entries };
+    }
+
+    /**
+     * Start a new segment for appended entries; call after `recover`
+     */
+    async open(): Promise<void> {
+        this.segment++;
+        this.segmentFile = await fs.open(this.segmentPath(this.segment), 'a');
+    }
+
+    append(entry: WalEntry): void {
+        this.pending.push(entry);
+        this.loggedSinceSnapshot++;
+        if (this.loggedSinceSnapshot >= this.compactAfterEntries && !this.compacting) {
+            this.compact().catch(error => console.error('AtomSpace log compaction failed:', error));
+        } else if (!this.compacting) {
+            this.scheduleFlush();
+        }
+    }
+
+    /**
+     * Write and sync every entry appended so far
+     */
+    flush(): Promise<void> {
+        this.cancelTimer();
+        return this.enqueue(() => this.writePending());
+    }
+
+    /**
+     * Replace the logged history with a snapshot of the current state. The snapshot is
+     * captured synchronously once the entries before it are durable, so no mutation
+     * falls between the sealed segments and the snapshot.
+     */
+    compact(): Promise<void> {
+        this.compacting = true;
+        this.cancelTimer();
+        return this.enqueue(async () => {
+            try {
+                await this.writePending();
+                const snapshot = this.captureSnapshot();
+                const sealed = this.segment;
+                await this.segmentFile!.close();
+                this.segment++;
+                this.segmentFile = await fs.open(this.segmentPath(this.segment), 'a');
+                this.loggedSinceSnapshot = this.pending.length;
+
+                const temporaryPath = `${this.snapshotPath()}.tmp`;
+                const file = await fs.open(temporaryPath, 'w');
+                try {
+                    await file.writeFile(snapshot);
+                    await file.sync();
+                } finally {
+                    await file.close();
+                }
+                await fs.rename(temporaryPath, this.snapshotPath());
+
+                for (const segment of await this.listSegments()) {
+                    if (segment <= sealed) {
+                        await fs.unlink(this.segmentPath(segment));
+                    }
+                }
+            } finally {
+                this.compacting = false;
+                // Entries appended during compaction were held back
+                if (this.pending.length > 0) {
+                    this.scheduleFlush();
+                }
+            }
+        });
+    }
+
+    async close(): Promise<void> {
+        await this.flush();
+        await this.enqueue(async () => {
+            await this.segmentFile?.close();
+            this.segmentFile = undefined;
+        });
+    }
+
+    /**
+     * Write and sync everything appended so far without returning to the event loop,
+     * for shutdown paths that cannot wait. Entries of a write still in progress are
+     * written again ahead of the pending ones; replaying an entry twice is harmless.
+     * Nothing may be appended afterwards.
+     */
+    closeSync(): void {
+        this.cancelTimer();
+        const batch = [...this.writing, ...this.pending];
+        this.pending = [];
+        if (batch.length === 0 || this.segment === 0) {
+            return;
+        }
+        const fd = openSync(this.segmentPath(this.segment), 'a');
+        try {
+            writeSync(fd, AtomWriteAheadLog.serialize(batch));
+            fdatasyncSync(fd);
+        } finally {
+            closeSync(fd);
+        }
+    }
+
+    private async writePending(): Promise<void> {
+        if (this.pending.length === 0 || !this.segmentFile) {
+            return;
+        }
+        this.writing = this.pending;
+        this.pending = [];
+        await this.segmentFile.write(AtomWriteAheadLog.serialize(this.writing));
+        await this.segmentFile.datasync();
+        this.writing = [];
+    }
+
+    private static serialize(entries: WalEntry[]): string {
+        return `${entries.map(entry => JSON.stringify(entry)).join('\n')}\n`;
+    }
+
+    /**
+     * Run file operations one at a time, in call order
+     */
+    private enqueue(operation: () => Promise<void>): Promise<void> {
+        const result = this.queue.then(operation);
+        this.queue = result.catch(() => undefined);
+        return result;
+    }
+
+    private scheduleFlush(): void {
+        if (!this.flushTimer) {
+            this.flushTimer = setTimeout(() => {
+                this.flush().catch(error => console.error('AtomSpace log write failed:', error));
+            }, this.groupCommitMs);
+        }
+    }
+
+    private cancelTimer(): void {
+        if (this.flushTimer) {
+            clearTimeout(this.flushTimer);
+            this.flushTimer = undefined;
+        }
+    }
+
+    private async listSegments(): Promise<number[]> {
+        const segments: number[] = [];
+        for (const file of await fs.readdir(this.directory)) {
+            const match = SEGMENT_FILE.exec(file);
+            if (match) {
+                segments.push(Number(match[1]));
+            }
+        }
+        return segments.sort((a, b) => a - b);
+    }
+
+    private segmentPath(segment: number): string {
+        return path.join(this.directory, `atomspace-${segment}.wal`);
+    }
+
+    private snapshotPath(): string {
+        return path.join(this.directory, WAL_SNAPSHOT_FILE);
+    }
+}
@@ -0,0 +1,299 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { AttentionValue } from '../../common/opencog-types';
+import { AtomRecord } from './atom-record';
+import { yieldToEventLoop } from './atom-stream';
+
+/**
+ * AtomSpace access needed by the attention allocator
+ */
+export interface AttentionBank {
+    size(): number;
+    keys(): IterableIterator<string>;
+    get(atomId: string): AtomRecord | undefined;
+    incoming(atomId: string): ReadonlySet<string>;
+    /** Up to `limit` atom IDs with the highest STI */
+    highestSti(limit: number): string[];
+    /** Up to `limit` atom IDs with the lowest LTI, among atoms that have an attention value */
+    lowestLti(limit: number): string[];
+    /** Update an atom's attention value without reporting it as a change or feeding it to inference */
+    setAttention(atomId: string, attention: AttentionValue): void;
+    /** Remove an atom that no link points to */
+    forget(atomId: string): void;
+    /** Called once a cycle has finished, so attention changes can be journaled together */
+    endCycle(): void;
+}
+
+export interface AttentionAllocationOptions {
+    /** Fraction of STI lost per cycle */
+    stiDecay?: number;
+    /** Fraction of LTI lost per cycle */
+    ltiDecay?: number;
+    /** Fraction of the remaining STI added to LTI per cycle, so atoms that stay in focus are kept */
+    ltiGain?: number;
+    /** Fraction of a focus atom's STI passed on to its neighbours per cycle */
+    spreadFraction?: number;
+    /** Atoms with the highest STI that spread importance each cycle */
+    focusSize?: number;
+    /** Number of atoms above which the lowest-LTI atoms are forgotten; unlimited when unset */
+    maxAtoms?: number;
+    /** Milliseconds of work per time slice before yielding to the event loop */
+    sliceMs?: number;
+    /** Delay between the end of one cycle and the start of the next */
+    cycleIntervalMs?: number;
+}
+
+/**
+ * Outcome of one attention cycle
+ */
+export interface AttentionCycleStats {
+    spreadFrom: number;
+    decayed: number;
+    forgotten: number;
+    slices: number;
+    durationMs: number;
+}
+
+/** STI below this magnitude is rounded down to zero */
+const NEGLIGIBLE_STI = 1e-3;
+/** LTI below this magnitude is rounded down to zero, so decayed atoms stop being rewritten */
+const NEGLIGIBLE_LTI = 1e-3;
+/** Work units between clock checks */
+const CLOCK_CHECK_INTERVAL = 64;
+
+/**
+ * Economic attention allocation in the style of OpenCog's ECAN.
+ *
+ * Each cycle:
+ * 1. spreads a fraction of the STI of the atoms in the attentional focus evenly over
+ *    their incoming and outgoing atoms, so importance flows along links;
+ * 2. decays STI and LTI of every atom, folding part of the remaining STI into LTI;
+ * 3. when the AtomSpace holds more than `maxAtoms`, forgets atoms in order of
+ *    importance: atoms without an attention value first (they count as LTI 0), then
+ *    the lowest LTI. Atoms with a VLTI above zero or with links pointing to them are
+ *    kept; the links become candidates themselves.
+ *
+ * The cycle runs as a sequence of small time slices that yield to the event loop,
+ * so RPC calls are served between slices.
+ */
+export class AttentionAllocator {
+
+    private readonly stiDecay: number;
+    private readonly ltiDecay: number;
+    private readonly ltiGain: number;
+    private readonly spreadFraction: number;
+    private readonly focusSize: number;
+    private readonly maxAtoms: number;
+    private readonly sliceMs: number;
+    private readonly cycleIntervalMs: number;
+
+    private running = false;
+    private cycleTimer: ReturnType<typeof setTimeout> | undefined;
+    private currentCycle: Promise<AttentionCycleStats> | undefined;
+
+    constructor(private readonly bank: AttentionBank, options: AttentionAllocationOptions = {}) {
+        this.stiDecay = options.stiDecay ?? 0.1;
+        this.ltiDecay = options.ltiDecay ?? 0.01;
+        this.ltiGain = options.ltiGain ?? 0.05;
+        this.spreadFraction = options.spreadFraction ?? 0.2;
+        this.focusSize = options.focusSize ?? 100;
+        this.maxAtoms = options.maxAtoms ?? Infinity;
+        this.sliceMs = options.sliceMs ?? 5;
+        this.cycleIntervalMs = options.cycleIntervalMs ?? 10000;
+    }
+
+    get active(): boolean {
+        return this.running;
+    }
+
+    /**
+     * Run cycles continuously, `cycleIntervalMs` apart
+     */
+    start(): void {
+        if (this.running) {
+            return;
+        }
+        this.running = true;
+        this.scheduleCycle();
+    }
+
+    stop(): void {
+        this.running = false;
+        if (this.cycleTimer) {
+            clearTimeout(this.cycleTimer);
+            this.cycleTimer = undefined;
+        }
+    }
+
+    /**
+     * Run one cycle, or join the cycle already in progress
+     */
+    runCycle(): Promise<AttentionCycleStats> {
+        if (!this.currentCycle) {
+            this.currentCycle = this.execute().finally(() => {
+                this.currentCycle = undefined;
+            });
+        }
+        return this.currentCycle;
+    }
+
+    private scheduleCycle(): void {
+        this.cycleTimer = setTimeout(() => {
+            this.cycleTimer = undefined;
+            this.runCycle()
+                .catch(error => console.error('Attention allocation cycle failed:', error))
+                .finally(() => {
+                    if (this.running) {
+                        this.scheduleCycle();
+                    }
+                });
+        }, this.cycleIntervalMs);
+    }
+
+    private async execute(): Promise<AttentionCycleStats> {
+        const start = Date.now();
+        const stats: AttentionCycleStats = { spreadFrom: 0, decayed: 0, forgotten: 0, slices: 0, durationMs: 0 };
+        const work = this.cycle(stats);
+
+        let done = false;
+        try {
+            while (!done) {
+                stats.slices++;
+                const deadline = Date.now() + this.sliceMs;
+                for (let units = 1; ; units++) {
+                    if (work.next().done) {
+                        done = true;
+                        break;
+                    }
+                    if (units % CLOCK_CHECK_INTERVAL === 0 && Date.now() >= deadline) {
+                        break;
+                    }
+                }
+                if (!done) {
+                    await yieldToEventLoop();
+                }
+            }
+        } finally {
+            this.bank.endCycle();
+        }
+        stats.durationMs = Date.now() - start;
+        return stats;
+    }
+
+    /**
+     * The steps of one cycle; every `yield` is a point where the slice may end
+     */
+    private *cycle(stats: AttentionCycleStats): Generator<void> {
+        yield* this.spread(stats);
+        yield* this.decay(stats);
+        if (this.bank.size() > this.maxAtoms) {
+            yield* this.forget(stats);
+        }
+    }
+
+    private *spread(stats: AttentionCycleStats): Generator<void> {
+        if (this.spreadFraction <= 0) {
+            return;
+        }
+        for (const atomId of this.bank.highestSti(this.focusSize)) {
+            const record = this.bank.get(atomId);
+            const attention = record?.attentionValue;
+            if (!record || !attention || attention.sti <= 0) {
+                continue;
+            }
+            const neighbours = new Set([...(record.outgoing || []), ...this.bank.incoming(atomId)]);
+            neighbours.delete(atomId);
+            if (neighbours.size > 0) {
+                const amount = attention.sti * this.spreadFraction;
+                const share = amount / neighbours.size;
+                this.bank.setAttention(atomId, { ...attention, sti: attention.sti - amount });
+                for (const neighbourId of neighbours) {
+                    const neighbour = this.bank.get(neighbourId);
+                    if (neighbour) {
+                        const current = neighbour.attentionValue || { sti: 0, lti: 0, vlti: 0 };
+                        this.bank.setAttention(neighbourId, { ...current, sti: current.sti + share });
+                    }
+                }
+                stats.spreadFrom++;
+            }
+            yield;
+        }
+    }
+
+    private *decay(stats: AttentionCycleStats): Generator<void> {
+        for (const atomId of this.bank.keys()) {
+            const attention = this.bank.get(atomId)?.attentionValue;
+            if (attention) {
+                let sti = attention.sti * (1 - this.stiDecay);
+                if (Math.abs(sti) < NEGLIGIBLE_STI) {
+                    sti = 0;
+                }
+                let lti = attention.lti * (1 - this.ltiDecay) + Math.max(sti, 0) * this.ltiGain;
+                if (Math.abs(lti) < NEGLIGIBLE_LTI) {
+                    lti = 0;
+                }
+                if (sti !== attention.sti || lti !== attention.lti) {
+                    this.bank.setAttention(atomId, { ...attention, sti, lti });
+                    stats.decayed++;
+                }
+            }
+            yield;
+        }
+    }
+
+    private *forget(stats: AttentionCycleStats): Generator<void> {
+        // Atoms without an attention value have never been judged important
+        for (const atomId of this.bank.keys()) {
+            if (this.bank.size() <= this.maxAtoms) {
+                return;
+            }
+            const record = this.bank.get(atomId);
+            if (record && !record.attentionValue && this.bank.incoming(atomId).size === 0) {
+                this.bank.forget(atomId);
+                stats.forgotten++;
+            }
+            yield;
+        }
+
+        // Then the lowest LTI, in batches: the index is read before the batch is removed
+        const skipped = new Set<string>();
+        while (this.bank.size() > this.maxAtoms) {
+            const excess = this.bank.size() - this.maxAtoms;
+            const requested = skipped.size + Math.min(excess, 256);
+            const batch = this.bank.lowestLti(requested);
+            let removed = 0;
+            for (const atomId of batch) {
+                if (skipped.has(atomId) || this.bank.size() <= this.maxAtoms) {
+                    continue;
+                }
+                const record = this.bank.get(atomId);
+                if (!record || (record.attentionValue?.vlti ?? 0) > 0 || this.bank.incoming(atomId).size > 0) {
+                    skipped.add(atomId);
+                    continue;
+                }
+                this.bank.forget(atomId);
+                stats.forgotten++;
+                removed++;
+                yield;
+            }
+            if (removed === 0 && batch.length < requested) {
+                // Everything left is protected
+                return;
+            }
+        }
+    }
+}
@@ -0,0 +1,80 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { StoreMemoryUsage } from '../../common/opencog-types';
+import { estimateIndexBytes } from '../../common/memory-estimate';
+
+/**
+ * Incoming sets of the AtomSpace: for every atom, the IDs of the links that
+ * contain it in their outgoing set.
+ */
+export class IncomingIndex {
+
+    private readonly incoming = new Map<string, Set<string>>();
+
+    /**
+     * Record a link as incoming to each of its outgoing atoms
+     */
+    addLink(linkId: string, outgoing: readonly string[] | undefined): void {
+        if (!outgoing) {
+            return;
+        }
+        for (const targetId of outgoing) {
+            let links = this.incoming.get(targetId);
+            if (!links) {
+                links = new Set();
+                this.incoming.set(targetId, links);
+            }
+            links.add(linkId);
+        }
+    }
+
+    removeLink(linkId: string, outgoing: readonly string[] | undefined): void {
+        if (!outgoing) {
+            return;
+        }
+        for (const targetId of outgoing) {
+            const links = this.incoming.get(targetId);
+            if (links) {
+                links.delete(linkId);
+                if (links.size === 0) {
+                    this.incoming.delete(targetId);
+                }
+            }
+        }
+    }
+
+    /**
+     * Link IDs pointing at the atom; O(1) to obtain, O(degree) to iterate
+     */
+    get(atomId: string): ReadonlySet<string> {
+        return this.incoming.get(atomId) || EMPTY_SET;
+    }
+
+    degree(atomId: string): number {
+        return this.incoming.get(atomId)?.size ?? 0;
+    }
+
+    memoryUsage(): StoreMemoryUsage {
+        return { entries: this.incoming.size, bytes: estimateIndexBytes(this.incoming, true) };
+    }
+
+    clear(): void {
+        this.incoming.clear();
+    }
+}
+
+const EMPTY_SET: ReadonlySet<string> = new Set<string>();
@@ -0,0 +1,36 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+export { AtomIndex } from './atom-index';
+export { AtomValueIndex, SortedValueList, IndexedAtomValue, RangeCandidates } from './value-index';
+export {
+    AtomRecord, AtomInterner, atomContentKey, contentAtomId, derivedAtomId, isContentAtomId, recordFields
+} from './atom-record';
+export { IncomingIndex } from './incoming-index';
+export { AtomStore, AtomStoreKind, ColumnarAtomStore, createAtomStore } from './atom-store';
+export { PatternMatcher, PatternMatchSource, PatternGrounding, CompiledPattern } from './pattern-matcher';
+export { QueryPlan, QueryPlanCache, QueryAccessPath } from './query-plan';
+export {
+    AtomStreamImporter, AtomStreamOptions, AtomStreamSink, NdjsonLineBuffer, DEFAULT_STREAM_BATCH_SIZE,
+    encodeAtomRecords, readNdjsonLines, yieldToEventLoop
+} from './atom-stream';
+export { AtomSnapshotReader, encodeAtomSnapshot, SNAPSHOT_MAGIC, SNAPSHOT_VERSION } from './atom-snapshot';
+export { AtomWriteAheadLog, WalEntry, WalRecovery, WriteAheadLogOptions, WAL_SNAPSHOT_FILE } from './atom-wal';
+export { AtomChangeFeed } from './atom-change-feed';
+export { AtomSpaceView } from './atom-space-view';
+export {
+    AttentionAllocator, AttentionAllocationOptions, AttentionBank, AttentionCycleStats
+} from './attention-allocation';
@@ -0,0 +1,316 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { AtomPattern } from '../../common/opencog-types';
+import { AtomRecord } from './atom-record';
+
+/**
+ * Read access to the AtomSpace needed by the pattern matcher
+ */
+export interface PatternMatchSource {
+    size(): number;
+    get(atomId: string): AtomRecord | undefined;
+    /** Hash-index candidates for a type and/or name, or `undefined` when neither is given */
+    select(type: string | undefined, name: string | undefined): ReadonlySet<string> | undefined;
+    incoming(atomId: string): ReadonlySet<string>;
+    values(): Iterable<AtomRecord>;
+}
+
+/**
+ * Variable assignment of one grounding, plus the atom grounding each clause
+ */
+export interface PatternGrounding {
+    bindings: Record<string, string>;
+    clauses: string[];
+}
+
+export type PatternTerm = VariableTerm | AtomTerm | TemplateTerm;
+
+export interface VariableTerm {
+    kind: 'variable';
+    variable: string;
+}
+
+export interface AtomTerm {
+    kind: 'atom';
+    id: string;
+}
+
+export interface TemplateTerm {
+    kind: 'template';
+    type?: string;
+    name?: string;
+    outgoing?: PatternTerm[];
+    variable?: string;
+}
+
+export interface VariableConstraint {
+    type?: string;
+    name?: string;
+    id?: string;
+}
+
+type Bindings = Map<string, string>;
+
+/**
+ * Template clauses and variable constraints of a pattern, parsed once for repeated matching
+ */
+export interface CompiledPattern {
+    readonly clauses: ReadonlyArray<PatternTerm>;
+    readonly constraints: ReadonlyMap<string, VariableConstraint>;
+}
+
+/**
+ * Graph pattern matcher finding every grounding of a hypergraph template with variables.
+ *
+ * A template term is either a variable (a string starting with `$`), an atom ID
+ * (any other string) or an object `{ type?, name?, outgoing?, variable? }` whose
+ * `outgoing` terms are matched position by position; `variable` binds the matched
+ * atom itself. `pattern.pattern` is a single term or `{ clauses: [...] }` for a
+ * conjunction sharing variables. `bindVariables` restricts variables to a type
+ * (`{ $X: 'ConceptNode' }`) or to `{ type?, name?, id? }`.
+ *
+ * Clauses are grounded one at a time. At each step the clause with the fewest
+ * candidates is expanded next, where candidates come from the incoming set of an
+ * already bound outgoing atom or from the type/name hash index, whichever is smaller.
+ */
+export class PatternMatcher {
+
+    constructor(private readonly source: PatternMatchSource) { }
+
+    /**
+     * Whether the pattern carries a template for the matcher rather than only plain filters
+     */
+    static hasTemplate(pattern: AtomPattern): boolean {
+        return !!pattern.pattern && Object.keys(pattern.pattern).length > 0;
+    }
+
+    static compile(pattern: AtomPattern): CompiledPattern {
+        return {
+            clauses: PatternMatcher.compileClauses(pattern),
+            constraints: PatternMatcher.compileConstraints(pattern.bindVariables)
+        };
+    }
+
+    match(pattern: AtomPattern | CompiledPattern, limit = Infinity): PatternGrounding[] {
+        const { clauses, constraints } = PatternMatcher.isCompiled(pattern) ? pattern : PatternMatcher.compile(pattern);
+        const results: PatternGrounding[] = [];
+        if (clauses.length === 0 || limit <= 0) {
+            return results;
+        }
+
+        const groundings: string[] = new Array(clauses.length);
+        const remaining = new Set(clauses.map((_, i) => i));
+
+        const search = (bindings: Bindings): boolean => {
+            if (remaining.size === 0) {
+                results.push({ bindings: Object.fromEntries(bindings), clauses: groundings.slice() });
+                return results.length >= limit;
+            }
+
+            let next = -1;
+            let nextCandidates: Iterable<string> | undefined;
+            let nextSize = Infinity;
+            for (const index of remaining) {
+                const [candidates, size] = this.candidatesFor(clauses[index], bindings, constraints);
+                if (size < nextSize) {
+                    next = index;
+                    nextCandidates = candidates;
+                    nextSize = size;
+                }
+                if (size === 0) {
+                    return false;
+                }
+            }
+
+            remaining.delete(next);
+            try {
+                for (const atomId of nextCandidates!) {
+                    const record = this.source.get(atomId);
+                    if (!record) {
+                        continue;
+                    }
+                    const extended = this.unify(clauses[next], record, bindings, constraints);
+                    if (extended) {
+                        groundings[next] = atomId;
+                        if (search(extended)) {
+                            return true;
+                        }
+                    }
+                }
+            } finally {
+                remaining.add(next);
+            }
+            return false;
+        };
+
+        search(new Map());
+        return results;
+    }
+
+    /**
+     * Smallest candidate source for grounding a clause under the current bindings
+     */
+    private candidatesFor(term: PatternTerm, bindings: Bindings, constraints: ReadonlyMap<string, VariableConstraint>): [Iterable<string>, number] {
+        const known = (variable: string | undefined) => variable === undefined ? undefined
+            : bindings.get(variable) ?? constraints.get(variable)?.id;
+
+        if (term.kind === 'atom') {
+            return this.source.get(term.id) ? [[term.id], 1] : [[], 0];
+        }
+        if (term.kind === 'variable') {
+            const bound = known(term.variable);
+            return bound !== undefined ? [[bound], 1] : [this.allIds(), this.source.size()];
+        }
+
+        const bound = known(term.variable);
+        if (bound !== undefined) {
+            return [[bound], 1];
+        }
+
+        let best: ReadonlySet<string> | undefined = this.source.select(term.type, term.name);
+        for (const child of term.outgoing || []) {
+            const childId = child.kind === 'atom' ? child.id : known(child.variable);
+            if (childId !== undefined) {
+                const incoming = this.source.incoming(childId);
+                if (!best || incoming.size < best.size) {
+                    best = incoming;
+                }
+            }
+        }
+        return best ? [best, best.size] : [this.allIds(), this.source.size()];
+    }
+
+    /**
+     * Match a term against a record, returning the extended bindings or `undefined` on failure
+     */
+    private unify(term: PatternTerm, record: AtomRecord, bindings: Bindings, constraints: ReadonlyMap<string, VariableConstraint>): Bindings | undefined {
+        switch (term.kind) {
+            case 'atom':
+                return term.id === record.id ? bindings : undefined;
+            case 'variable':
+                return this.bind(term.variable, record, bindings, constraints);
+        }
+
+        if (term.type !== undefined && record.type !== term.type) {
+            return undefined;
+        }
+        if (term.name !== undefined && record.name !== term.name) {
+            return undefined;
+        }
+
+        let current: Bindings | undefined = bindings;
+        if (term.outgoing) {
+            const outgoing = record.outgoing || [];
+            if (outgoing.length !== term.outgoing.length) {
+                return undefined;
+            }
+            for (let i = 0; i < outgoing.length && current; i++) {
+                const child = term.outgoing[i];
+                if (child.kind === 'atom') {
+                    current = child.id === outgoing[i] ? current : undefined;
+                    continue;
+                }
+                const childRecord = this.source.get(outgoing[i]);
+                current = childRecord ? this.unify(child, childRecord, current, constraints) : undefined;
+            }
+        }
+        if (current && term.variable !== undefined) {
+            current = this.bind(term.variable, record, current, constraints);
+        }
+        return current;
+    }
+
+    private bind(variable: string, record: AtomRecord, bindings: Bindings, constraints: ReadonlyMap<string, VariableConstraint>): Bindings | undefined {
+        const bound = bindings.get(variable);
+        if (bound !== undefined) {
+            return bound === record.id ? bindings : undefined;
+        }
+
+        const constraint = constraints.get(variable);
+        if (constraint) {
+            if (constraint.id !== undefined && record.id !== constraint.id) {
+                return undefined;
+            }
+            if (constraint.type !== undefined && record.type !== constraint.type) {
+                return undefined;
+            }
+            if (constraint.name !== undefined && record.name !== constraint.name) {
+                return undefined;
+            }
+        }
+
+        const extended = new Map(bindings);
+        extended.set(variable, record.id);
+        return extended;
+    }
+
+    private *allIds(): IterableIterator<string> {
+        for (const record of this.source.values()) {
+            yield record.id;
+        }
+    }
+
+    private static isCompiled(pattern: AtomPattern | CompiledPattern): pattern is CompiledPattern {
+        return Array.isArray((pattern as CompiledPattern).clauses) && (pattern as CompiledPattern).constraints instanceof Map;
+    }
+
+    private static compileClauses(pattern: AtomPattern): PatternTerm[] {
+        const template = pattern.pattern;
+        if (!template) {
+            return [];
+        }
+        const clauses: unknown[] = Array.isArray(template.clauses) ? template.clauses : [template];
+        return clauses.map(clause => PatternMatcher.compileTerm(clause));
+    }
+
+    private static compileTerm(term: unknown): PatternTerm {
+        if (typeof term === 'string') {
+            return term.startsWith('$') ? { kind: 'variable', variable: term } : { kind: 'atom', id: term };
+        }
+        if (!term || typeof term !== 'object') {
+            throw new Error(`Invalid pattern term: ${JSON.stringify(term)}`);
+        }
+
+        const { type, name, outgoing, variable } = term as Record<string, any>;
+        const compiled: TemplateTerm = { kind: 'template' };
+        if (type !== undefined) {
+            compiled.type = type;
+        }
+        if (name !== undefined) {
+            compiled.name = name;
+        }
+        if (variable !== undefined) {
+            compiled.variable = variable;
+        }
+        if (Array.isArray(outgoing)) {
+            compiled.outgoing = outgoing.map(child => PatternMatcher.compileTerm(child));
+        }
+        return compiled;
+    }
+
+    private static compileConstraints(bindVariables: Record<string, any> | undefined): Map<string, VariableConstraint> {
+        const constraints = new Map<string, VariableConstraint>();
+        for (const [variable, constraint] of Object.entries(bindVariables || {})) {
+            if (typeof constraint === 'string') {
+                constraints.set(variable, { type: constraint });
+            } else if (constraint && typeof constraint === 'object') {
+                constraints.set(variable, constraint);
+            }
+        }
+        return constraints;
+    }
+}
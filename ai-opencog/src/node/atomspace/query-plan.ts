@@ -0,0 +1,199 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { AtomPattern, QueryPlanStats } from '../../common/opencog-types';
+import { AtomRecord } from './atom-record';
+import { AtomValueIndex } from './value-index';
+import { CompiledPattern, PatternMatcher } from './pattern-matcher';
+
+/**
+ * Index used to produce the candidate atoms of a query
+ */
+export type QueryAccessPath = 'template' | 'type-name' | 'type' | 'name' | 'threshold' | 'scan';
+
+/**
+ * Index-access plan for one pattern shape.
+ *
+ * The shape records which fields a pattern constrains, not their values, so every
+ * `{ type, name }` lookup shares one plan. Template patterns are keyed by the full
+ * template because its literals decide the join. The plan fixes the access path and
+ * keeps only the filters the access path does not already guarantee.
+ */
+export class QueryPlan {
+
+    readonly access: QueryAccessPath;
+    /** Whether a threshold index may be smaller than the hash candidates at run time */
+    readonly compareRange: boolean;
+    readonly template: CompiledPattern | undefined;
+
+    private readonly checkType: boolean;
+    private readonly checkName: boolean;
+    private readonly checkThresholds: boolean;
+
+    private hits = 0;
+    private executions = 0;
+    private totalNs = 0;
+    private maxNs = 0;
+
+    constructor(readonly shape: string, pattern: AtomPattern) {
+        const hasThresholds = !!(pattern.truthValueThreshold || pattern.attentionThreshold);
+        this.template = PatternMatcher.hasTemplate(pattern) ? PatternMatcher.compile(pattern) : undefined;
+
+        if (this.template) {
+            this.access = 'template';
+        } else if (pattern.type && pattern.name) {
+            this.access = 'type-name';
+        } else if (pattern.type) {
+            this.access = 'type';
+        } else if (pattern.name) {
+            this.access = 'name';
+        } else {
+            this.access = hasThresholds ? 'threshold' : 'scan';
+        }
+
+        this.compareRange = hasThresholds && (this.access === 'type-name' || this.access === 'type' || this.access === 'name');
+        this.checkType = !!pattern.type && this.access !== 'type-name' && this.access !== 'type';
+        this.checkName = !!pattern.name && this.access !== 'type-name' && this.access !== 'name';
+        this.checkThresholds = hasThresholds;
+    }
+
+    /**
+     * Apply the filters left after candidate selection. Hash-index candidates are
+     * re-checked when a range index was used instead.
+     */
+    matches(record: AtomRecord, pattern: AtomPattern, usedRange: boolean): boolean {
+        if ((this.checkType || usedRange) && pattern.type && record.type !== pattern.type) {
+            return false;
+        }
+        if ((this.checkName || usedRange) && pattern.name && record.name !== pattern.name) {
+            return false;
+        }
+        return !this.checkThresholds || AtomValueIndex.meetsThresholds(record, pattern);
+    }
+
+    recordHit(): void {
+        this.hits++;
+    }
+
+    recordExecution(elapsedNs: number): void {
+        this.executions++;
+        this.totalNs += elapsedNs;
+        if (elapsedNs > this.maxNs) {
+            this.maxNs = elapsedNs;
+        }
+    }
+
+    getStats(): QueryPlanStats {
+        return {
+            shape: this.shape,
+            accessPath: this.access,
+            hits: this.hits,
+            executions: this.executions,
+            totalLatencyMs: this.totalNs / 1e6,
+            averageLatencyMs: this.executions > 0 ? this.totalNs / this.executions / 1e6 : 0,
+            maxLatencyMs: this.maxNs / 1e6
+        };
+    }
+}
+
+/**
+ * Bounded cache of query plans keyed by normalized pattern shape, evicting the least recently used plan
+ */
+export class QueryPlanCache {
+
+    private readonly plans = new Map<string, QueryPlan>();
+
+    constructor(private readonly capacity = 512) { }
+
+    get size(): number {
+        return this.plans.size;
+    }
+
+    /**
+     * Cached plan for the pattern's shape, compiling and caching it on a miss
+     */
+    get(pattern: AtomPattern): QueryPlan {
+        const shape = QueryPlanCache.shapeOf(pattern);
+        let plan = this.plans.get(shape);
+        if (plan) {
+            plan.recordHit();
+            // Re-insert to mark as most recently used
+            this.plans.delete(shape);
+        } else {
+            plan = new QueryPlan(shape, pattern);
+            if (this.plans.size >= this.capacity) {
+                this.plans.delete(this.plans.keys().next().value!);
+            }
+        }
+        this.plans.set(shape, plan);
+        return plan;
+    }
+
+    /**
+     * Statistics of every cached plan, most expensive in total first
+     */
+    getStats(): QueryPlanStats[] {
+        return Array.from(this.plans.values(), plan => plan.getStats())
+            .sort((a, b) => b.totalLatencyMs - a.totalLatencyMs);
+    }
+
+    clear(): void {
+        this.plans.clear();
+    }
+
+    /**
+     * Normalized shape of a pattern: the constrained fields, plus the canonical
+     * template when the pattern has one
+     */
+    static shapeOf(pattern: AtomPattern): string {
+        const fields: string[] = [];
+        if (pattern.type) {
+            fields.push('type');
+        }
+        if (pattern.name) {
+            fields.push('name');
+        }
+        for (const [group, values] of [['tv', pattern.truthValueThreshold], ['av', pattern.attentionThreshold]] as const) {
+            if (values) {
+                for (const key of Object.keys(values).sort()) {
+                    if (typeof (values as Record<string, unknown>)[key] === 'number') {
+                        fields.push(`${group}.${key}`);
+                    }
+                }
+            }
+        }
+        if (PatternMatcher.hasTemplate(pattern)) {
+            fields.push(`template=${canonicalJson(pattern.pattern)}`);
+            if (pattern.bindVariables) {
+                fields.push(`bind=${canonicalJson(pattern.bindVariables)}`);
+            }
+        }
+        return fields.join('|') || '*';
+    }
+}
+
+function canonicalJson(value: unknown): string {
+    if (Array.isArray(value)) {
+        return `[${value.map(canonicalJson).join(',')}]`;
+    }
+    if (value && typeof value === 'object') {
+        const entries = Object.keys(value).sort()
+            .filter(key => (value as Record<string, unknown>)[key] !== undefined)
+            .map(key => `${JSON.stringify(key)}:${canonicalJson((value as Record<string, unknown>)[key])}`);
+        return `{${entries.join(',')}}`;
+    }
+    return JSON.stringify(value);
+}
@@ -0,0 +1,489 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { Atom, AtomPattern, StoreMemoryUsage } from '../../common/opencog-types';
+import { estimateEntryBytes } from '../../common/memory-estimate';
+import { AtomRecord } from './atom-record';
+
+interface ValueEntry {
+    value: number;
+    id: string;
+}
+
+/**
+ * Ordered multiset of (value, atom ID) pairs stored as a list of bounded sorted chunks.
+ *
+ * Inserts and removals touch a single chunk, so they cost O(log n + chunk size)
+ * instead of shifting one large array; range scans start from a binary search.
+ * A Fenwick tree over the chunk lengths counts a range in O(log n).
+ */
+export class SortedValueList {
+
+    private static readonly CHUNK_SIZE = 512;
+
+    private chunks: ValueEntry[][] = [];
+    private count = 0;
+    /** Fenwick tree over chunk lengths, 1-based; rebuilt when chunks are split or dropped */
+    private chunkCounts: number[] = [0];
+
+    get size(): number {
+        return this.count;
+    }
+
+    insert(value: number, id: string): void {
+        const entry = { value, id };
+        if (this.chunks.length === 0) {
+            this.chunks.push([entry]);
+            this.count = 1;
+            this.rebuildChunkCounts();
+            return;
+        }
+
+        const chunkIndex = Math.min(this.findChunk(entry), this.chunks.length - 1);
+        const chunk = this.chunks[chunkIndex];
+        chunk.splice(this.lowerBound(chunk, entry), 0, entry);
+        this.count++;
+
+        if (chunk.length > SortedValueList.CHUNK_SIZE * 2) {
+            this.chunks.splice(chunkIndex + 1, 0, chunk.splice(SortedValueList.CHUNK_SIZE));
+            this.rebuildChunkCounts();
+        } else {
+            this.adjustChunkCount(chunkIndex, 1);
+        }
+    }
+
+    remove(value: number, id: string): boolean {
+        const entry = { value, id };
+        const chunkIndex = this.findChunk(entry);
+        if (chunkIndex >= this.chunks.length) {
+            return false;
+        }
+
+        const chunk = this.chunks[chunkIndex];
+        const position = this.lowerBound(chunk, entry);
+        if (position >= chunk.length || compareEntries(chunk[position], entry) !== 0) {
+            return false;
+        }
+
+        chunk.splice(position, 1);
+        this.count--;
+        if (chunk.length === 0) {
+            this.chunks.splice(chunkIndex, 1);
+            this.rebuildChunkCounts();
+        } else {
+            this.adjustChunkCount(chunkIndex, -1);
+        }
+        return true;
+    }
+
+    clear(): void {
+        this.chunks = [];
+        this.count = 0;
+        this.chunkCounts = [0];
+    }
+
+    /**
+     * Replace the contents with the given entries, sorting them once instead of inserting one by one
+     */
+    load(entries: ValueEntry[]): void {
+        entries.sort(compareEntries);
+        this.chunks = [];
+        for (let i = 0; i < entries.length; i += SortedValueList.CHUNK_SIZE) {
+            this.chunks.push(entries.slice(i, i + SortedValueList.CHUNK_SIZE));
+        }
+        this.count = entries.length;
+        this.rebuildChunkCounts();
+    }
+
+    /**
+     * Number of entries with a value greater than or equal to `min`
+     */
+    countAtLeast(min: number): number {
+        const [chunkIndex, position] = this.seek(min);
+        if (chunkIndex >= this.chunks.length) {
+            return 0;
+        }
+        return this.count - this.countBeforeChunk(chunkIndex) - position;
+    }
+
+    /**
+     * IDs with a value greater than or equal to `min`, in ascending value order
+     */
+    *atLeast(min: number): IterableIterator<string> {
+        const [chunkIndex, position] = this.seek(min);
+        for (let c = chunkIndex, p = position; c < this.chunks.length; c++, p = 0) {
+            const chunk = this.chunks[c];
+            for (; p < chunk.length; p++) {
+                yield chunk[p].id;
+            }
+        }
+    }
+
+    /**
+     * IDs in descending value order
+     */
+    *descending(): IterableIterator<string> {
+        for (let c = this.chunks.length - 1; c >= 0; c--) {
+            const chunk = this.chunks[c];
+            for (let p = chunk.length - 1; p >= 0; p--) {
+                yield chunk[p].id;
+            }
+        }
+    }
+
+    /**
+     * IDs in ascending value order
+     */
+    *ascending(): IterableIterator<string> {
+        for (const chunk of this.chunks) {
+            for (const entry of chunk) {
+                yield entry.id;
+            }
+        }
+    }
+
+    private rebuildChunkCounts(): void {
+        const counts = new Array<number>(this.chunks.length + 1).fill(0);
+        for (let i = 1; i < counts.length; i++) {
+            counts[i] += this.chunks[i - 1].length;
+            const parent = i + (i & -i);
+            if (parent < counts.length) {
+                counts[parent] += counts[i];
+            }
+        }
+        this.chunkCounts = counts;
+    }
+
+    private adjustChunkCount(chunkIndex: number, delta: number): void {
+        for (let i = chunkIndex + 1; i < this.chunkCounts.length; i += i & -i) {
+            this.chunkCounts[i] += delta;
+        }
+    }
+
+    /**
+     * Number of entries in the chunks before `chunkIndex`
+     */
+    private countBeforeChunk(chunkIndex: number): number {
+        let total = 0;
+        for (let i = chunkIndex; i > 0; i -= i & -i) {
+            total += this.chunkCounts[i];
+        }
+        return total;
+    }
+
+    /**
+     * Index of the first chunk whose last entry is not smaller than `entry`
+     */
+    private findChunk(entry: ValueEntry): number {
+        let low = 0;
+        let high = this.chunks.length;
+        while (low < high) {
+            const mid = (low + high) >>> 1;
+            const chunk = this.chunks[mid];
+            if (compareEntries(chunk[chunk.length - 1], entry) < 0) {
+                low = mid + 1;
+            } else {
+                high = mid;
+            }
+        }
+        return low;
+    }
+
+    private lowerBound(chunk: ValueEntry[], entry: ValueEntry): number {
+        let low = 0;
+        let high = chunk.length;
+        while (low < high) {
+            const mid = (low + high) >>> 1;
+            if (compareEntries(chunk[mid], entry) < 0) {
+                low = mid + 1;
+            } else {
+                high = mid;
+            }
+        }
+        return low;
+    }
+
+    /**
+     * Position of the first entry whose value is greater than or equal to `min`
+     */
+    private seek(min: number): [number, number] {
+        let low = 0;
+        let high = this.chunks.length;
+        while (low < high) {
+            const mid = (low + high) >>> 1;
+            const chunk = this.chunks[mid];
+            if (chunk[chunk.length - 1].value < min) {
+                low = mid + 1;
+            } else {
+                high = mid;
+            }
+        }
+        if (low >= this.chunks.length) {
+            return [low, 0];
+        }
+
+        const chunk = this.chunks[low];
+        let position = 0;
+        let end = chunk.length;
+        while (position < end) {
+            const mid = (position + end) >>> 1;
+            if (chunk[mid].value < min) {
+                position = mid + 1;
+            } else {
+                end = mid;
+            }
+        }
+        return [low, position];
+    }
+}
+
+function compareEntries(a: ValueEntry, b: ValueEntry): number {
+    if (a.value !== b.value) {
+        return a.value < b.value ? -1 : 1;
+    }
+    return a.id < b.id ? -1 : a.id > b.id ? 1 : 0;
+}
+
+/**
+ * Atom value fields that carry an ordered index
+ */
+export type IndexedAtomValue = 'strength' | 'confidence' | 'sti' | 'lti';
+
+/**
+ * Candidate set produced by a range index: its exact size plus a lazy ID iterator
+ */
+export interface RangeCandidates {
+    size: number;
+    ids(): Iterable<string>;
+}
+
+/**
+ * Ordered indexes over truth values (strength, confidence) and attention values (STI, LTI).
+ *
+ * Answers `truthValueThreshold` / `attentionThreshold` queries and top-K attention
+ * lookups in O(log n + k) rather than filtering the whole AtomSpace.
+ */
+export class AtomValueIndex {
+
+    private readonly lists: Record<IndexedAtomValue, SortedValueList> = {
+        strength: new SortedValueList(),
+        confidence: new SortedValueList(),
+        sti: new SortedValueList(),
+        lti: new SortedValueList()
+    };
+
+    add(atom: AtomRecord): void {
+        for (const field of INDEXED_FIELDS) {
+            const value = AtomValueIndex.valueOf(atom, field);
+            if (value !== undefined) {
+                this.lists[field].insert(value, atom.id);
+            }
+        }
+    }
+
+    remove(atom: AtomRecord): void {
+        for (const field of INDEXED_FIELDS) {
+            const value = AtomValueIndex.valueOf(atom, field);
+            if (value !== undefined) {
+                this.lists[field].remove(value, atom.id);
+            }
+        }
+    }
+
+    update(previous: AtomRecord, next: AtomRecord): void {
+        if (INDEXED_FIELDS.every(field => AtomValueIndex.valueOf(previous, field) === AtomValueIndex.valueOf(next, field))) {
+            return;
+        }
+        this.remove(previous);
+        this.add(next);
+    }
+
+    clear(): void {
+        for (const field of INDEXED_FIELDS) {
+            this.lists[field].clear();
+        }
+    }
+
+    /**
+     * Indexed (value, atom ID) entries and their estimated size
+     */
+    memoryUsage(): StoreMemoryUsage {
+        const entries = INDEXED_FIELDS.reduce((sum, field) => sum + this.lists[field].size, 0);
+        return { entries, bytes: estimateEntryBytes(entries, 2, 1) };
+    }
+
+    /**
+     * Rebuild every list from scratch, for bulk loads
+     */
+    load(atoms: Iterable<AtomRecord>): void {
+        const entries: Record<IndexedAtomValue, ValueEntry[]> = { strength: [], confidence: [], sti: [], lti: [] };
+        for (const atom of atoms) {
+            for (const field of INDEXED_FIELDS) {
+                const value = AtomValueIndex.valueOf(atom, field);
+                if (value !== undefined) {
+                    entries[field].push({ value, id: atom.id });
+                }
+            }
+        }
+        for (const field of INDEXED_FIELDS) {
+            this.lists[field].load(entries[field]);
+        }
+    }
+
+    /**
+     * Pick the most selective threshold constraint of the pattern, or `undefined`
+     * when the pattern has no indexed threshold
+     */
+    select(pattern: AtomPattern): RangeCandidates | undefined {
+        let best: RangeCandidates | undefined;
+        for (const [field, threshold] of AtomValueIndex.thresholdsOf(pattern)) {
+            const list = this.lists[field];
+            // Keys are single precision; rounding the bound the same way keeps the candidate set a superset
+            const min = Math.fround(threshold);
+            const size = list.countAtLeast(min);
+            if (!best || size < best.size) {
+                best = { size, ids: () => list.atLeast(min) };
+            }
+        }
+        return best;
+    }
+
+    /**
+     * Up to `limit` atom IDs with the highest value of `field`
+     */
+    top(field: IndexedAtomValue, limit: number): string[] {
+        const result: string[] = [];
+        if (limit <= 0) {
+            return result;
+        }
+        for (const id of this.lists[field].descending()) {
+            result.push(id);
+            if (result.length >= limit) {
+                break;
+            }
+        }
+        return result;
+    }
+
+    /**
+     * Up to `limit` atom IDs with the lowest value of `field`
+     */
+    bottom(field: IndexedAtomValue, limit: number): string[] {
+        const result: string[] = [];
+        if (limit <= 0) {
+            return result;
+        }
+        for (const id of this.lists[field].ascending()) {
+            result.push(id);
+            if (result.length >= limit) {
+                break;
+            }
+        }
+        return result;
+    }
+
+    /**
+     * Check the pattern's truth value and attention thresholds against an atom.
+     * Values are compared at single precision, matching the index keys.
+     */
+    static meetsThresholds(atom: Pick<Atom, 'truthValue' | 'attentionValue'>, pattern: AtomPattern): boolean {
+        const truth = pattern.truthValueThreshold;
+        if (truth) {
+            if (!atom.truthValue) {
+                return false;
+            }
+            if (isNumber(truth.strength) && !atLeast(atom.truthValue.strength, truth.strength)) {
+                return false;
+            }
+            if (isNumber(truth.confidence) && !atLeast(atom.truthValue.confidence, truth.confidence)) {
+                return false;
+            }
+        }
+
+        const attention = pattern.attentionThreshold;
+        if (attention) {
+            if (!atom.attentionValue) {
+                return false;
+            }
+            if (isNumber(attention.sti) && !atLeast(atom.attentionValue.sti, attention.sti)) {
+                return false;
+            }
+            if (isNumber(attention.lti) && !atLeast(atom.attentionValue.lti, attention.lti)) {
+                return false;
+            }
+            if (isNumber(attention.vlti) && !atLeast(atom.attentionValue.vlti, attention.vlti)) {
+                return false;
+            }
+        }
+        return true;
+    }
+
+    private static thresholdsOf(pattern: AtomPattern): Array<[IndexedAtomValue, number]> {
+        const thresholds: Array<[IndexedAtomValue, number]> = [];
+        const truth = pattern.truthValueThreshold;
+        if (truth) {
+            if (isNumber(truth.strength)) {
+                thresholds.push(['strength', truth.strength]);
+            }
+            if (isNumber(truth.confidence)) {
+                thresholds.push(['confidence', truth.confidence]);
+            }
+        }
+        const attention = pattern.attentionThreshold;
+        if (attention) {
+            if (isNumber(attention.sti)) {
+                thresholds.push(['sti', attention.sti]);
+            }
+            if (isNumber(attention.lti)) {
+                thresholds.push(['lti', attention.lti]);
+            }
+        }
+        return thresholds;
+    }
+
+    /**
+     * Index key for a field. Keys are rounded to single precision so that records read
+     * back from a single-precision store find the entries written for them.
+     */
+    private static valueOf(atom: AtomRecord, field: IndexedAtomValue): number | undefined {
+        let value: number | undefined;
+        switch (field) {
+            case 'strength':
+                value = atom.truthValue?.strength;
+                break;
+            case 'confidence':
+                value = atom.truthValue?.confidence;
+                break;
+            case 'sti':
+                value = atom.attentionValue?.sti;
+                break;
+            case 'lti':
+                value = atom.attentionValue?.lti;
+                break;
+        }
+        return isNumber(value) ? Math.fround(value) : undefined;
+    }
+}
+
+const INDEXED_FIELDS: IndexedAtomValue[] = ['strength', 'confidence', 'sti', 'lti'];
+
+function atLeast(value: number, threshold: number): boolean {
+    return Math.fround(value) >= Math.fround(threshold);
+}
+
+function isNumber(value: unknown): value is number {
+    return typeof value === 'number' && !Number.isNaN(value);
+}
@@ -21,7 +21,7 @@ import {
     LogicIssue,
     ReasoningResult
 } from '../common/reasoning-services';
-import { PLNReasoningEngine } from './reasoning-engines';
+import { calculateInferenceConfidence, PLNReasoningEngine, PLNRuleNetwork } from './reasoning-engines';
 import { ReasoningQuery, Atom } from '../common/opencog-types';
 
 /**
@@ -29,7 +29,16 @@ import { ReasoningQuery, Atom } from '../common/opencog-types';
  */
 @injectable()
 export class DeductiveReasoningServiceImpl implements DeductiveReasoningService {
-    
+
+    /**
+     * Editor logic checks resend nearly the same premises on every change, so each kind
+     * of check keeps a rule network and only the difference to the previous call is
+     * asserted or retracted. The service is bound per connection, so one client's
+     * premises never churn another's network.
+     */
+    private readonly deductionNetwork = new PLNRuleNetwork();
+    private readonly consistencyNetwork = new PLNRuleNetwork({ contradicts: (a, b) => this.areContradictory(a, b) });
+
     constructor(
         @inject(PLNReasoningEngine) private readonly reasoningEngine: PLNReasoningEngine
     ) {}
@@ -77,33 +86,31 @@ export class DeductiveReasoningServiceImpl implements DeductiveReasoningService
 
     async deduceConclusions(premises: any[]): Promise<ReasoningResult> {
         const atoms = premises.map(premise => this.convertToAtom(premise));
-        
-        const query: ReasoningQuery = {
-            type: 'deductive',
-            atoms,
-            parameters: { deductionMode: 'strict' }
+        const update = this.deductionNetwork.replace(atoms);
+        const conclusions = this.deductionNetwork.getConclusions();
+
+        return {
+            conclusion: conclusions,
+            confidence: calculateInferenceConfidence(conclusions),
+            explanation: `PLN deduction maintains ${conclusions.length} conclusions from ${atoms.length} premises`,
+            metadata: {
+                reasoningType: 'pln-deductive',
+                deductionMode: 'strict',
+                ...update
+            }
         };
-        
-        return await this.reasoningEngine.reason(query);
     }
 
     async checkConsistency(statements: any[]): Promise<{ isConsistent: boolean; conflicts?: any[] }> {
         const atoms = statements.map(stmt => this.convertToAtom(stmt));
-        
-        const query: ReasoningQuery = {
-            type: 'deductive',
-            atoms,
-            parameters: { 
-                consistencyCheck: true,
-                findConflicts: true 
-            }
-        };
-        
-        const result = await this.reasoningEngine.reason(query);
-        
-        // Check for contradictions in conclusions
-        const conflicts = this.findContradictions(result.conclusion || []);
-        
+        this.consistencyNetwork.replace(atoms);
+
+        // Contradictions among the statements and everything deduced from them
+        const conflicts = this.consistencyNetwork.getConflicts().map(([atom1, atom2]) => ({
+            atoms: [atom1, atom2],
+            description: `Atoms ${atom1.name} and ${atom2.name} are contradictory`
+        }));
+
         return {
             isConsistent: conflicts.length === 0,
             conflicts: conflicts.length > 0 ? conflicts : undefined
@@ -213,7 +220,7 @@ export class DeductiveReasoningServiceImpl implements DeductiveReasoningService
             };
         }
         
-        if (premise.type && premise.name) {
+        if (premise.type && (premise.name || premise.outgoing)) {
             return premise as Atom;
         }
         
@@ -56,6 +56,7 @@ export class DistributedReasoningServiceImpl implements DistributedReasoningServ
     private taskQueue: Map<string, DistributedReasoningTask> = new Map();
     private completedTasks: Map<string, DistributedReasoningResult> = new Map();
     private heartbeatTimers: Map<string, NodeJS.Timeout> = new Map();
+    private heartbeatMonitor: NodeJS.Timeout | undefined;
 
     // Event emitters
     private readonly onNodeRegisteredEmitter = new Emitter<{ node: ReasoningNode }>();
@@ -72,7 +73,6 @@ export class DistributedReasoningServiceImpl implements DistributedReasoningServ
         @inject(ILogger) protected readonly logger: ILogger
     ) {
         this.config = this.getDefaultConfig();
-        this.startHeartbeatMonitoring();
         this.startTaskProcessing();
         
         this.logger.info('Distributed reasoning service initialized');
@@ -164,6 +164,7 @@ export class DistributedReasoningServiceImpl implements DistributedReasoningServ
         };
 
         this.nodeRegistry.set(nodeId, node);
+        this.startHeartbeatMonitoring();
         this.onNodeRegisteredEmitter.fire({ node });
         
         this.logger.info(`Node ${nodeId} registered with capabilities: ${registration.capabilities.join(', ')}`);
@@ -177,6 +178,9 @@ export class DistributedReasoningServiceImpl implements DistributedReasoningServ
         const node = this.nodeRegistry.get(nodeId);
         if (node) {
             this.nodeRegistry.delete(nodeId);
+            if (this.nodeRegistry.size === 0) {
+                this.stopHeartbeatMonitoring();
+            }
             
             // Clear heartbeat timer
             const timer = this.heartbeatTimers.get(nodeId);
@@ -681,10 +685,22 @@ export class DistributedReasoningServiceImpl implements DistributedReasoningServ
         }
     }
 
+    /**
+     * Check heartbeats only while nodes are registered, so an idle service runs no timer
+     */
     private startHeartbeatMonitoring(): void {
-        setInterval(() => {
-            this.checkNodeHeartbeats();
-        }, this.config.heartbeatInterval);
+        if (!this.heartbeatMonitor) {
+            this.heartbeatMonitor = setInterval(() => {
+                this.checkNodeHeartbeats();
+            }, this.config.heartbeatInterval);
+        }
+    }
+
+    private stopHeartbeatMonitoring(): void {
+        if (this.heartbeatMonitor) {
+            clearInterval(this.heartbeatMonitor);
+            this.heartbeatMonitor = undefined;
+        }
     }
 
     private startTaskProcessing(): void {
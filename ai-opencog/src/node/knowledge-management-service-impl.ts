@@ -31,6 +31,7 @@ import {
     KnowledgeValidationIssue
 } from '../common/knowledge-management-types';
 import { Atom } from '../common/opencog-types';
+import { estimateCollectionBytes } from '../common/memory-estimate';
 
 /**
  * Implementation of Knowledge Management Service
@@ -845,9 +846,7 @@ export class KnowledgeManagementServiceImpl implements KnowledgeManagementServic
     }
 
     private estimateMemoryUsage(): number {
-        // Simple memory usage estimation
-        const graphsSize = JSON.stringify(Array.from(this.knowledgeGraphs.values())).length;
-        const categoriesSize = JSON.stringify(Array.from(this.categories.values())).length;
-        return graphsSize + categoriesSize;
+        return estimateCollectionBytes(this.knowledgeGraphs.values(), this.knowledgeGraphs.size)
+            + estimateCollectionBytes(this.categories.values(), this.categories.size);
     }
 }
\ No newline at end of file
@@ -0,0 +1,185 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { LearningData } from '../common/opencog-types';
+
+export const DEFAULT_LEARNING_HISTORY_CAPACITY = 10000;
+
+/**
+ * Running aggregates over the retained learning records of one user
+ */
+export interface LearningUserSummary {
+    count: number;
+    /** Records whose feedback was marked helpful */
+    helpful: number;
+    /** Records per `context.currentTask` */
+    tasks: ReadonlyMap<string, number>;
+    /** Records with unhelpful feedback per `context.currentTask`, in order of first occurrence */
+    unhelpfulTasks: ReadonlyMap<string, number>;
+}
+
+interface UserEntries {
+    records: LearningData[];
+    /** Index of the user's oldest retained record in `records` */
+    head: number;
+    summary: {
+        count: number;
+        helpful: number;
+        tasks: Map<string, number>;
+        unhelpfulTasks: Map<string, number>;
+    };
+}
+
+/**
+ * Fixed-capacity history of learning records. Once full, each new record evicts the
+ * oldest one. Records are also indexed per user and counted per type, and per-user
+ * aggregates are kept up to date on insert and evict, so adaptation queries cost
+ * O(1) or O(user history) however long the service has been running.
+ */
+export class LearningHistory implements Iterable<LearningData> {
+
+    private readonly ring: (LearningData | undefined)[];
+    private start = 0;
+    private count = 0;
+    private recorded = 0;
+    private readonly users = new Map<string, UserEntries>();
+    private readonly types = new Map<LearningData['type'], number>();
+
+    constructor(readonly capacity: number = DEFAULT_LEARNING_HISTORY_CAPACITY) {
+        if (!(capacity >= 1)) {
+            throw new Error(`Learning history capacity must be at least 1, got ${capacity}`);
+        }
+        this.ring = new Array(capacity);
+    }
+
+    get length(): number {
+        return this.count;
+    }
+
+    /**
+     * Records pushed over the history's lifetime, including evicted and cleared ones
+     */
+    get totalRecorded(): number {
+        return this.recorded;
+    }
+
+    push(record: LearningData): void {
+        this.recorded++;
+        if (this.count === this.capacity) {
+            this.evict(this.ring[this.start]!);
+            this.ring[this.start] = record;
+            this.start = (this.start + 1) % this.capacity;
+        } else {
+            this.ring[(this.start + this.count) % this.capacity] = record;
+            this.count++;
+        }
+        this.index(record);
+    }
+
+    /**
+     * Records from oldest to newest
+     */
+    *[Symbol.iterator](): IterableIterator<LearningData> {
+        for (let i = 0; i < this.count; i++) {
+            yield this.ring[(this.start + i) % this.capacity]!;
+        }
+    }
+
+    /**
+     * Retained records of one user, oldest first
+     */
+    forUser(userId: string): LearningData[] {
+        const entries = this.users.get(userId);
+        return entries ? entries.records.slice(entries.head) : [];
+    }
+
+    userSummary(userId: string): LearningUserSummary | undefined {
+        return this.users.get(userId)?.summary;
+    }
+
+    countByType(type: LearningData['type']): number {
+        return this.types.get(type) ?? 0;
+    }
+
+    clear(): void {
+        this.ring.fill(undefined);
+        this.start = 0;
+        this.count = 0;
+        this.users.clear();
+        this.types.clear();
+    }
+
+    private index(record: LearningData): void {
+        this.types.set(record.type, this.countByType(record.type) + 1);
+        const userId = record.context?.userId;
+        if (userId === undefined) {
+            return;
+        }
+        let entries = this.users.get(userId);
+        if (!entries) {
+            entries = { records: [], head: 0, summary: { count: 0, helpful: 0, tasks: new Map(), unhelpfulTasks: new Map() } };
+            this.users.set(userId, entries);
+        }
+        entries.records.push(record);
+        this.aggregate(entries.summary, record, 1);
+    }
+
+    private evict(record: LearningData): void {
+        const remaining = this.countByType(record.type) - 1;
+        if (remaining > 0) {
+            this.types.set(record.type, remaining);
+        } else {
+            this.types.delete(record.type);
+        }
+        const userId = record.context?.userId;
+        const entries = userId !== undefined ? this.users.get(userId) : undefined;
+        if (!entries) {
+            return;
+        }
+        // Eviction is oldest-first globally, so it is oldest-first for the user as well
+        entries.records[entries.head++] = undefined!;
+        this.aggregate(entries.summary, record, -1);
+        if (entries.summary.count === 0) {
+            this.users.delete(userId!);
+        } else if (entries.head * 2 >= entries.records.length) {
+            entries.records = entries.records.slice(entries.head);
+            entries.head = 0;
+        }
+    }
+
+    private aggregate(summary: UserEntries['summary'], record: LearningData, delta: 1 | -1): void {
+        summary.count += delta;
+        if (record.feedback?.helpful) {
+            summary.helpful += delta;
+        }
+        const task = record.context?.currentTask;
+        if (task) {
+            LearningHistory.adjust(summary.tasks, task, delta);
+            if (record.feedback && !record.feedback.helpful) {
+                LearningHistory.adjust(summary.unhelpfulTasks, task, delta);
+            }
+        }
+    }
+
+    private static adjust(counts: Map<string, number>, key: string, delta: number): void {
+        const count = (counts.get(key) ?? 0) + delta;
+        if (count > 0) {
+            counts.set(key, count);
+        } else {
+            counts.delete(key);
+        }
+    }
+}
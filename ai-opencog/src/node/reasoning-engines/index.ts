@@ -14,6 +14,14 @@
 // SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
 // *****************************************************************************
 
-export { PLNReasoningEngine } from './pln-reasoning-engine';
+export { PLNReasoningEngine, calculateInferenceConfidence } from './pln-reasoning-engine';
 export { PatternMatchingEngine } from './pattern-matching-engine';
-export { CodeAnalysisReasoningEngine } from './code-analysis-reasoning-engine';
\ No newline at end of file
+export { CodeAnalysisReasoningEngine } from './code-analysis-reasoning-engine';
+export { PLNForwardChainer, ForwardChainerOptions, ForwardChainerMetrics, ForwardChainResult } from './pln-forward-chainer';
+export { PLNBackwardChainer, BackwardChainerOptions, BackwardChainResult } from './pln-backward-chainer';
+export { PLNRuleNetwork, RuleNetworkOptions, RuleNetworkUpdate } from './pln-rule-network';
+export {
+    mineFrequentItemsets, mineSequentialPatterns, MiningTransaction, FrequentItemset, SequentialPattern,
+    PatternMiningOptions, SequentialPatternOptions
+} from './pattern-miner';
+export { MinHashIndex, MinHashIndexOptions } from './minhash-index';
@@ -0,0 +1,117 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+export interface MinHashIndexOptions {
+    /** LSH bands; more bands find more of the less similar pairs */
+    bands?: number;
+    /** MinHash values per band; more rows make buckets more selective */
+    rows?: number;
+}
+
+/**
+ * Locality-sensitive index over token sets, by MinHash banding.
+ *
+ * Each entry gets a signature of `bands * rows` MinHash values; two entries are
+ * candidates when all rows of some band agree, which happens with probability
+ * `1 - (1 - J^rows)^bands` for token sets of Jaccard similarity J. The defaults (16
+ * bands of 2 rows) find pairs with J = 0.5 with a probability of about 99%. Candidates
+ * still need an exact similarity check.
+ */
+export class MinHashIndex {
+
+    private readonly bands: number;
+    private readonly rows: number;
+    private readonly seeds: number[];
+    private readonly buckets = new Map<string, Set<number>>();
+    private readonly bandKeys = new Map<number, string[]>();
+
+    constructor(options: MinHashIndexOptions = {}) {
+        this.bands = options.bands ?? 16;
+        this.rows = options.rows ?? 2;
+        this.seeds = Array.from({ length: this.bands * this.rows }, (_, i) => mix(i + 1));
+    }
+
+    add(id: number, tokens: Iterable<string>): void {
+        const hashes = Array.from(new Set(tokens), hashString);
+        if (hashes.length === 0) {
+            return;
+        }
+        const signature = this.seeds.map(seed => {
+            let min = Infinity;
+            for (const hash of hashes) {
+                min = Math.min(min, mix(hash ^ seed));
+            }
+            return min;
+        });
+        const keys: string[] = [];
+        for (let band = 0; band < this.bands; band++) {
+            const key = `${band}:${signature.slice(band * this.rows, (band + 1) * this.rows).join(',')}`;
+            let bucket = this.buckets.get(key);
+            if (!bucket) {
+                bucket = new Set();
+                this.buckets.set(key, bucket);
+            }
+            bucket.add(id);
+            keys.push(key);
+        }
+        this.bandKeys.set(id, keys);
+    }
+
+    remove(id: number): void {
+        for (const key of this.bandKeys.get(id) ?? []) {
+            const bucket = this.buckets.get(key)!;
+            bucket.delete(id);
+            if (bucket.size === 0) {
+                this.buckets.delete(key);
+            }
+        }
+        this.bandKeys.delete(id);
+    }
+
+    /**
+     * Entries sharing a bucket with `id`, excluding `id` itself
+     */
+    candidates(id: number): Set<number> {
+        const candidates = new Set<number>();
+        for (const key of this.bandKeys.get(id) ?? []) {
+            for (const candidate of this.buckets.get(key)!) {
+                candidates.add(candidate);
+            }
+        }
+        candidates.delete(id);
+        return candidates;
+    }
+}
+
+/** FNV-1a */
+function hashString(value: string): number {
+    let hash = 0x811c9dc5;
+    for (let i = 0; i < value.length; i++) {
+        hash = Math.imul(hash ^ value.charCodeAt(i), 0x01000193);
+    }
+    return hash >>> 0;
+}
+
+/** Murmur3 finalizer */
+function mix(value: number): number {
+    let hash = value;
+    hash ^= hash >>> 16;
+    hash = Math.imul(hash, 0x85ebca6b);
+    hash ^= hash >>> 13;
+    hash = Math.imul(hash, 0xc2b2ae35);
+    hash ^= hash >>> 16;
+    return hash >>> 0;
+}
@@ -16,6 +16,21 @@
 
 import { injectable } from '@theia/core/shared/inversify';
 import { Atom, PatternInput, PatternResult, ReasoningQuery, ReasoningResult } from '../../common';
+import { MinHashIndex } from './minhash-index';
+
+/**
+ * Node of an atom hierarchy; the optional fields are filled in once per hierarchy
+ * when it is searched for common substructures
+ */
+interface HierarchyNode {
+    atom: Atom;
+    children: HierarchyNode[];
+    depth?: number;
+    /** Largest number of children of any node in the subtree */
+    branchingFactor?: number;
+    /** Shared by exactly the subtrees of the same shape */
+    structure?: number;
+}
 
 /**
  * Advanced pattern matching reasoning engine
@@ -277,30 +292,65 @@ export class PatternMatchingEngine {
     }
 
     /**
-     * Find sequential patterns in atoms
+     * Find sequential patterns in atoms: from each start, the chain that keeps moving to
+     * the next atom related to the current one. One backward pass finds the next related
+     * atom of every position from indexes of the atoms after it, and identifies each
+     * chain by interning its first atom's key with the ID of the chain that follows, so
+     * the work is linear in the atoms plus the size of the sequences returned.
      */
     private findSequentialPatterns(atoms: Atom[]): Atom[][] {
-        const sequences: Atom[][] = [];
-        const visited = new Set<string>();
-
-        for (let i = 0; i < atoms.length - 2; i++) {
-            const sequence = [atoms[i]];
-            let current = atoms[i];
-
-            // Look for continuation of sequence
-            for (let j = i + 1; j < atoms.length; j++) {
-                if (this.isSequentiallyRelated(current, atoms[j])) {
-                    sequence.push(atoms[j]);
-                    current = atoms[j];
+        const next = new Array<number>(atoms.length);
+        const lengths = new Array<number>(atoms.length);
+        const chainIds = new Array<number>(atoms.length);
+        const chains = new Map<string, number>();
+
+        // Nearest later position by feature: outgoing elements of atoms that have an
+        // outgoing set, types of atoms that do not, and types of all atoms
+        const byElement = new Map<string, number>();
+        const byTypeWithoutOutgoing = new Map<string, number>();
+        const byType = new Map<string, number>();
+
+        for (let i = atoms.length - 1; i >= 0; i--) {
+            const atom = atoms[i];
+            const elements = atom.outgoing && this.outgoingElements(atom.outgoing);
+            let following = Infinity;
+            if (elements) {
+                for (const element of elements) {
+                    following = Math.min(following, byElement.get(element) ?? Infinity);
                 }
+                following = Math.min(following, byTypeWithoutOutgoing.get(atom.type) ?? Infinity);
+            } else {
+                following = byType.get(atom.type) ?? Infinity;
             }
+            next[i] = following === Infinity ? -1 : following;
+            lengths[i] = next[i] < 0 ? 1 : lengths[next[i]] + 1;
+
+            const chainKey = JSON.stringify([atom.id || atom.name || '', next[i] < 0 ? -1 : chainIds[next[i]]]);
+            let chainId = chains.get(chainKey);
+            if (chainId === undefined) {
+                chainId = chains.size;
+                chains.set(chainKey, chainId);
+            }
+            chainIds[i] = chainId;
 
-            if (sequence.length >= 3) {
-                const key = sequence.map(a => a.id || a.name).join('-');
-                if (!visited.has(key)) {
-                    sequences.push(sequence);
-                    visited.add(key);
+            if (elements) {
+                elements.forEach(element => byElement.set(element, i));
+            } else {
+                byTypeWithoutOutgoing.set(atom.type, i);
+            }
+            byType.set(atom.type, i);
+        }
+
+        const sequences: Atom[][] = [];
+        const visited = new Set<number>();
+        for (let i = 0; i < atoms.length - 2; i++) {
+            if (lengths[i] >= 3 && !visited.has(chainIds[i])) {
+                const sequence: Atom[] = [];
+                for (let position = i; position >= 0; position = next[position]) {
+                    sequence.push(atoms[position]);
                 }
+                sequences.push(sequence);
+                visited.add(chainIds[i]);
             }
         }
 
@@ -308,19 +358,10 @@ export class PatternMatchingEngine {
     }
 
     /**
-     * Check if two atoms are sequentially related
+     * Keys of the names and types of outgoing atoms; atoms sharing a key share an element
      */
-    private isSequentiallyRelated(atom1: Atom, atom2: Atom): boolean {
-        // Simple heuristic - atoms are related if they share common elements
-        if (atom1.outgoing && atom2.outgoing) {
-            return atom1.outgoing.some(child1 => 
-                atom2.outgoing!.some(child2 => 
-                    child1.name === child2.name || child1.type === child2.type
-                )
-            );
-        }
-        
-        return atom1.type === atom2.type;
+    private outgoingElements(outgoing: Atom[]): string[] {
+        return outgoing.flatMap(child => [`name:${child.name}`, `type:${child.type}`]);
     }
 
     /**
@@ -359,7 +400,7 @@ export class PatternMatchingEngine {
     /**
      * Build hierarchies from atoms
      */
-    private buildHierarchies(atoms: Atom[]): any[] {
+    private buildHierarchies(atoms: Atom[]): HierarchyNode[] {
         const hierarchies = [];
         const processed = new Set<string>();
 
@@ -378,10 +419,10 @@ export class PatternMatchingEngine {
     /**
      * Build hierarchy tree starting from an atom
      */
-    private buildHierarchyTree(root: Atom, allAtoms: Atom[], processed: Set<string>): any {
-        const tree = {
+    private buildHierarchyTree(root: Atom, allAtoms: Atom[], processed: Set<string>): HierarchyNode {
+        const tree: HierarchyNode = {
             atom: root,
-            children: [] as any[]
+            children: []
         };
 
         processed.add(root.id || root.name || '');
@@ -401,9 +442,10 @@ export class PatternMatchingEngine {
     /**
      * Find common hierarchical patterns
      */
-    private findCommonHierarchicalPatterns(hierarchy: any): any[] {
+    private findCommonHierarchicalPatterns(hierarchy: HierarchyNode): any[] {
         const patterns = [];
         const subtrees = this.extractSubtrees(hierarchy);
+        this.annotateSubtrees(subtrees);
         const subtreeGroups = this.groupSimilarSubtrees(subtrees);
 
         for (const group of subtreeGroups) {
@@ -416,117 +458,165 @@ export class PatternMatchingEngine {
     }
 
     /**
-     * Extract subtrees from hierarchy
+     * Extract subtrees from hierarchy, parents before their children
      */
-    private extractSubtrees(hierarchy: any): any[] {
-        const subtrees = [hierarchy];
-        
-        for (const child of hierarchy.children) {
-            subtrees.push(...this.extractSubtrees(child));
+    private extractSubtrees(hierarchy: HierarchyNode): HierarchyNode[] {
+        const subtrees: HierarchyNode[] = [];
+        const stack = [hierarchy];
+
+        while (stack.length > 0) {
+            const subtree = stack.pop()!;
+            subtrees.push(subtree);
+            for (let i = subtree.children.length - 1; i >= 0; i--) {
+                stack.push(subtree.children[i]);
+            }
         }
-        
+
         return subtrees;
     }
 
     /**
-     * Group similar subtrees
+     * Annotate subtrees bottom-up with their depth, branching factor and structure ID.
+     * Like a Merkle hash, the structure ID is derived from the root type and the
+     * structure IDs of the children in order, so subtrees share an ID exactly when they
+     * have the same shape. IDs are interned rather than hashed, so they never collide.
      */
-    private groupSimilarSubtrees(subtrees: any[]): any[][] {
-        const groups: any[][] = [];
-        const used = new Set<number>();
+    private annotateSubtrees(subtrees: HierarchyNode[]): void {
+        const structures = new Map<string, number>();
 
-        for (let i = 0; i < subtrees.length; i++) {
-            if (used.has(i)) continue;
-            
-            const group = [subtrees[i]];
-            used.add(i);
-            
-            for (let j = i + 1; j < subtrees.length; j++) {
-                if (!used.has(j) && this.areSubtreesSimilar(subtrees[i], subtrees[j])) {
-                    group.push(subtrees[j]);
-                    used.add(j);
-                }
+        // Every subtree comes after its parent, so walking backwards visits children first
+        for (let i = subtrees.length - 1; i >= 0; i--) {
+            const subtree = subtrees[i];
+            let depth = 0;
+            let branchingFactor = subtree.children.length;
+            for (const child of subtree.children) {
+                depth = Math.max(depth, child.depth!);
+                branchingFactor = Math.max(branchingFactor, child.branchingFactor!);
             }
-            
-            groups.push(group);
+            subtree.depth = depth + 1;
+            subtree.branchingFactor = branchingFactor;
+
+            const key = JSON.stringify([subtree.atom.type, ...subtree.children.map(child => child.structure)]);
+            let structure = structures.get(key);
+            if (structure === undefined) {
+                structure = structures.size;
+                structures.set(key, structure);
+            }
+            subtree.structure = structure;
         }
-
-        return groups;
     }
 
     /**
-     * Check if two subtrees are similar
+     * Group subtrees of the same shape, in order of first occurrence
      */
-    private areSubtreesSimilar(tree1: any, tree2: any): boolean {
-        if (tree1.atom.type !== tree2.atom.type) return false;
-        if (tree1.children.length !== tree2.children.length) return false;
-        
-        // Check if children have similar structure
-        for (let i = 0; i < tree1.children.length; i++) {
-            if (!this.areSubtreesSimilar(tree1.children[i], tree2.children[i])) {
-                return false;
+    private groupSimilarSubtrees(subtrees: HierarchyNode[]): HierarchyNode[][] {
+        const groups = new Map<number, HierarchyNode[]>();
+
+        for (const subtree of subtrees) {
+            const group = groups.get(subtree.structure!);
+            if (group) {
+                group.push(subtree);
+            } else {
+                groups.set(subtree.structure!, [subtree]);
             }
         }
-        
-        return true;
+
+        return Array.from(groups.values());
     }
 
     /**
      * Extract common pattern from subtree group
      */
-    private extractCommonPattern(group: any[]): any {
-        const template = group[0];
+    private extractCommonPattern(group: HierarchyNode[]): any {
+        const structure = this.extractStructureTemplate(group[0]);
         return {
-            structure: this.extractStructureTemplate(template),
+            structure,
             instances: group,
-            frequency: group.length
+            frequency: group.length,
+            depth: structure.depth,
+            childCount: structure.childCount,
+            branchingFactor: structure.branchingFactor
         };
     }
 
     /**
      * Extract structure template
      */
-    private extractStructureTemplate(subtree: any): any {
+    private extractStructureTemplate(subtree: HierarchyNode): any {
         return {
             rootType: subtree.atom.type,
-            depth: this.calculateSubtreeDepth(subtree),
+            depth: subtree.depth,
             childCount: subtree.children.length,
-            childTypes: subtree.children.map((child: any) => child.atom.type)
+            branchingFactor: subtree.branchingFactor,
+            childTypes: subtree.children.map(child => child.atom.type)
         };
     }
 
     /**
-     * Calculate subtree depth
-     */
-    private calculateSubtreeDepth(subtree: any): number {
-        if (subtree.children.length === 0) return 1;
-        
-        return 1 + Math.max(...subtree.children.map((child: any) => 
-            this.calculateSubtreeDepth(child)
-        ));
-    }
-
-    /**
-     * Cluster atoms by semantic similarity
+     * Cluster atoms by semantic similarity. Each cluster starts from the first atom not
+     * yet clustered and takes every remaining atom related to it: atoms of the same
+     * type, atoms sharing an outgoing element's name or type, and atoms with similar
+     * names. Related atoms are looked up in indexes built once, with names pre-tokenized
+     * and bucketed by MinHash, instead of comparing every pair; clustered atoms leave
+     * the indexes. Similar names are therefore found with high probability rather than
+     * with certainty.
      */
     private clusterAtomsBySemantic(atoms: Atom[]): Atom[][] {
         const clusters: Atom[][] = [];
         const used = new Set<string>();
+        const keys = atoms.map(atom => atom.id || atom.name || '');
+        const words = atoms.map(atom => atom.name ? this.tokenizeName(atom.name) : undefined);
+        const elements = atoms.map(atom => this.outgoingElements(atom.outgoing || []));
+
+        const byType = new Map<string, Set<number>>();
+        const byElement = new Map<string, Set<number>>();
+        const names = new MinHashIndex();
+        const addTo = (index: Map<string, Set<number>>, key: string, i: number) => {
+            let members = index.get(key);
+            if (!members) {
+                members = new Set();
+                index.set(key, members);
+            }
+            members.add(i);
+        };
+        atoms.forEach((atom, i) => {
+            addTo(byType, atom.type, i);
+            elements[i].forEach(element => addTo(byElement, element, i));
+            if (words[i]) {
+                names.add(i, words[i]!);
+            }
+        });
+        const retire = (i: number) => {
+            byType.get(atoms[i].type)!.delete(i);
+            elements[i].forEach(element => byElement.get(element)!.delete(i));
+            names.remove(i);
+        };
 
-        for (const atom of atoms) {
-            const atomId = atom.id || atom.name || '';
-            if (used.has(atomId)) continue;
-
-            const cluster = [atom];
-            used.add(atomId);
+        for (let i = 0; i < atoms.length; i++) {
+            if (used.has(keys[i])) continue;
 
-            for (const other of atoms) {
-                const otherId = other.id || other.name || '';
-                if (!used.has(otherId) && this.areSemanticallyRelated(atom, other)) {
-                    cluster.push(other);
-                    used.add(otherId);
+            used.add(keys[i]);
+            const related = new Set(byType.get(atoms[i].type));
+            elements[i].forEach(element => byElement.get(element)!.forEach(j => related.add(j)));
+            if (words[i]) {
+                for (const j of names.candidates(i)) {
+                    if (this.calculateNameSimilarity(words[i]!, words[j]!) > 0.6) {
+                        related.add(j);
+                    }
                 }
             }
+            related.delete(i);
+            retire(i);
+
+            const cluster = [atoms[i]];
+            for (const j of Array.from(related).sort((a, b) => a - b)) {
+                if (!used.has(keys[j])) {
+                    cluster.push(atoms[j]);
+                    used.add(keys[j]);
+                }
+                // Atoms whose key is taken can no longer join a cluster either
+                retire(j);
+            }
 
             if (cluster.length >= 2) {
                 clusters.push(cluster);
@@ -536,46 +626,18 @@ export class PatternMatchingEngine {
         return clusters;
     }
 
-    /**
-     * Check if two atoms are semantically related
-     */
-    private areSemanticallyRelated(atom1: Atom, atom2: Atom): boolean {
-        // Simple semantic similarity based on names and types
-        if (atom1.name && atom2.name) {
-            const similarity = this.calculateNameSimilarity(atom1.name, atom2.name);
-            if (similarity > 0.6) return true;
-        }
-        
-        if (atom1.type === atom2.type) return true;
-        
-        return this.shareCommonElements(atom1, atom2);
+    private tokenizeName(name: string): string[] {
+        return name.toLowerCase().split(/[_\-\s]+/);
     }
 
     /**
-     * Calculate name similarity
+     * Calculate name similarity between tokenized names
      */
-    private calculateNameSimilarity(name1: string, name2: string): number {
-        const words1 = name1.toLowerCase().split(/[_\-\s]+/);
-        const words2 = name2.toLowerCase().split(/[_\-\s]+/);
-        
+    private calculateNameSimilarity(words1: string[], words2: string[]): number {
         const commonWords = words1.filter(word => words2.includes(word));
         return commonWords.length / Math.max(words1.length, words2.length);
     }
 
-    /**
-     * Check if atoms share common elements
-     */
-    private shareCommonElements(atom1: Atom, atom2: Atom): boolean {
-        if (atom1.outgoing && atom2.outgoing) {
-            return atom1.outgoing.some(child1 => 
-                atom2.outgoing!.some(child2 => 
-                    child1.name === child2.name || child1.type === child2.type
-                )
-            );
-        }
-        return false;
-    }
-
     /**
      * Extract semantic pattern from cluster
      */
@@ -799,7 +861,7 @@ export class PatternMatchingEngine {
     }
 
     private calculateBranchingFactor(structure: any): number {
-        return structure.childCount || 0;
+        return structure.branchingFactor || structure.childCount || 0;
     }
 
     private calculateHierarchicalComplexity(structure: any): 'simple' | 'moderate' | 'complex' {
@@ -0,0 +1,229 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+/**
+ * A transaction for frequent-itemset mining, with an optional score summed over the
+ * transactions that contain an itemset (for example 1 for a positive example)
+ */
+export interface MiningTransaction {
+    items: readonly string[];
+    score?: number;
+}
+
+export interface FrequentItemset {
+    items: string[];
+    /** Transactions containing every item */
+    support: number;
+    /** Sum of the scores of those transactions */
+    score: number;
+}
+
+export interface SequentialPattern {
+    sequence: string[];
+    /** Sequences containing the pattern at least once */
+    support: number;
+    /** Contiguous runs matching the pattern, overlapping ones included; only counted when `maxGap` is 1 */
+    occurrences?: number;
+}
+
+export interface PatternMiningOptions {
+    /** Minimum support, as a number of transactions or sequences */
+    minSupport: number;
+    /** Longest itemset or sequence to report */
+    maxLength?: number;
+}
+
+export interface SequentialPatternOptions extends PatternMiningOptions {
+    /** Largest distance between consecutive pattern elements in a sequence; 1 only matches contiguous runs */
+    maxGap?: number;
+    /**
+     * Measure `minSupport` in occurrences rather than sequences, so that a run repeated
+     * within one sequence counts each time; requires `maxGap` 1
+     */
+    countOccurrences?: boolean;
+}
+
+interface FPNode {
+    item: string;
+    count: number;
+    score: number;
+    parent: FPNode | undefined;
+    children: Map<string, FPNode>;
+    /** Next node holding the same item */
+    link: FPNode | undefined;
+}
+
+interface FPHeader {
+    count: number;
+    score: number;
+    nodes: FPNode | undefined;
+}
+
+interface WeightedItems {
+    items: readonly string[];
+    count: number;
+    score: number;
+}
+
+/**
+ * Frequent itemsets by FP-growth. Transactions are compressed into a prefix tree of
+ * their frequent items, ordered by descending frequency; itemsets are grown from the
+ * conditional tree of each item, so items below `minSupport` are pruned before any
+ * combination of them is considered and transactions are scanned twice in total.
+ */
+export function mineFrequentItemsets(transactions: Iterable<MiningTransaction>, options: PatternMiningOptions): FrequentItemset[] {
+    const weighted: WeightedItems[] = [];
+    for (const transaction of transactions) {
+        weighted.push({ items: Array.from(new Set(transaction.items)), count: 1, score: transaction.score ?? 0 });
+    }
+    const itemsets: FrequentItemset[] = [];
+    growItemsets(weighted, [], options.minSupport, options.maxLength ?? Infinity, itemsets);
+    return itemsets;
+}
+
+function growItemsets(base: WeightedItems[], suffix: string[], minSupport: number, maxLength: number, itemsets: FrequentItemset[]): void {
+    const header = buildFPTree(base, minSupport);
+    // Least frequent first, so each conditional base only holds more frequent items
+    const items = Array.from(header.keys()).reverse();
+    for (const item of items) {
+        const { count, score, nodes } = header.get(item)!;
+        const itemset = [item, ...suffix];
+        itemsets.push({ items: itemset, support: count, score });
+        if (itemset.length >= maxLength) {
+            continue;
+        }
+        const conditional: WeightedItems[] = [];
+        for (let node = nodes; node; node = node.link) {
+            const path: string[] = [];
+            for (let ancestor = node.parent; ancestor?.parent; ancestor = ancestor.parent) {
+                path.push(ancestor.item);
+            }
+            if (path.length > 0) {
+                conditional.push({ items: path, count: node.count, score: node.score });
+            }
+        }
+        if (conditional.length > 0) {
+            growItemsets(conditional, itemset, minSupport, maxLength, itemsets);
+        }
+    }
+}
+
+/**
+ * Build an FP-tree and return its header table, in descending item frequency
+ */
+function buildFPTree(base: WeightedItems[], minSupport: number): Map<string, FPHeader> {
+    const counts = new Map<string, number>();
+    for (const { items, count } of base) {
+        for (const item of items) {
+            counts.set(item, (counts.get(item) ?? 0) + count);
+        }
+    }
+    const order = Array.from(counts.entries())
+        .filter(([, count]) => count >= minSupport)
+        .sort(([a, countA], [b, countB]) => countB - countA || (a < b ? -1 : a > b ? 1 : 0))
+        .map(([item]) => item);
+    const rank = new Map(order.map((item, index) => [item, index]));
+    const header = new Map<string, FPHeader>(order.map(item => [item, { count: 0, score: 0, nodes: undefined }]));
+
+    const root: FPNode = { item: '', count: 0, score: 0, parent: undefined, children: new Map(), link: undefined };
+    for (const { items, count, score } of base) {
+        const frequent = items.filter(item => rank.has(item)).sort((a, b) => rank.get(a)! - rank.get(b)!);
+        let node = root;
+        for (const item of frequent) {
+            let child = node.children.get(item);
+            if (!child) {
+                const entry = header.get(item)!;
+                child = { item, count: 0, score: 0, parent: node, children: new Map(), link: entry.nodes };
+                entry.nodes = child;
+                node.children.set(item, child);
+            }
+            child.count += count;
+            child.score += score;
+            const entry = header.get(item)!;
+            entry.count += count;
+            entry.score += score;
+            node = child;
+        }
+    }
+    return header;
+}
+
+interface Projection {
+    sequence: number;
+    /** Positions where the current prefix ends in the sequence, ascending */
+    ends: number[];
+}
+
+/**
+ * Sequential patterns by PrefixSpan. Each frequent prefix keeps a pseudo-projected
+ * database (the positions where the prefix ends in each supporting sequence), and is
+ * extended only by items that occur after those positions in at least `minSupport`
+ * sequences. Without a gap constraint the earliest end per sequence suffices; with
+ * one, every end is kept so that no match is missed. With `maxGap` 1 each end is a
+ * distinct contiguous run, so the ends also count occurrences, which shrink as a
+ * pattern grows and can prune in place of sequences.
+ */
+export function mineSequentialPatterns(sequences: readonly (readonly string[])[], options: SequentialPatternOptions): SequentialPattern[] {
+    const maxLength = options.maxLength ?? Infinity;
+    const maxGap = options.maxGap ?? Infinity;
+    const contiguous = maxGap === 1;
+    if (options.countOccurrences && !contiguous) {
+        throw new Error('Occurrences can only be counted for contiguous patterns (maxGap 1)');
+    }
+    const patterns: SequentialPattern[] = [];
+
+    const grow = (prefix: string[], projected: Projection[]) => {
+        const extensions = new Map<string, Projection[]>();
+        for (const { sequence, ends } of projected) {
+            const elements = sequences[sequence];
+            const found = new Map<string, number[]>();
+            for (const end of ends) {
+                const last = prefix.length === 0 ? elements.length - 1 : Math.min(elements.length - 1, end + maxGap);
+                for (let position = end + 1; position <= last; position++) {
+                    const positions = found.get(elements[position]);
+                    if (!positions) {
+                        found.set(elements[position], [position]);
+                    } else if (maxGap !== Infinity && position > positions[positions.length - 1]) {
+                        positions.push(position);
+                    }
+                }
+            }
+            for (const [item, positions] of found) {
+                let projection = extensions.get(item);
+                if (!projection) {
+                    projection = [];
+                    extensions.set(item, projection);
+                }
+                projection.push({ sequence, ends: positions });
+            }
+        }
+        for (const [item, projection] of extensions) {
+            const occurrences = contiguous ? projection.reduce((sum, { ends }) => sum + ends.length, 0) : undefined;
+            if ((options.countOccurrences ? occurrences! : projection.length) >= options.minSupport) {
+                const pattern = [...prefix, item];
+                patterns.push(contiguous
+                    ? { sequence: pattern, support: projection.length, occurrences }
+                    : { sequence: pattern, support: projection.length });
+                if (pattern.length < maxLength) {
+                    grow(pattern, projection);
+                }
+            }
+        }
+    };
+
+    grow([], sequences.map((_, sequence) => ({ sequence, ends: [-1] })));
+    return patterns;
+}
@@ -0,0 +1,236 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { Atom, TruthValue } from '../../common';
+import { contentKey, INFERENCE_DISCOUNT } from './pln-forward-chainer';
+
+export interface BackwardChainerOptions {
+    /** Rule applications allowed between a goal and the facts that prove it */
+    maxDepth?: number;
+    /** Wall-clock budget of one `prove` call; when spent, the best answer found so far is returned */
+    timeBudgetMs?: number;
+}
+
+/**
+ * Outcome of proving one goal
+ */
+export interface BackwardChainResult {
+    /** The goal with the truth value found for it, if any */
+    goal: Atom;
+    truthValue?: TruthValue;
+    /** Subgoals expanded by this call */
+    subgoals: number;
+    /** Subgoals answered from the table */
+    tableHits: number;
+    /** Whether some branch was cut at `maxDepth` */
+    depthLimited: boolean;
+    /** Whether the time budget ran out before the search finished */
+    timedOut: boolean;
+    durationMs: number;
+}
+
+interface Solution {
+    truthValue?: TruthValue;
+    /** Some branch below was cut by the depth budget */
+    cut: boolean;
+    /** Lowest stack position of a goal still being solved that the search ran into */
+    open: number;
+}
+
+interface TableEntry {
+    truthValue?: TruthValue;
+    /** Depth the answer was solved with; Infinity when no branch was cut */
+    depth: number;
+}
+
+/**
+ * PLN backward chainer for "is X true?" queries.
+ *
+ * A goal is answered from the facts known about it and decomposed into subgoals
+ * through the rules that conclude it: modus ponens over `ImplicationLink(A, goal)`,
+ * and deduction over `InheritanceLink(Y, Z)` for a goal `InheritanceLink(X, Z)`,
+ * with `InheritanceLink(X, Y)` as subgoal. The most confident answer wins.
+ *
+ * Solved subgoals are tabled with their truth value, so a subgoal shared by several
+ * branches, goals or `prove` calls is solved once. A subgoal that is already being
+ * solved further up is answered from its facts alone, which ends recursion; goals
+ * whose answer depended on such an unfinished ancestor are not tabled until that
+ * ancestor completes. Adding atoms clears the table.
+ */
+export class PLNBackwardChainer {
+
+    private readonly maxDepth: number;
+    private readonly timeBudgetMs: number;
+
+    private readonly facts = new Map<string, TruthValue>();
+    private readonly implicationsByConsequent = new Map<string, Atom[]>();
+    private readonly inheritanceByTarget = new Map<string, Atom[]>();
+    private readonly table = new Map<string, TableEntry>();
+    /** Goals being solved, by content key, with their stack position */
+    private readonly stack = new Map<string, number>();
+
+    private deadline = 0;
+    private subgoals = 0;
+    private tableHits = 0;
+    private depthLimited = false;
+    private timedOut = false;
+
+    constructor(options: BackwardChainerOptions = {}) {
+        this.maxDepth = options.maxDepth ?? 10;
+        this.timeBudgetMs = options.timeBudgetMs ?? 100;
+    }
+
+    get tableSize(): number {
+        return this.table.size;
+    }
+
+    add(atoms: Iterable<Atom>): void {
+        for (const atom of atoms) {
+            this.addAtom(atom);
+        }
+        this.table.clear();
+    }
+
+    prove(goal: Atom): BackwardChainResult {
+        const start = performance.now();
+        this.deadline = start + this.timeBudgetMs;
+        this.subgoals = 0;
+        this.tableHits = 0;
+        this.depthLimited = false;
+        this.timedOut = false;
+
+        const { truthValue } = this.solve(goal, contentKey(goal), this.maxDepth);
+        return {
+            goal: truthValue ? { ...goal, truthValue } : goal,
+            truthValue,
+            subgoals: this.subgoals,
+            tableHits: this.tableHits,
+            depthLimited: this.depthLimited,
+            timedOut: this.timedOut,
+            durationMs: performance.now() - start
+        };
+    }
+
+    private addAtom(atom: Atom): void {
+        const key = contentKey(atom);
+        if (atom.truthValue && PLNBackwardChainer.improves(atom.truthValue, this.facts.get(key))) {
+            this.facts.set(key, atom.truthValue);
+        }
+        if (!atom.truthValue || atom.outgoing?.length !== 2) {
+            return;
+        }
+        const [source, target] = atom.outgoing;
+        if (atom.type === 'ImplicationLink') {
+            PLNBackwardChainer.index(this.implicationsByConsequent, contentKey(target), atom);
+        } else if (atom.type === 'InheritanceLink') {
+            PLNBackwardChainer.index(this.inheritanceByTarget, contentKey(target), atom);
+        }
+        // Premises carrying their own truth values are facts as well
+        this.addAtom(source);
+        this.addAtom(target);
+    }
+
+    private solve(goal: Atom, key: string, depth: number): Solution {
+        const tabled = this.table.get(key);
+        if (tabled && tabled.depth >= depth) {
+            this.tableHits++;
+            return { truthValue: tabled.truthValue, cut: tabled.depth !== Infinity, open: Infinity };
+        }
+        let best = this.facts.get(key);
+        const ancestor = this.stack.get(key);
+        if (ancestor !== undefined) {
+            return { truthValue: best, cut: false, open: ancestor };
+        }
+
+        const implications = this.implicationsByConsequent.get(key) ?? [];
+        const [subject, target] = goal.type === 'InheritanceLink' && goal.outgoing?.length === 2 ? goal.outgoing : [];
+        const inheritances = target ? this.inheritanceByTarget.get(contentKey(target)) ?? [] : [];
+        if (implications.length === 0 && inheritances.length === 0) {
+            return { truthValue: best, cut: false, open: Infinity };
+        }
+        if (depth === 0) {
+            this.depthLimited = true;
+            return { truthValue: best, cut: true, open: Infinity };
+        }
+        if (this.timedOut || performance.now() > this.deadline) {
+            this.timedOut = true;
+            return { truthValue: best, cut: true, open: Infinity };
+        }
+
+        const position = this.stack.size;
+        this.stack.set(key, position);
+        this.subgoals++;
+        let cut = false;
+        let open = Infinity;
+        const consider = (premise: Solution, rule: TruthValue) => {
+            cut ||= premise.cut;
+            open = Math.min(open, premise.open);
+            if (premise.truthValue) {
+                const conclusion = PLNBackwardChainer.chain(premise.truthValue, rule);
+                if (PLNBackwardChainer.improves(conclusion, best)) {
+                    best = conclusion;
+                }
+            }
+        };
+
+        // Modus ponens: ImplicationLink(A, goal), A ⊢ goal
+        for (const implication of implications) {
+            const antecedent = implication.outgoing![0];
+            consider(this.solve(antecedent, contentKey(antecedent), depth - 1), implication.truthValue!);
+        }
+        // Deduction: InheritanceLink(X, Y), InheritanceLink(Y, Z) ⊢ InheritanceLink(X, Z)
+        const subjectKey = subject && contentKey(subject);
+        for (const inheritance of inheritances) {
+            const middle = inheritance.outgoing![0];
+            if (contentKey(middle) === subjectKey) {
+                continue;
+            }
+            const subgoal: Atom = { type: 'InheritanceLink', outgoing: [subject!, middle] };
+            consider(this.solve(subgoal, contentKey(subgoal), depth - 1), inheritance.truthValue!);
+        }
+        this.stack.delete(key);
+
+        // Answers resting on an unfinished ancestor or an exhausted budget may still change
+        if (open >= position && !this.timedOut) {
+            this.table.set(key, { truthValue: best, depth: cut ? depth : Infinity });
+        }
+        return { truthValue: best, cut, open: open >= position ? Infinity : open };
+    }
+
+    /**
+     * Truth value of a conclusion drawn from a premise through a rule; shared by modus
+     * ponens and deduction, which reduce to the same product without term probabilities
+     */
+    private static chain(premise: TruthValue, rule: TruthValue): TruthValue {
+        return {
+            strength: premise.strength * rule.strength,
+            confidence: Math.min(premise.confidence, rule.confidence) * INFERENCE_DISCOUNT
+        };
+    }
+
+    private static improves(candidate: TruthValue, known: TruthValue | undefined): boolean {
+        return known === undefined || candidate.confidence > known.confidence;
+    }
+
+    private static index(index: Map<string, Atom[]>, key: string, atom: Atom): void {
+        const atoms = index.get(key);
+        if (atoms) {
+            atoms.push(atom);
+        } else {
+            index.set(key, [atom]);
+        }
+    }
+}
@@ -0,0 +1,283 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { Atom, TruthValue } from '../../common';
+import { contentAtomId, derivedAtomId } from '../atomspace';
+
+export interface ForwardChainerOptions {
+    /** Rule applications per run; a run that reaches it stops before the fixpoint and resumes on the next run */
+    maxSteps?: number;
+    /** Agenda order: truth-value confidence, or short-term importance */
+    priority?: 'confidence' | 'attention';
+    /** Strength an atom needs to fire the rules it is the antecedent of */
+    strengthThreshold?: number;
+    /** Confidence an atom needs to fire the rules it is the antecedent of */
+    confidenceThreshold?: number;
+}
+
+/**
+ * Cumulative forward-chaining throughput
+ */
+export interface ForwardChainerMetrics {
+    steps: number;
+    derived: number;
+    durationMs: number;
+    stepsPerSecond: number;
+    derivedPerSecond: number;
+    rules: number;
+    facts: number;
+    agenda: number;
+}
+
+/**
+ * Outcome of one forward-chaining run
+ */
+export interface ForwardChainResult {
+    /** Atoms derived or strengthened by this run */
+    derived: Atom[];
+    steps: number;
+    /** Whether the run stopped because nothing was left to derive rather than on the step budget */
+    fixpoint: boolean;
+}
+
+interface ImplicationRule {
+    key: string;
+    consequent: Atom;
+    truthValue: TruthValue;
+}
+
+interface AgendaItem {
+    key: string;
+    priority: number;
+}
+
+/** Confidence lost on each inference step, so chains through cycles die out */
+export const INFERENCE_DISCOUNT = 0.9;
+
+/**
+ * Key of an atom's content, independent of the IDs of the atom and its outgoing set
+ */
+export function contentKey(atom: Atom): string {
+    return contentAtomId(atom.type, atom.name, atom.outgoing?.map(child => contentKey(child)));
+}
+
+/**
+ * Incremental PLN forward chainer applying modus ponens.
+ *
+ * Implication rules are indexed by the content key of their antecedent. Facts that
+ * are true enough go on an agenda ordered by confidence or STI; the chainer pops the
+ * best fact, fires every rule it is the antecedent of and queues conclusions that are
+ * new or more confident than what is known. Derived implications become rules
+ * themselves. A run ends at the fixpoint (empty agenda) or when the step budget is
+ * spent. Facts, rules and the agenda persist between runs, so adding atoms only
+ * re-derives what depends on them.
+ */
+export class PLNForwardChainer {
+
+    private readonly maxSteps: number;
+    private readonly priority: 'confidence' | 'attention';
+    private readonly strengthThreshold: number;
+    private readonly confidenceThreshold: number;
+
+    private readonly facts = new Map<string, Atom>();
+    private readonly rulesByAntecedent = new Map<string, Map<string, ImplicationRule>>();
+    private ruleCount = 0;
+    private readonly agenda: AgendaItem[] = [];
+    private readonly queued = new Set<string>();
+
+    private totalSteps = 0;
+    private totalDerived = 0;
+    private totalDurationMs = 0;
+
+    constructor(options: ForwardChainerOptions = {}) {
+        this.maxSteps = options.maxSteps ?? 10000;
+        this.priority = options.priority ?? 'confidence';
+        this.strengthThreshold = options.strengthThreshold ?? 0.7;
+        this.confidenceThreshold = options.confidenceThreshold ?? 0.5;
+    }
+
+    /**
+     * Add facts and rules. Nothing is derived until the next `run`.
+     */
+    add(atoms: Iterable<Atom>): void {
+        for (const atom of atoms) {
+            this.addAtom(atom);
+        }
+    }
+
+    run(): ForwardChainResult {
+        const start = performance.now();
+        const derived = new Map<string, Atom>();
+        let steps = 0;
+
+        while (this.agenda.length > 0 && steps < this.maxSteps) {
+            const key = this.pop();
+            const premise = this.facts.get(key);
+            const rules = this.rulesByAntecedent.get(key);
+            if (!premise?.truthValue || !rules) {
+                continue;
+            }
+            for (const rule of rules.values()) {
+                steps++;
+                const conclusion = this.applyModusPonens(premise.truthValue, rule);
+                const conclusionKey = this.addAtom(conclusion);
+                if (conclusionKey) {
+                    derived.set(conclusionKey, conclusion);
+                }
+            }
+        }
+
+        this.totalSteps += steps;
+        this.totalDerived += derived.size;
+        this.totalDurationMs += performance.now() - start;
+        return { derived: Array.from(derived.values()), steps, fixpoint: this.agenda.length === 0 };
+    }
+
+    getMetrics(): ForwardChainerMetrics {
+        const seconds = this.totalDurationMs / 1000;
+        return {
+            steps: this.totalSteps,
+            derived: this.totalDerived,
+            durationMs: this.totalDurationMs,
+            stepsPerSecond: seconds > 0 ? this.totalSteps / seconds : 0,
+            derivedPerSecond: seconds > 0 ? this.totalDerived / seconds : 0,
+            rules: this.ruleCount,
+            facts: this.facts.size,
+            agenda: this.agenda.length
+        };
+    }
+
+    /**
+     * Record an atom; returns its key if it was new or improved on what was known
+     */
+    private addAtom(atom: Atom): string | undefined {
+        if (atom.type === 'ImplicationLink' && atom.outgoing?.length === 2) {
+            this.addRule(atom);
+        }
+        const key = contentKey(atom);
+        const known = this.facts.get(key);
+        if (known && !PLNForwardChainer.improves(atom.truthValue, known.truthValue)) {
+            return undefined;
+        }
+        this.facts.set(key, known ? { ...known, ...atom, truthValue: atom.truthValue ?? known.truthValue } : atom);
+        if (this.isTrue(atom.truthValue) && this.rulesByAntecedent.has(key)) {
+            this.enqueue(key, atom);
+        }
+        return key;
+    }
+
+    private addRule(implication: Atom): void {
+        if (!implication.truthValue) {
+            return;
+        }
+        const [antecedent, consequent] = implication.outgoing!;
+        const antecedentKey = contentKey(antecedent);
+        const key = contentKey(implication);
+        let rules = this.rulesByAntecedent.get(antecedentKey);
+        if (!rules) {
+            rules = new Map();
+            this.rulesByAntecedent.set(antecedentKey, rules);
+        }
+        const existing = rules.get(key);
+        if (existing && !PLNForwardChainer.improves(implication.truthValue, existing.truthValue)) {
+            return;
+        }
+        if (!existing) {
+            this.ruleCount++;
+        }
+        rules.set(key, { key, consequent, truthValue: implication.truthValue });
+
+        // An antecedent carrying its own truth value is a fact as well
+        if (antecedent.truthValue) {
+            this.addAtom(antecedent);
+        }
+        // The rule is new or stronger, so a known true antecedent has to fire again
+        const premise = this.facts.get(antecedentKey);
+        if (premise && this.isTrue(premise.truthValue)) {
+            this.enqueue(antecedentKey, premise);
+        }
+    }
+
+    private applyModusPonens(premise: TruthValue, rule: ImplicationRule): Atom {
+        const conclusion: Atom = {
+            ...rule.consequent,
+            truthValue: {
+                strength: premise.strength * rule.truthValue.strength,
+                confidence: Math.min(premise.confidence, rule.truthValue.confidence) * INFERENCE_DISCOUNT
+            }
+        };
+        // Addressed by content, so deriving the same conclusion again yields the same atom
+        conclusion.id = derivedAtomId(rule.consequent);
+        return conclusion;
+    }
+
+    private isTrue(truthValue: TruthValue | undefined): boolean {
+        return truthValue !== undefined
+            && truthValue.strength > this.strengthThreshold
+            && truthValue.confidence > this.confidenceThreshold;
+    }
+
+    private enqueue(key: string, atom: Atom): void {
+        if (this.queued.has(key)) {
+            return;
+        }
+        this.queued.add(key);
+        const priority = this.priority === 'attention' ? atom.attentionValue?.sti ?? 0 : atom.truthValue?.confidence ?? 0;
+        // Binary max-heap on priority
+        const agenda = this.agenda;
+        let index = agenda.push({ key, priority }) - 1;
+        while (index > 0) {
+            const parent = (index - 1) >> 1;
+            if (agenda[parent].priority >= agenda[index].priority) {
+                break;
+            }
+            [agenda[parent], agenda[index]] = [agenda[index], agenda[parent]];
+            index = parent;
+        }
+    }
+
+    private pop(): string {
+        const agenda = this.agenda;
+        const top = agenda[0];
+        const last = agenda.pop()!;
+        if (agenda.length > 0) {
+            agenda[0] = last;
+            let index = 0;
+            for (;;) {
+                const left = index * 2 + 1;
+                const right = left + 1;
+                let largest = index;
+                if (left < agenda.length && agenda[left].priority > agenda[largest].priority) {
+                    largest = left;
+                }
+                if (right < agenda.length && agenda[right].priority > agenda[largest].priority) {
+                    largest = right;
+                }
+                if (largest === index) {
+                    break;
+                }
+                [agenda[largest], agenda[index]] = [agenda[index], agenda[largest]];
+                index = largest;
+            }
+        }
+        this.queued.delete(top.key);
+        return top.key;
+    }
+
+    private static improves(candidate: TruthValue | undefined, known: TruthValue | undefined): boolean {
+        return candidate !== undefined && (known === undefined || candidate.confidence > known.confidence);
+    }
+}
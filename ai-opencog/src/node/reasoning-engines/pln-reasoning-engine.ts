@@ -15,7 +15,28 @@
 // *****************************************************************************
 
 import { injectable } from '@theia/core/shared/inversify';
-import { Atom, ReasoningQuery, ReasoningResult, TruthValue } from '../../common';
+import { Atom, ReasoningQuery, ReasoningResult } from '../../common';
+import { PLNBackwardChainer } from './pln-backward-chainer';
+import { PLNForwardChainer } from './pln-forward-chainer';
+import { FrequentItemset, MiningTransaction, mineFrequentItemsets } from './pattern-miner';
+
+/** Item prefixes keeping predicates and arguments apart in mined itemsets */
+const PREDICATE_ITEM = 'predicate:';
+const ARGUMENT_ITEM = 'argument:';
+
+/**
+ * Calculate confidence for inference results: their average confidence, slightly
+ * reduced for inference uncertainty
+ */
+export function calculateInferenceConfidence(conclusions: Atom[]): number {
+    if (conclusions.length === 0) return 0;
+
+    const avgConfidence = conclusions.reduce((sum, atom) =>
+        sum + (atom.truthValue?.confidence || 0), 0
+    ) / conclusions.length;
+
+    return Math.min(0.95, avgConfidence * 0.9);
+}
 
 /**
  * Probabilistic Logic Networks (PLN) reasoning engine
@@ -41,30 +62,19 @@ export class PLNReasoningEngine {
     }
 
     /**
-     * Deductive inference using PLN rules
+     * Deductive inference: forward-chain modus ponens over the query's implication
+     * links and facts to a fixpoint, or until `parameters.maxInferenceSteps` rule applications
      */
     private async performDeductiveInference(query: ReasoningQuery): Promise<ReasoningResult> {
-        const atoms = query.atoms || [];
-        const conclusions: Atom[] = [];
-
-        // Apply modus ponens and other deductive rules
-        for (const atom of atoms) {
-            if (atom.type === 'ImplicationLink' && atom.outgoing?.length === 2) {
-                const antecedent = atom.outgoing[0];
-                const consequent = atom.outgoing[1];
-                
-                // Check if antecedent is true with sufficient confidence
-                if (this.isAtomTrue(antecedent)) {
-                    const inferredConsequent = this.applyModusPonens(antecedent, consequent, atom.truthValue);
-                    if (inferredConsequent) {
-                        conclusions.push(inferredConsequent);
-                    }
-                }
-            }
+        if (query.parameters?.chaining === 'backward') {
+            return this.performBackwardChaining(query);
         }
+        const chainer = new PLNForwardChainer({ maxSteps: query.parameters?.maxInferenceSteps });
+        chainer.add([...(query.premises || []), ...(query.atoms || [])]);
+        const { derived: conclusions, steps, fixpoint } = chainer.run();
 
         // Calculate overall confidence based on inference strength
-        const confidence = this.calculateInferenceConfidence(conclusions);
+        const confidence = calculateInferenceConfidence(conclusions);
 
         return {
             conclusion: conclusions,
@@ -73,39 +83,41 @@ export class PLNReasoningEngine {
             metadata: {
                 reasoningType: 'pln-deductive',
                 rulesApplied: this.extractAppliedRules(conclusions),
-                inferenceSteps: conclusions.length
+                inferenceSteps: steps,
+                fixpoint,
+                metrics: chainer.getMetrics()
             }
         };
     }
 
     /**
-     * Apply modus ponens rule
+     * Goal-directed deduction: prove each of the query's atoms from its premises, within
+     * `parameters.maxDepth` rule applications and `parameters.timeBudgetMs` per goal
      */
-    private applyModusPonens(antecedent: Atom, consequent: Atom, implicationTruth?: TruthValue): Atom | null {
-        if (!antecedent.truthValue || !implicationTruth) {
-            return null;
-        }
-
-        // Calculate truth value for consequent using PLN formula
-        const strength = antecedent.truthValue.strength * implicationTruth.strength;
-        const confidence = Math.min(antecedent.truthValue.confidence, implicationTruth.confidence) * 0.9;
+    private async performBackwardChaining(query: ReasoningQuery): Promise<ReasoningResult> {
+        const chainer = new PLNBackwardChainer({
+            maxDepth: query.parameters?.maxDepth,
+            timeBudgetMs: query.parameters?.timeBudgetMs
+        });
+        chainer.add(query.premises || []);
+        const goals = (query.atoms || []).map(goal => chainer.prove(goal));
+        const conclusions = goals.filter(result => result.truthValue).map(result => result.goal);
 
         return {
-            ...consequent,
-            truthValue: { strength, confidence },
-            id: `inferred_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`
+            conclusion: conclusions,
+            confidence: calculateInferenceConfidence(conclusions),
+            explanation: `PLN backward chaining answered ${conclusions.length} of ${goals.length} goals`,
+            metadata: {
+                reasoningType: 'pln-backward',
+                subgoals: goals.reduce((sum, result) => sum + result.subgoals, 0),
+                tableHits: goals.reduce((sum, result) => sum + result.tableHits, 0),
+                depthLimited: goals.some(result => result.depthLimited),
+                timedOut: goals.some(result => result.timedOut),
+                durationMs: goals.reduce((sum, result) => sum + result.durationMs, 0)
+            }
         };
     }
 
-    /**
-     * Check if an atom is considered true with sufficient confidence
-     */
-    private isAtomTrue(atom: Atom, threshold = 0.7): boolean {
-        return atom.truthValue ? 
-            atom.truthValue.strength > threshold && atom.truthValue.confidence > 0.5 : 
-            false;
-    }
-
     /**
      * Inductive inference using PLN
      */
@@ -135,65 +147,57 @@ export class PLNReasoningEngine {
     }
 
     /**
-     * Find inductive patterns in observations
+     * Find inductive patterns in observations: frequent combinations of a predicate and
+     * its arguments, mined with FP-growth. Each observation is a transaction of its
+     * predicate and argument items, scored 1 when it holds, so the strength of a
+     * generalization is its share of positive observations.
      */
     private findInductivePatterns(observations: Atom[]): Atom[] {
-        const patterns: Atom[] = [];
-        
-        // Group observations by predicate
-        const predicateGroups = this.groupObservationsByPredicate(observations);
-        
-        for (const [predicate, obs] of predicateGroups.entries()) {
-            if (obs.length >= 3) { // Need at least 3 observations for induction
-                const pattern = this.extractInductivePattern(predicate, obs);
-                if (pattern) {
-                    patterns.push(pattern);
-                }
+        const transactions: MiningTransaction[] = [];
+        for (const obs of observations) {
+            if (obs.outgoing && obs.outgoing.length > 0) {
+                const [predicate, ...args] = obs.outgoing;
+                transactions.push({
+                    items: [PREDICATE_ITEM + (predicate.name || predicate.type), ...args.map(arg => ARGUMENT_ITEM + (arg.name || arg.type))],
+                    score: obs.truthValue && obs.truthValue.strength > 0.5 ? 1 : 0
+                });
             }
         }
 
-        return patterns;
-    }
-
-    /**
-     * Group observations by their predicate
-     */
-    private groupObservationsByPredicate(observations: Atom[]): Map<string, Atom[]> {
-        const groups = new Map<string, Atom[]>();
-        
-        for (const obs of observations) {
-            if (obs.outgoing && obs.outgoing.length > 0) {
-                const predicate = obs.outgoing[0].name || obs.outgoing[0].type;
-                if (!groups.has(predicate)) {
-                    groups.set(predicate, []);
-                }
-                groups.get(predicate)!.push(obs);
+        // Need at least 3 observations for induction
+        const itemsets = mineFrequentItemsets(transactions, { minSupport: 3, maxLength: 3 });
+        const patterns: Atom[] = [];
+        for (const itemset of itemsets) {
+            const predicates = itemset.items.filter(item => item.startsWith(PREDICATE_ITEM));
+            if (predicates.length === 1) {
+                const args = itemset.items.filter(item => item.startsWith(ARGUMENT_ITEM)).map(item => item.slice(ARGUMENT_ITEM.length)).sort();
+                patterns.push(this.extractInductivePattern(predicates[0].slice(PREDICATE_ITEM.length), args, itemset));
             }
         }
-        
-        return groups;
+
+        // Broadest generalizations first
+        return patterns.sort((a, b) => a.outgoing![1].outgoing!.length - b.outgoing![1].outgoing!.length);
     }
 
     /**
-     * Extract inductive pattern from grouped observations
+     * Extract inductive pattern from a frequent predicate and argument combination
      */
-    private extractInductivePattern(predicate: string, observations: Atom[]): Atom | null {
+    private extractInductivePattern(predicate: string, args: string[], itemset: FrequentItemset): Atom {
         // Calculate pattern strength based on consistency
-        const totalObservations = observations.length;
-        const positiveObservations = observations.filter(obs => 
-            obs.truthValue && obs.truthValue.strength > 0.5
-        ).length;
-        
-        const strength = positiveObservations / totalObservations;
-        const confidence = Math.min(0.9, totalObservations / 10); // Higher confidence with more observations
-        
+        const strength = itemset.score / itemset.support;
+        const confidence = Math.min(0.9, itemset.support / 10); // Higher confidence with more observations
+
         return {
             type: 'ImplicationLink',
-            name: `pattern_${predicate}`,
+            name: ['pattern', predicate, ...args].join('_'),
             truthValue: { strength, confidence },
             outgoing: [
                 { type: 'VariableNode', name: '$X' },
-                { type: 'EvaluationLink', name: predicate, outgoing: [{ type: 'VariableNode', name: '$X' }] }
+                {
+                    type: 'EvaluationLink',
+                    name: predicate,
+                    outgoing: [{ type: 'VariableNode', name: '$X' }, ...args.map(arg => ({ type: 'ConceptNode', name: arg }))]
+                }
             ]
         };
     }
@@ -283,7 +287,7 @@ export class PLNReasoningEngine {
             // Generate hypothesis: "If X then observation"
             causes.push({
                 type: 'ImplicationLink',
-                name: `hypothesis_${predicate.name}_${Date.now()}`,
+                name: `hypothesis_${predicate.name}`,
                 truthValue: { strength: 0.5, confidence: 0.3 }, // Initial low confidence
                 outgoing: [
                     { type: 'VariableNode', name: '$Cause' },
@@ -389,7 +393,7 @@ export class PLNReasoningEngine {
             results.push({
                 ...atom,
                 truthValue: { strength, confidence },
-                name: `and_result_${Date.now()}`
+                name: 'and_result'
             });
         }
         
@@ -414,7 +418,7 @@ export class PLNReasoningEngine {
             results.push({
                 ...atom,
                 truthValue: { strength, confidence },
-                name: `or_result_${Date.now()}`
+                name: 'or_result'
             });
         }
         
@@ -436,7 +440,7 @@ export class PLNReasoningEngine {
                         strength: 1 - child.truthValue.strength,
                         confidence: child.truthValue.confidence
                     },
-                    name: `not_result_${Date.now()}`
+                    name: 'not_result'
                 });
             }
         }
@@ -456,7 +460,7 @@ export class PLNReasoningEngine {
             // Symmetric property: Similarity(A,B) = Similarity(B,A)
             results.push({
                 type: 'SimilarityLink',
-                name: `similarity_symmetric_${Date.now()}`,
+                name: 'similarity_symmetric',
                 truthValue: atom.truthValue,
                 outgoing: [b, a]
             });
@@ -465,19 +469,6 @@ export class PLNReasoningEngine {
         return results;
     }
 
-    /**
-     * Calculate confidence for inference results
-     */
-    private calculateInferenceConfidence(conclusions: Atom[]): number {
-        if (conclusions.length === 0) return 0;
-        
-        const avgConfidence = conclusions.reduce((sum, atom) => 
-            sum + (atom.truthValue?.confidence || 0), 0
-        ) / conclusions.length;
-        
-        return Math.min(0.95, avgConfidence * 0.9); // Slight reduction for inference uncertainty
-    }
-
     /**
      * Calculate confidence for pattern recognition
      */
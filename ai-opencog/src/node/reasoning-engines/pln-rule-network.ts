@@ -0,0 +1,565 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { Atom, TruthValue } from '../../common';
+import { contentKey, INFERENCE_DISCOUNT } from './pln-forward-chainer';
+
+export interface RuleNetworkOptions {
+    /** Strength a condition needs for its rules to fire */
+    strengthThreshold?: number;
+    /** Confidence a condition needs for its rules to fire */
+    confidenceThreshold?: number;
+    /** Whether two facts contradict each other, in either order; only facts related by name are compared */
+    contradicts?: (a: Atom, b: Atom) => boolean;
+}
+
+/**
+ * Work done by one assert, retract or replace
+ */
+export interface RuleNetworkUpdate {
+    asserted: number;
+    retracted: number;
+    /** Rule activations re-evaluated */
+    activations: number;
+}
+
+interface MemoryEntry {
+    /** The atom's structure; its truth value lives in the entry */
+    atom: Atom;
+    /** Every truth value asserted for this atom by the last assert or replace */
+    statements: TruthValue[];
+    /** The most confident of the statements, which rules reason from */
+    asserted?: TruthValue;
+    /** Truth values concluded by each rule that currently fires for this atom */
+    derivations: Map<string, TruthValue>;
+    /** The most confident of the asserted and derived truth values */
+    truthValue?: TruthValue;
+    /** Conditions and consequents of rules that refer to this atom */
+    references: number;
+}
+
+/**
+ * Truth values given for one atom content in a single assert or replace
+ */
+interface Statement {
+    atom: Atom;
+    truthValues: TruthValue[];
+}
+
+interface NetworkRule {
+    key: string;
+    conditions: string[];
+    consequentKey: string;
+    truthValue: TruthValue;
+}
+
+/**
+ * Incremental rule network for PLN deduction, in the style of TREAT.
+ *
+ * Working memory holds one entry per atom content, with the truth values asserted for
+ * it and the truth values rules derive for it. Every `ImplicationLink` with a truth
+ * value is a rule whose conditions are its antecedent, or the members of an
+ * antecedent `AndLink`; rules are indexed by condition, so a changed fact re-evaluates
+ * only the activations of rules it is a condition of, and their conclusions propagate
+ * the same way. Derived implications become rules themselves.
+ *
+ * Retraction uses delete-and-rederive: everything derived through the retracted fact
+ * is removed, then re-derived from the support that is left, so facts that only
+ * supported each other through a cycle disappear together.
+ *
+ * Conclusions and contradictions between facts are kept up to date as materialized
+ * views rather than recomputed when read. Rules reason from the most confident truth
+ * value of an entry, but contradictions are sought among all of its asserted and
+ * derived truth values, so divergent statements about one atom are still reported. Entries that are neither asserted, derived,
+ * nor referred to by a rule are evicted at the end of each update.
+ */
+export class PLNRuleNetwork {
+
+    private readonly strengthThreshold: number;
+    private readonly confidenceThreshold: number;
+    private readonly contradicts?: (a: Atom, b: Atom) => boolean;
+
+    private readonly memory = new Map<string, MemoryEntry>();
+    private readonly assertedKeys = new Set<string>();
+    private readonly rules = new Map<string, NetworkRule>();
+    private readonly rulesByCondition = new Map<string, Set<string>>();
+    private readonly derivedKeys = new Set<string>();
+    private readonly factKeys = new Set<string>();
+    private readonly factsByName = new Map<string, Set<string>>();
+    private readonly negationsByName = new Map<string, Set<string>>();
+    private readonly conflicts = new Map<string, [Atom, Atom]>();
+    private readonly conflictsByKey = new Map<string, Set<string>>();
+
+    /** Entries that may have lost their last reason to be kept */
+    private readonly releasable = new Set<string>();
+    private readonly worklist: string[] = [];
+    private readonly scheduled = new Set<string>();
+    private activations = 0;
+
+    constructor(options: RuleNetworkOptions = {}) {
+        this.strengthThreshold = options.strengthThreshold ?? 0.7;
+        this.confidenceThreshold = options.confidenceThreshold ?? 0.5;
+        this.contradicts = options.contradicts;
+    }
+
+    /**
+     * Assert atoms with their truth values; re-asserting an atom with different truth values replaces them.
+     * Conditions of an implication that carry their own truth value are asserted as facts too.
+     */
+    assert(atoms: Iterable<Atom>): RuleNetworkUpdate {
+        const update = this.beginUpdate();
+        for (const [key, statement] of PLNRuleNetwork.statementsOf(atoms)) {
+            this.assertAtom(key, statement, update);
+        }
+        return this.endUpdate(update);
+    }
+
+    retract(atoms: Iterable<Atom>): RuleNetworkUpdate {
+        const update = this.beginUpdate();
+        for (const atom of atoms) {
+            this.retractKey(contentKey(atom), update);
+        }
+        return this.endUpdate(update);
+    }
+
+    /**
+     * Make `atoms` the asserted set: assert what is new or changed, retract what is gone
+     */
+    replace(atoms: Iterable<Atom>): RuleNetworkUpdate {
+        const update = this.beginUpdate();
+        const wanted = PLNRuleNetwork.statementsOf(atoms);
+        for (const key of Array.from(this.assertedKeys)) {
+            if (!wanted.get(key)?.truthValues.length) {
+                this.retractKey(key, update);
+            }
+        }
+        for (const [key, statement] of wanted) {
+            this.assertAtom(key, statement, update);
+        }
+        return this.endUpdate(update);
+    }
+
+    /**
+     * Number of atoms held in working memory
+     */
+    get size(): number {
+        return this.memory.size;
+    }
+
+    /**
+     * Atoms currently derived by some rule, with their truth values
+     */
+    getConclusions(): Atom[] {
+        return Array.from(this.derivedKeys, key => this.materialize(key));
+    }
+
+    /**
+     * Pairs of facts that contradict each other
+     */
+    getConflicts(): [Atom, Atom][] {
+        return Array.from(this.conflicts.values(), ([a, b]) => [a, b]);
+    }
+
+    private beginUpdate(): RuleNetworkUpdate {
+        this.activations = 0;
+        return { asserted: 0, retracted: 0, activations: 0 };
+    }
+
+    private endUpdate(update: RuleNetworkUpdate): RuleNetworkUpdate {
+        this.propagate();
+        this.evict();
+        update.activations = this.activations;
+        return update;
+    }
+
+    private assertAtom(key: string, statement: Statement, update: RuleNetworkUpdate): void {
+        const entry = this.entry(key, statement.atom);
+        const asserted = PLNRuleNetwork.mostConfident(statement.truthValues);
+        if (!asserted) {
+            return;
+        }
+        if (PLNRuleNetwork.sameTruth(entry.asserted, asserted)) {
+            if (!PLNRuleNetwork.sameTruths(entry.statements, statement.truthValues)) {
+                // Rules are unaffected, but the statements may contradict differently
+                entry.statements = statement.truthValues;
+                this.schedule(key);
+                this.propagate();
+            }
+            return;
+        }
+        if (entry.asserted) {
+            // A weaker truth value may withdraw conclusions, so the old one is retracted first
+            this.retractKey(key, update);
+        }
+        entry.statements = statement.truthValues;
+        entry.asserted = asserted;
+        this.assertedKeys.add(key);
+        this.schedule(key);
+        this.propagate();
+        update.asserted++;
+    }
+
+    /**
+     * Delete everything derived through the fact, then re-derive from the remaining support
+     */
+    private retractKey(key: string, update: RuleNetworkUpdate): void {
+        const entry = this.memory.get(key);
+        if (!entry?.asserted) {
+            return;
+        }
+        entry.statements = [];
+        entry.asserted = undefined;
+        this.assertedKeys.delete(key);
+        this.releasable.add(key);
+        update.retracted++;
+
+        const affected = new Set([key]);
+        const pending = [key];
+        while (pending.length > 0) {
+            const current = pending.pop()!;
+            const dependents = Array.from(this.rulesByCondition.get(current) ?? []);
+            if (this.rules.has(current)) {
+                dependents.push(current);
+            }
+            for (const ruleKey of dependents) {
+                const rule = this.rules.get(ruleKey)!;
+                if (this.setDerivation(rule.consequentKey, ruleKey, undefined) && !affected.has(rule.consequentKey)) {
+                    affected.add(rule.consequentKey);
+                    pending.push(rule.consequentKey);
+                }
+            }
+        }
+
+        for (const affectedKey of affected) {
+            const affectedEntry = this.memory.get(affectedKey)!;
+            affectedEntry.truthValue = PLNRuleNetwork.best(affectedEntry);
+        }
+        for (const affectedKey of affected) {
+            this.settle(affectedKey);
+        }
+        this.propagate();
+    }
+
+    private propagate(): void {
+        while (this.worklist.length > 0) {
+            const key = this.worklist.pop()!;
+            this.scheduled.delete(key);
+            const entry = this.memory.get(key)!;
+            const truthValue = PLNRuleNetwork.best(entry);
+            if (!PLNRuleNetwork.sameTruth(truthValue, entry.truthValue)) {
+                entry.truthValue = truthValue;
+                this.settle(key);
+            } else {
+                // A statement or derivation that lost to a more confident one can still contradict
+                this.updateConflicts(key);
+            }
+        }
+    }
+
+    /**
+     * Bring rules, views and dependent activations in line with an entry whose truth value changed
+     */
+    private settle(key: string): void {
+        const entry = this.memory.get(key)!;
+        this.updateConflicts(key);
+        if (entry.atom.type === 'ImplicationLink' && entry.atom.outgoing?.length === 2) {
+            this.updateRule(key, entry);
+        }
+        for (const ruleKey of this.rulesByCondition.get(key) ?? []) {
+            this.evaluate(this.rules.get(ruleKey)!);
+        }
+    }
+
+    private updateRule(key: string, entry: MemoryEntry): void {
+        const existing = this.rules.get(key);
+        if (!entry.truthValue) {
+            if (existing) {
+                for (const condition of existing.conditions) {
+                    PLNRuleNetwork.unindex(this.rulesByCondition, condition, key);
+                }
+                this.rules.delete(key);
+                this.setDerivation(existing.consequentKey, key, undefined);
+                for (const referenced of [...existing.conditions, existing.consequentKey]) {
+                    this.memory.get(referenced)!.references--;
+                    this.releasable.add(referenced);
+                }
+                this.releasable.add(key);
+            }
+            return;
+        }
+        if (existing) {
+            existing.truthValue = entry.truthValue;
+            this.evaluate(existing);
+            return;
+        }
+
+        const [antecedent, consequent] = entry.atom.outgoing!;
+        const rule: NetworkRule = {
+            key,
+            conditions: PLNRuleNetwork.conditionsOf(antecedent).map(condition => this.entryKey(condition)),
+            consequentKey: this.entryKey(consequent),
+            truthValue: entry.truthValue
+        };
+        this.rules.set(key, rule);
+        for (const condition of rule.conditions) {
+            PLNRuleNetwork.index(this.rulesByCondition, condition, key);
+        }
+        for (const referenced of [...rule.conditions, rule.consequentKey]) {
+            this.memory.get(referenced)!.references++;
+        }
+        this.evaluate(rule);
+    }
+
+    /**
+     * Re-evaluate one rule activation: modus ponens over the conjunction of its conditions
+     */
+    private evaluate(rule: NetworkRule): void {
+        this.activations++;
+        let strength = rule.truthValue.strength;
+        let confidence = rule.truthValue.confidence;
+        for (const condition of rule.conditions) {
+            const truthValue = this.memory.get(condition)!.truthValue;
+            if (!truthValue || truthValue.strength <= this.strengthThreshold || truthValue.confidence <= this.confidenceThreshold) {
+                this.setDerivation(rule.consequentKey, rule.key, undefined);
+                return;
+            }
+            strength *= truthValue.strength;
+            confidence = Math.min(confidence, truthValue.confidence);
+        }
+        this.setDerivation(rule.consequentKey, rule.key, { strength, confidence: confidence * INFERENCE_DISCOUNT });
+    }
+
+    /**
+     * Record or withdraw a rule's conclusion; returns whether anything changed
+     */
+    private setDerivation(key: string, ruleKey: string, truthValue: TruthValue | undefined): boolean {
+        const entry = this.memory.get(key)!;
+        if (PLNRuleNetwork.sameTruth(entry.derivations.get(ruleKey), truthValue)) {
+            return false;
+        }
+        if (truthValue) {
+            entry.derivations.set(ruleKey, truthValue);
+            this.derivedKeys.add(key);
+        } else {
+            entry.derivations.delete(ruleKey);
+            if (entry.derivations.size === 0) {
+                this.derivedKeys.delete(key);
+                this.releasable.add(key);
+            }
+        }
+        this.schedule(key);
+        return true;
+    }
+
+    private updateConflicts(key: string): void {
+        if (!this.contradicts) {
+            return;
+        }
+        const entry = this.memory.get(key)!;
+        const { atom } = entry;
+        const names = atom.type === 'NotLink' ? (atom.outgoing ?? []).map(child => child.name) : [];
+        const facts = this.factsOf(entry);
+        if (facts.length === 0 && this.factKeys.delete(key)) {
+            PLNRuleNetwork.unindex(this.factsByName, atom.name, key);
+            names.forEach(name => PLNRuleNetwork.unindex(this.negationsByName, name, key));
+        } else if (facts.length > 0 && !this.factKeys.has(key)) {
+            this.factKeys.add(key);
+            PLNRuleNetwork.index(this.factsByName, atom.name, key);
+            names.forEach(name => PLNRuleNetwork.index(this.negationsByName, name, key));
+        }
+
+        for (const pairKey of Array.from(this.conflictsByKey.get(key) ?? [])) {
+            for (const member of pairKey.split('|')) {
+                PLNRuleNetwork.unindex(this.conflictsByKey, member, pairKey);
+            }
+            this.conflicts.delete(pairKey);
+        }
+        if (facts.length === 0) {
+            return;
+        }
+        const candidates = new Set<string>([
+            ...(atom.name !== undefined ? this.factsByName.get(atom.name) ?? [] : []),
+            ...(atom.name !== undefined ? this.negationsByName.get(atom.name) ?? [] : []),
+            ...names.flatMap(name => name !== undefined ? Array.from(this.factsByName.get(name) ?? []) : [])
+        ]);
+        candidates.add(key);
+        for (const candidate of candidates) {
+            const conflict = this.findConflict(facts, candidate === key ? facts : this.factsOf(this.memory.get(candidate)!), candidate === key);
+            if (conflict) {
+                const first = key <= candidate;
+                const pairKey = first ? `${key}|${candidate}` : `${candidate}|${key}`;
+                this.conflicts.set(pairKey, first ? conflict : [conflict[1], conflict[0]]);
+                PLNRuleNetwork.index(this.conflictsByKey, key, pairKey);
+                PLNRuleNetwork.index(this.conflictsByKey, candidate, pairKey);
+            }
+        }
+    }
+
+    /**
+     * The first pair of facts, one from each side, that contradict each other
+     */
+    private findConflict(facts: Atom[], others: Atom[], same: boolean): [Atom, Atom] | undefined {
+        for (let i = 0; i < facts.length; i++) {
+            for (let j = same ? i + 1 : 0; j < others.length; j++) {
+                if (this.contradicts!(facts[i], others[j])) {
+                    return [facts[i], others[j]];
+                }
+            }
+        }
+        return undefined;
+    }
+
+    /**
+     * The atom once with each truth value asserted or derived for it
+     */
+    private factsOf(entry: MemoryEntry): Atom[] {
+        return [...entry.statements, ...entry.derivations.values()].map(truthValue => ({ ...entry.atom, truthValue }));
+    }
+
+    private entry(key: string, atom: Atom): MemoryEntry {
+        let entry = this.memory.get(key);
+        if (!entry) {
+            const { truthValue, ...structure } = atom;
+            entry = { atom: structure, statements: [], derivations: new Map(), references: 0 };
+            this.memory.set(key, entry);
+            this.releasable.add(key);
+        }
+        return entry;
+    }
+
+    private entryKey(atom: Atom): string {
+        const key = contentKey(atom);
+        this.entry(key, atom);
+        return key;
+    }
+
+    private evict(): void {
+        for (const key of this.releasable) {
+            const entry = this.memory.get(key);
+            if (entry && !entry.asserted && entry.derivations.size === 0 && entry.references === 0 && !this.rules.has(key)) {
+                this.memory.delete(key);
+            }
+        }
+        this.releasable.clear();
+    }
+
+    private materialize(key: string): Atom {
+        const entry = this.memory.get(key)!;
+        return { ...entry.atom, truthValue: entry.truthValue };
+    }
+
+    private schedule(key: string): void {
+        if (!this.scheduled.has(key)) {
+            this.scheduled.add(key);
+            this.worklist.push(key);
+        }
+    }
+
+    /**
+     * The atoms grouped by content, with every truth value given for each. Conditions of
+     * implications that carry a truth value count as statements too, unless the condition
+     * is also given on its own, which takes precedence over the one embedded in a rule.
+     */
+    private static statementsOf(atoms: Iterable<Atom>): Map<string, Statement> {
+        const statements = new Map<string, Statement>();
+        const add = (key: string, atom: Atom) => {
+            let statement = statements.get(key);
+            if (!statement) {
+                statement = { atom, truthValues: [] };
+                statements.set(key, statement);
+            }
+            if (atom.truthValue) {
+                statement.truthValues.push(atom.truthValue);
+            }
+        };
+
+        const embedded: Atom[] = [];
+        for (const atom of atoms) {
+            add(contentKey(atom), atom);
+            if (atom.type === 'ImplicationLink' && atom.outgoing?.length === 2) {
+                embedded.push(...PLNRuleNetwork.conditionsOf(atom.outgoing[0]).filter(condition => condition.truthValue));
+            }
+        }
+        for (const condition of embedded) {
+            const key = contentKey(condition);
+            if (!statements.get(key)?.truthValues.length) {
+                add(key, condition);
+            }
+        }
+        return statements;
+    }
+
+    /**
+     * Conditions of a rule: the members of an antecedent `AndLink`, or the antecedent itself
+     */
+    private static conditionsOf(antecedent: Atom): Atom[] {
+        return antecedent.type === 'AndLink' && antecedent.outgoing?.length ? antecedent.outgoing : [antecedent];
+    }
+
+    private static best(entry: MemoryEntry): TruthValue | undefined {
+        let best = entry.asserted;
+        for (const truthValue of entry.derivations.values()) {
+            if (!best || truthValue.confidence > best.confidence) {
+                best = truthValue;
+            }
+        }
+        return best;
+    }
+
+    /**
+     * The most confident truth value; among equally confident ones, the last given
+     */
+    private static mostConfident(truthValues: TruthValue[]): TruthValue | undefined {
+        let best: TruthValue | undefined;
+        for (const truthValue of truthValues) {
+            if (!best || truthValue.confidence >= best.confidence) {
+                best = truthValue;
+            }
+        }
+        return best;
+    }
+
+    private static sameTruths(a: TruthValue[], b: TruthValue[]): boolean {
+        return a.length === b.length && a.every((truthValue, i) => PLNRuleNetwork.sameTruth(truthValue, b[i]));
+    }
+
+    private static sameTruth(a: TruthValue | undefined, b: TruthValue | undefined): boolean {
+        return a === b || (a !== undefined && b !== undefined && a.strength === b.strength && a.confidence === b.confidence);
+    }
+
+    private static index(index: Map<string, Set<string>>, name: string | undefined, key: string): void {
+        if (name === undefined) {
+            return;
+        }
+        let keys = index.get(name);
+        if (!keys) {
+            keys = new Set();
+            index.set(name, keys);
+        }
+        keys.add(key);
+    }
+
+    private static unindex(index: Map<string, Set<string>>, name: string | undefined, key: string): void {
+        if (name === undefined) {
+            return;
+        }
+        const keys = index.get(name);
+        keys?.delete(key);
+        if (keys?.size === 0) {
+            index.delete(name);
+        }
+    }
+}
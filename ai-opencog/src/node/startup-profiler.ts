@@ -0,0 +1,104 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { injectable } from '@theia/core/shared/inversify';
+import { BackendApplicationContribution } from '@theia/core/lib/node/backend-application';
+
+/**
+ * Construction of one backend service
+ */
+export interface ServiceActivation {
+    service: string;
+    /** Milliseconds from profiler creation to the start of construction */
+    startedAt: number;
+    /** Construction time, including dependencies constructed along with the service */
+    durationMs: number;
+    /** `setTimeout` calls made during construction; only counted when profiling verbosely */
+    timeouts: number;
+    /** `setInterval` calls made during construction; only counted when profiling verbosely */
+    intervals: number;
+}
+
+/**
+ * Records when each backend service is constructed and how long construction takes.
+ * Services are activated through `activate` when their RPC path is first connected
+ * rather than at boot. With `AI_OPENCOG_PROFILE_STARTUP=true`, the timers each
+ * service starts are counted as well, and activations are logged as they happen and
+ * summarized once the backend has started. Counting timers swaps the global timer
+ * functions during construction, so it is left off otherwise.
+ */
+@injectable()
+export class StartupProfiler implements BackendApplicationContribution {
+
+    private readonly origin = performance.now();
+    private readonly activations = new Map<string, ServiceActivation>();
+    private readonly verbose = process.env.AI_OPENCOG_PROFILE_STARTUP === 'true';
+
+    /**
+     * Resolve a service, profiling the first resolution under the given name
+     */
+    activate<T>(service: string, resolve: () => T): T {
+        if (this.activations.has(service)) {
+            return resolve();
+        }
+        const activation: ServiceActivation = { service, startedAt: performance.now() - this.origin, durationMs: 0, timeouts: 0, intervals: 0 };
+        if (!this.verbose) {
+            const instance = resolve();
+            this.record(activation);
+            return instance;
+        }
+        const timers = global as any;
+        const { setTimeout: originalSetTimeout, setInterval: originalSetInterval } = timers;
+        timers.setTimeout = (...args: any[]) => {
+            activation.timeouts++;
+            return originalSetTimeout(...args);
+        };
+        timers.setInterval = (...args: any[]) => {
+            activation.intervals++;
+            return originalSetInterval(...args);
+        };
+        let instance: T;
+        try {
+            instance = resolve();
+        } finally {
+            timers.setTimeout = originalSetTimeout;
+            timers.setInterval = originalSetInterval;
+        }
+        this.record(activation);
+        console.log(`Activated ${service} in ${activation.durationMs.toFixed(1)} ms ` +
+            `(${activation.timeouts} timeouts, ${activation.intervals} intervals)`);
+        return instance;
+    }
+
+    /**
+     * Record a successful construction; a failed one is profiled again on the next attempt
+     */
+    private record(activation: ServiceActivation): void {
+        activation.durationMs = performance.now() - this.origin - activation.startedAt;
+        this.activations.set(activation.service, activation);
+    }
+
+    getActivations(): ServiceActivation[] {
+        return Array.from(this.activations.values());
+    }
+
+    onStart(): void {
+        if (this.verbose) {
+            const total = this.getActivations().reduce((sum, activation) => sum + activation.durationMs, 0);
+            console.log(`${this.activations.size} AI OpenCog services activated during startup in ${total.toFixed(1)} ms`);
+        }
+    }
+}
@@ -19,6 +19,8 @@ import {
     FeedbackData
 } from '../common';
 import { OpenCogService } from '../common/opencog-service';
+import { AtomSpaceService } from './atomspace-service';
+import { configuredAtomBudget } from './atomspace-attention-contribution';
 
 export interface SystemIntegrationMetrics {
     cache: {
@@ -83,6 +85,20 @@ export class SystemIntegrationService {
         this.cognitiveCache = new CognitiveCache();
         this.personalization = new CognitivePersonalization(opencog);
         this.resourceManager = new ResourceManager();
+        if (opencog instanceof AtomSpaceService) {
+            // Memory optimization forgets atoms above the budget; without one there is nothing to reclaim
+            this.resourceManager.setAtomSpaceMemoryReclaimer(async () => {
+                const maxAtoms = configuredAtomBudget();
+                if (maxAtoms === undefined) {
+                    return { atomsRemoved: 0, memoryFreed: 0 };
+                }
+                const { atomSpace, atomSpaceIndexes } = await opencog.getMemoryBreakdown();
+                const bytesPerAtom = atomSpace.entries > 0 ? (atomSpace.bytes + atomSpaceIndexes.bytes) / atomSpace.entries : 0;
+                // Only the forgetting pass: reclaiming memory must not also decay and spread attention
+                const { forgotten } = await opencog.runAttentionCycle({ maxAtoms, stiDecay: 0, ltiDecay: 0, ltiGain: 0, spreadFraction: 0 });
+                return { atomsRemoved: forgotten, memoryFreed: Math.round(forgotten * bytesPerAtom) };
+            });
+        }
         this.feedbackIntegration = new FeedbackIntegration(opencog, this.personalization);
         
         this.startPeriodicOptimization();
@@ -93,6 +109,7 @@ export class SystemIntegrationService {
      */
     async performSystemOptimization(): Promise<OptimizationResult> {
         const improvements = [];
+        await this.refreshMemoryMetrics();
         
         // 1. Cache optimization
         const cacheStats = this.cognitiveCache.getStats();
@@ -355,6 +372,22 @@ export class SystemIntegrationService {
         }, this.optimizationInterval);
     }
 
+    /**
+     * Replace the resource manager's memory figures with measured per-store usage
+     */
+    private async refreshMemoryMetrics(): Promise<void> {
+        const breakdown = await this.opencog.getMemoryBreakdown();
+        this.resourceManager.updateMetrics({
+            memoryUsage: {
+                atomSpace: breakdown.atomSpace.bytes + breakdown.atomSpaceIndexes.bytes + breakdown.atomSpaceViews.bytes,
+                learningModels: breakdown.learningHistory.bytes + breakdown.userBehaviorPatterns.bytes
+                    + breakdown.learningModels.bytes + breakdown.advancedLearningModels.bytes,
+                cache: this.cognitiveCache.estimateMemoryUsage() + breakdown.queryCache.bytes,
+                total: breakdown.heapUsed
+            }
+        });
+    }
+
     /**
      * Stop periodic optimization
      */
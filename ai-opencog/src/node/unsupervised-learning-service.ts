@@ -22,7 +22,7 @@ import {
     WorkflowOptimizationResult,
     WorkflowOptimization
 } from '../common/learning-services';
-import { PatternMatchingEngine } from './reasoning-engines';
+import { PatternMatchingEngine, mineSequentialPatterns } from './reasoning-engines';
 
 /**
  * Implementation of UnsupervisedLearningService
@@ -504,26 +504,16 @@ export class UnsupervisedLearningServiceImpl implements UnsupervisedLearningServ
     }
 
     /**
-     * Find common subsequences
+     * Find common subsequences: contiguous runs of 2 to 4 actions that occur more than
+     * once, in one sequence or across several, mined with PrefixSpan. The frequency is
+     * the number of occurrences.
      */
     private findCommonSubsequences(sequences: string[][]): any[] {
-        const subsequenceCounts = new Map<string, number>();
-        
-        for (const sequence of sequences) {
-            for (let i = 0; i < sequence.length - 1; i++) {
-                for (let j = i + 2; j <= Math.min(sequence.length, i + 4); j++) {
-                    const subseq = sequence.slice(i, j);
-                    const key = subseq.join('->');
-                    subsequenceCounts.set(key, (subsequenceCounts.get(key) || 0) + 1);
-                }
-            }
-        }
-        
-        return Array.from(subsequenceCounts.entries())
-            .filter(([, count]) => count > 1)
-            .sort(([, a], [, b]) => b - a)
+        return mineSequentialPatterns(sequences, { minSupport: 2, maxLength: 4, maxGap: 1, countOccurrences: true })
+            .filter(({ sequence }) => sequence.length > 1)
+            .sort((a, b) => b.occurrences! - a.occurrences!)
             .slice(0, 10)
-            .map(([pattern, count]) => ({ pattern, frequency: count }));
+            .map(({ sequence, occurrences }) => ({ pattern: sequence.join('->'), frequency: occurrences }));
     }
 
     /**
@@ -0,0 +1,146 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { expect } from 'chai';
+import { AtomSpaceService } from '../node/atomspace-service';
+import { SortedValueList } from '../node/atomspace';
+import { AtomPattern } from '../common/opencog-types';
+
+/**
+ * AtomSpace query benchmark
+ * Verifies that indexed query latency stays flat as the AtomSpace grows
+ */
+describe('AtomSpace Query Performance', function () {
+    this.timeout(60000);
+
+    const SIZES = [1000, 10000, 100000];
+    const TYPES = ['ConceptNode', 'PredicateNode', 'VariableNode', 'FunctionNode', 'ClassNode'];
+    const ITERATIONS = 200;
+
+    async function populate(service: AtomSpaceService, size: number): Promise<void> {
+        for (let i = 0; i < size; i++) {
+            await service.addAtom({
+                type: TYPES[i % TYPES.length],
+                name: `concept_${i}`,
+                truthValue: { strength: 0.5, confidence: 0.5 }
+            });
+        }
+    }
+
+    async function medianQueryTime(service: AtomSpaceService, patternFor: (i: number) => AtomPattern): Promise<number> {
+        const samples: number[] = [];
+        for (let i = 0; i < ITERATIONS; i++) {
+            const start = process.hrtime.bigint();
+            await service.queryAtoms(patternFor(i));
+            samples.push(Number(process.hrtime.bigint() - start));
+        }
+        samples.sort((a, b) => a - b);
+        return samples[Math.floor(samples.length / 2)];
+    }
+
+    it('should keep name and type+name query time flat as the AtomSpace grows', async () => {
+        const byName: number[] = [];
+        const byTypeAndName: number[] = [];
+
+        for (const size of SIZES) {
+            const service = new AtomSpaceService();
+            await populate(service, size);
+
+            byName.push(await medianQueryTime(service, i => ({ name: `concept_${(i * 7919) % size}` })));
+            byTypeAndName.push(await medianQueryTime(service, i => {
+                const index = (i * 7919) % size;
+                return { type: TYPES[index % TYPES.length], name: `concept_${index}` };
+            }));
+        }
+
+        console.log(`    name query median (ns) by size ${SIZES.join('/')}: ${byName.join('/')}`);
+        console.log(`    type+name query median (ns) by size ${SIZES.join('/')}: ${byTypeAndName.join('/')}`);
+
+        // The AtomSpace grows 100x; a linear scan would grow roughly 100x as well
+        expect(byName[byName.length - 1]).to.be.lessThan(byName[0] * 10 + 50000);
+        expect(byTypeAndName[byTypeAndName.length - 1]).to.be.lessThan(byTypeAndName[0] * 10 + 50000);
+    });
+
+    it('should keep selective threshold and top-K attention queries flat as the AtomSpace grows', async () => {
+        const byThreshold: number[] = [];
+        const byAttention: number[] = [];
+
+        for (const size of SIZES) {
+            const service = new AtomSpaceService();
+            for (let i = 0; i < size; i++) {
+                await service.addAtom({
+                    type: TYPES[i % TYPES.length],
+                    name: `concept_${i}`,
+                    truthValue: { strength: (i % 1000) / 1000, confidence: 0.5 },
+                    attentionValue: { sti: i % 997, lti: 0, vlti: 0 }
+                });
+            }
+
+            // Roughly the ten strongest atoms, regardless of AtomSpace size
+            const threshold = 1 - 10 / size;
+            byThreshold.push(await medianQueryTime(service, () => ({ truthValueThreshold: { strength: threshold, confidence: 0 } })));
+
+            const samples: number[] = [];
+            for (let i = 0; i < ITERATIONS; i++) {
+                const start = process.hrtime.bigint();
+                await service.getAttentionalFocus(10);
+                samples.push(Number(process.hrtime.bigint() - start));
+            }
+            samples.sort((a, b) => a - b);
+            byAttention.push(samples[Math.floor(samples.length / 2)]);
+        }
+
+        console.log(`    threshold query median (ns) by size ${SIZES.join('/')}: ${byThreshold.join('/')}`);
+        console.log(`    top-10 STI median (ns) by size ${SIZES.join('/')}: ${byAttention.join('/')}`);
+
+        expect(byThreshold[byThreshold.length - 1]).to.be.lessThan(byThreshold[0] * 10 + 50000);
+        expect(byAttention[byAttention.length - 1]).to.be.lessThan(byAttention[0] * 10 + 50000);
+    });
+
+    it('should return the same results as a full scan', async () => {
+        const service = new AtomSpaceService();
+        await populate(service, 5000);
+
+        const indexed = await service.queryAtoms({ type: 'ConceptNode', name: 'concept_25' });
+        const scanned = (await service.queryAtoms({})).filter(atom =>
+            atom.type === 'ConceptNode' && atom.name === 'concept_25'
+        );
+
+        expect(indexed.map(atom => atom.id)).to.deep.equal(scanned.map(atom => atom.id));
+    });
+
+    it('should keep range counts exact as value chunks split and empty', () => {
+        const list = new SortedValueList();
+        const values = new Map<string, number>();
+        for (let i = 0; i < 5000; i++) {
+            const value = (i * 7919) % 1000;
+            list.insert(value, `atom_${i}`);
+            values.set(`atom_${i}`, value);
+        }
+        // Every third atom, then every atom below 300 so that whole chunks empty out
+        for (const [id, value] of [...values]) {
+            if (Number(id.slice(5)) % 3 === 0 || value < 300) {
+                list.remove(value, id);
+                values.delete(id);
+            }
+        }
+
+        for (const min of [-1, 0, 1, 250, 500.5, 999, 1000]) {
+            const expected = [...values.values()].filter(value => value >= min).length;
+            expect(list.countAtLeast(min)).to.equal(expected);
+        }
+    });
+});
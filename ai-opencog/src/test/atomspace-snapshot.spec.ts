@@ -0,0 +1,88 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { expect } from 'chai';
+import * as os from 'os';
+import * as path from 'path';
+import { promises as fs } from 'fs';
+import { AtomSpaceService } from '../node/atomspace-service';
+import { AtomRecord, AtomSnapshotReader, encodeAtomSnapshot } from '../node/atomspace';
+
+describe('AtomSpace Binary Snapshot', function () {
+    this.timeout(60000);
+
+    const records: AtomRecord[] = [
+        { id: 'atom_3', type: 'InheritanceLink', outgoing: ['atom_1', 'atom_2'], truthValue: { strength: 0.9, confidence: 0.8 } },
+        { id: 'atom_1', type: 'ConceptNode', name: 'käse', attentionValue: { sti: 12.5, lti: 3, vlti: 1 } },
+        { id: 'atom_2', type: 'ConceptNode', name: '', metadata: { source: 'test', tags: ['a'] } }
+    ];
+
+    it('should round-trip records and write children before links', () => {
+        const reader = new AtomSnapshotReader(encodeAtomSnapshot(records));
+
+        expect(reader.size).to.equal(3);
+        const decoded = Array.from(reader.records());
+        expect(decoded.map(record => record.id)).to.deep.equal(['atom_1', 'atom_2', 'atom_3']);
+        expect(decoded[0]).to.deep.equal(records[1]);
+        expect(decoded[1]).to.deep.equal(records[2]);
+        expect(decoded[2]).to.deep.equal(records[0]);
+    });
+
+    it('should decode any record in place', () => {
+        const reader = new AtomSnapshotReader(encodeAtomSnapshot(records));
+        expect(reader.record(2).outgoing).to.deep.equal(['atom_1', 'atom_2']);
+        expect(reader.id(0)).to.equal('atom_1');
+    });
+
+    it('should reject foreign, truncated or newer buffers', () => {
+        const snapshot = encodeAtomSnapshot(records);
+        const newer = Buffer.from(snapshot);
+        newer.writeUInt16LE(99, 4);
+
+        expect(() => new AtomSnapshotReader(Buffer.from('{"atoms": []}'.padEnd(64)))).to.throw('Not an AtomSpace snapshot');
+        expect(() => new AtomSnapshotReader(snapshot.subarray(0, snapshot.length - 8))).to.throw('corrupt');
+        expect(() => new AtomSnapshotReader(newer)).to.throw('version 99');
+    });
+
+    it('should save and load the AtomSpace through a file', async () => {
+        const source = new AtomSpaceService();
+        const SIZE = 100000;
+        for (let i = 0; i < SIZE; i++) {
+            await source.addAtom({ type: 'ConceptNode', name: `concept_${i}`, truthValue: { strength: i / SIZE, confidence: 0.5 } });
+        }
+        await source.addAtom({
+            type: 'InheritanceLink',
+            outgoing: [{ type: 'ConceptNode', name: 'concept_1' }, { type: 'ConceptNode', name: 'concept_2' }]
+        });
+
+        const file = path.join(await fs.mkdtemp(path.join(os.tmpdir(), 'atomspace-')), 'space.ocas');
+        try {
+            expect(await source.saveAtomSpaceSnapshot(file)).to.equal(SIZE + 1);
+
+            const target = new AtomSpaceService();
+            const start = process.hrtime.bigint();
+            expect(await target.loadAtomSpaceSnapshot(file)).to.equal(SIZE + 1);
+            const loadMs = Number(process.hrtime.bigint() - start) / 1e6;
+            console.log(`    loaded ${SIZE + 1} atoms in ${loadMs.toFixed(0)} ms`);
+
+            expect(await target.queryAtoms({ truthValueThreshold: { strength: 0.99999, confidence: 0 } })).to.have.length(1);
+            const [link] = await target.queryAtoms({ type: 'InheritanceLink' });
+            expect(link.outgoing!.map(atom => atom.name)).to.deep.equal(['concept_1', 'concept_2']);
+        } finally {
+            await fs.rm(path.dirname(file), { recursive: true, force: true });
+        }
+    });
+});
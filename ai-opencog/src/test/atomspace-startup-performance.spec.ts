@@ -0,0 +1,87 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { expect } from 'chai';
+import { AtomSpaceEngines, AtomSpaceService } from '../node/atomspace-service';
+import { MultiModalProcessingService } from '../node/multi-modal-processing-service';
+import { CodeAnalysisReasoningEngine, PatternMatchingEngine, PLNReasoningEngine } from '../node/reasoning-engines';
+
+/**
+ * AtomSpace startup benchmark
+ * Verifies that activating the service does not build the reasoning engines
+ */
+describe('AtomSpace Startup Performance', function () {
+    this.timeout(60000);
+
+    const ITERATIONS = 200;
+
+    function countingEngines(created: Record<string, number>): AtomSpaceEngines {
+        const count = <T>(name: string, create: () => T) => () => {
+            created[name] = (created[name] || 0) + 1;
+            return create();
+        };
+        return {
+            pln: count('pln', () => new PLNReasoningEngine()),
+            patternMatching: count('patternMatching', () => new PatternMatchingEngine()),
+            codeAnalysis: count('codeAnalysis', () => new CodeAnalysisReasoningEngine()),
+            multiModal: count('multiModal', () => new MultiModalProcessingService())
+        };
+    }
+
+    it('should create each engine once, on first use', async () => {
+        const created: Record<string, number> = {};
+        const service = new AtomSpaceService(countingEngines(created));
+        expect(created).to.deep.equal({});
+
+        await service.reason({ type: 'deductive', atoms: [] });
+        await service.reason({ type: 'deductive', atoms: [] });
+        expect(created).to.deep.equal({ pln: 1 });
+
+        await service.processMultiModalData({ type: 'text', content: { text: 'hello' } });
+        expect(created).to.deep.equal({ pln: 1, multiModal: 1 });
+    });
+
+    const median = (samples: number[]) => samples.sort((a, b) => a - b)[Math.floor(samples.length / 2)];
+
+    it('should activate faster than with eagerly constructed engines', () => {
+        // What activation cost before: every engine built along with the service
+        const eager = () => {
+            const pln = new PLNReasoningEngine();
+            const patternMatching = new PatternMatchingEngine();
+            const codeAnalysis = new CodeAnalysisReasoningEngine();
+            const multiModal = new MultiModalProcessingService();
+            return new AtomSpaceService({ pln: () => pln, patternMatching: () => patternMatching, codeAnalysis: () => codeAnalysis, multiModal: () => multiModal });
+        };
+        const lazy = () => new AtomSpaceService();
+        const time = (construct: () => AtomSpaceService) => {
+            const start = process.hrtime.bigint();
+            construct();
+            return Number(process.hrtime.bigint() - start);
+        };
+
+        // Interleaved, so that a slow or noisy machine slows both variants alike
+        const eagerSamples: number[] = [];
+        const lazySamples: number[] = [];
+        for (let i = 0; i < ITERATIONS * 10; i++) {
+            eagerSamples.push(time(eager));
+            lazySamples.push(time(lazy));
+        }
+        const eagerMedian = median(eagerSamples.slice(ITERATIONS));
+        const lazyMedian = median(lazySamples.slice(ITERATIONS));
+        console.log(`    AtomSpaceService construction median (ns), eager/lazy engines: ${eagerMedian}/${lazyMedian}`);
+        expect(lazyMedian / eagerMedian).to.be.lessThan(1);
+    });
+});
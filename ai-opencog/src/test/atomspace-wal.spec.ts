@@ -0,0 +1,204 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { expect } from 'chai';
+import { promises as fs } from 'fs';
+import * as os from 'os';
+import * as path from 'path';
+import { AtomSpaceService } from '../node/atomspace-service';
+import { AtomWriteAheadLog, WAL_SNAPSHOT_FILE } from '../node/atomspace';
+
+describe('AtomSpace Write-Ahead Log', () => {
+
+    let directory: string;
+
+    beforeEach(async () => {
+        directory = await fs.mkdtemp(path.join(os.tmpdir(), 'atomspace-wal-'));
+    });
+
+    afterEach(async () => {
+        await fs.rm(directory, { recursive: true, force: true });
+    });
+
+    async function populate(service: AtomSpaceService): Promise<{ cat: string; animal: string; link: string }> {
+        const cat = await service.addAtom({ type: 'ConceptNode', name: 'cat', truthValue: { strength: 0.8, confidence: 0.9 } });
+        const animal = await service.addAtom({ type: 'ConceptNode', name: 'animal' });
+        const link = await service.addAtom({ type: 'InheritanceLink', outgoing: [{ id: cat, type: 'ConceptNode' }, { id: animal, type: 'ConceptNode' }] });
+        return { cat, animal, link };
+    }
+
+    it('should replay logged mutations after a crash', async () => {
+        const service = new AtomSpaceService();
+        await service.enablePersistence(directory);
+        const { cat, animal, link } = await populate(service);
+        const dog = await service.addAtom({ type: 'ConceptNode', name: 'dog' });
+        await service.updateAtom(cat, { truthValue: { strength: 0.3, confidence: 0.9 } });
+        await service.removeAtom(dog);
+        await service.flushPersistence();
+        // The process dies here without closing the log
+
+        const recovered = new AtomSpaceService();
+        expect(await recovered.enablePersistence(directory)).to.equal(3);
+        const [recoveredCat] = await recovered.queryAtoms({ type: 'ConceptNode', name: 'cat' });
+        expect(recoveredCat.id).to.equal(cat);
+        expect(recoveredCat.truthValue).to.deep.equal({ strength: 0.3, confidence: 0.9 });
+        expect(await recovered.queryAtoms({ type: 'ConceptNode', name: 'dog' })).to.be.empty;
+        expect((await recovered.getIncoming(animal)).map(atom => atom.id)).to.deep.equal([link]);
+        await recovered.disablePersistence();
+    });
+
+    it('should journal the attention values left by an attention cycle', async () => {
+        const service = new AtomSpaceService();
+        await service.enablePersistence(directory);
+        const cat = await service.addAtom({ type: 'ConceptNode', name: 'cat', attentionValue: { sti: 100, lti: 10, vlti: 0 } });
+        await service.addAtom({ type: 'ConceptNode', name: 'dog', attentionValue: { sti: 40, lti: 4, vlti: 0 } });
+        await service.flushPersistence();
+        const segment = (await fs.readdir(directory)).find(file => file.endsWith('.wal'))!;
+        const logged = async () => (await fs.readFile(path.join(directory, segment), 'utf8')).trim().split('\n').length;
+        const before = await logged();
+
+        await service.runAttentionCycle({ stiDecay: 0.5, ltiDecay: 0, ltiGain: 0.1, spreadFraction: 0 });
+        await service.runAttentionCycle({ stiDecay: 0.5, ltiDecay: 0, ltiGain: 0.1, spreadFraction: 0 });
+        await service.flushPersistence();
+        // One entry per changed atom per cycle, not per update
+        expect(await logged()).to.equal(before + 4);
+        // The process dies here without closing the log
+
+        const recovered = new AtomSpaceService();
+        await recovered.enablePersistence(directory);
+        const [recoveredCat] = await recovered.queryAtoms({ type: 'ConceptNode', name: 'cat' });
+        expect(recoveredCat.id).to.equal(cat);
+        expect(recoveredCat.attentionValue).to.deep.equal({ sti: 25, lti: 17.5, vlti: 0 });
+        await recovered.disablePersistence();
+    });
+
+    it('should gather a burst of mutations into one batched write', async () => {
+        const service = new AtomSpaceService();
+        await service.enablePersistence(directory, { groupCommitMs: 50 });
+        for (let i = 0; i < 500; i++) {
+            await service.addAtom({ type: 'ConceptNode', name: `concept_${i}` });
+        }
+        const files = await fs.readdir(directory);
+        const segment = files.find(file => file.endsWith('.wal'))!;
+        expect((await fs.stat(path.join(directory, segment))).size).to.equal(0);
+
+        await service.flushPersistence();
+        const lines = (await fs.readFile(path.join(directory, segment), 'utf8')).trim().split('\n');
+        expect(lines).to.have.length(500);
+        await service.disablePersistence();
+    });
+
+    it('should write the last group-commit window synchronously on shutdown', async () => {
+        const service = new AtomSpaceService();
+        await service.enablePersistence(directory, { groupCommitMs: 60000 });
+        await populate(service);
+        await service.addAtom({ type: 'ConceptNode', name: 'dog' });
+        service.disablePersistenceSync();
+
+        const recovered = new AtomSpaceService();
+        expect(await recovered.enablePersistence(directory)).to.equal(4);
+        await recovered.disablePersistence();
+    });
+
+    it('should fold the log into a snapshot when compacting', async () => {
+        const service = new AtomSpaceService();
+        await service.enablePersistence(directory, { compactAfterEntries: 10 });
+        for (let i = 0; i < 25; i++) {
+            await service.addAtom({ type: 'ConceptNode', name: `concept_${i}` });
+        }
+        await service.flushPersistence();
+        await service.disablePersistence();
+
+        const files = await fs.readdir(directory);
+        expect(files).to.include(WAL_SNAPSHOT_FILE);
+        const recovery = await new AtomWriteAheadLog(directory, () => Buffer.alloc(0)).recover();
+        expect(recovery.snapshot).to.not.be.undefined;
+        expect(recovery.entries.length).to.be.lessThan(25);
+
+        const recovered = new AtomSpaceService();
+        expect(await recovered.enablePersistence(directory)).to.equal(25);
+        expect(await recovered.queryAtoms({ type: 'ConceptNode', name: 'concept_24' })).to.have.length(1);
+        await recovered.disablePersistence();
+    });
+
+    it('should log a clear and a snapshot restore', async () => {
+        const service = new AtomSpaceService();
+        await service.enablePersistence(directory);
+        await populate(service);
+        const snapshot = service.createAtomSpaceSnapshot();
+        await service.clearAtomSpace();
+        await service.addAtom({ type: 'ConceptNode', name: 'dog' });
+        await service.disablePersistence();
+
+        const recovered = new AtomSpaceService();
+        expect(await recovered.enablePersistence(directory)).to.equal(1);
+        await recovered.restoreAtomSpaceSnapshot(snapshot);
+        await recovered.disablePersistence();
+
+        const restored = new AtomSpaceService();
+        expect(await restored.enablePersistence(directory)).to.equal(3);
+        await restored.disablePersistence();
+    });
+
+    it('should keep the previous state recoverable until a restored snapshot is written', async () => {
+        const service = new AtomSpaceService();
+        await service.enablePersistence(directory);
+        await populate(service);
+        await service.flushPersistence();
+        const other = new AtomSpaceService();
+        await other.addAtom({ type: 'ConceptNode', name: 'dog' });
+
+        // The process dies while the restored snapshot is still being written
+        const restoring = service.restoreAtomSpaceSnapshot(other.createAtomSpaceSnapshot());
+        const copy = await fs.mkdtemp(path.join(os.tmpdir(), 'atomspace-wal-copy-'));
+        for (const file of await fs.readdir(directory)) {
+            await fs.copyFile(path.join(directory, file), path.join(copy, file));
+        }
+        await restoring;
+        await service.disablePersistence();
+
+        const crashed = new AtomSpaceService();
+        expect(await crashed.enablePersistence(copy)).to.equal(3);
+        await crashed.disablePersistence();
+        await fs.rm(copy, { recursive: true, force: true });
+
+        const restored = new AtomSpaceService();
+        expect(await restored.enablePersistence(directory)).to.equal(1);
+        await restored.disablePersistence();
+    });
+
+    it('should ignore a torn final entry but reject damage elsewhere', async () => {
+        const service = new AtomSpaceService();
+        await service.enablePersistence(directory);
+        await populate(service);
+        await service.disablePersistence();
+
+        const segment = path.join(directory, (await fs.readdir(directory)).find(file => file.endsWith('.wal'))!);
+        await fs.appendFile(segment, '{"op":"put","record":{"id":"atom_9","ty');
+        const recovered = new AtomSpaceService();
+        expect(await recovered.enablePersistence(directory)).to.equal(3);
+        await recovered.disablePersistence();
+
+        await fs.writeFile(path.join(directory, 'atomspace-1.wal'), 'not json\n{"op":"clear"}\n');
+        let error: Error | undefined;
+        try {
+            await new AtomSpaceService().enablePersistence(directory);
+        } catch (e) {
+            error = e as Error;
+        }
+        expect(error?.message).to.contain('Corrupt write-ahead log');
+    });
+});
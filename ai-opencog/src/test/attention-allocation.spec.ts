@@ -0,0 +1,128 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { expect } from 'chai';
+import { AtomSpaceService } from '../node/atomspace-service';
+
+describe('Attention Allocation', () => {
+
+    let service: AtomSpaceService;
+
+    beforeEach(() => {
+        service = new AtomSpaceService();
+    });
+
+    afterEach(() => {
+        service.stopAttentionAllocation();
+    });
+
+    async function attentionOf(name: string) {
+        const [atom] = await service.queryAtoms({ type: 'ConceptNode', name });
+        return atom?.attentionValue;
+    }
+
+    it('should decay STI and fold part of it into LTI', async () => {
+        await service.addAtom({ type: 'ConceptNode', name: 'cat', attentionValue: { sti: 100, lti: 10, vlti: 0 } });
+        await service.runAttentionCycle({ stiDecay: 0.5, ltiDecay: 0, ltiGain: 0.1, spreadFraction: 0 });
+
+        const attention = await attentionOf('cat');
+        expect(attention!.sti).to.equal(50);
+        expect(attention!.lti).to.equal(15);
+    });
+
+    it('should stop rewriting atoms once their attention has decayed away', async () => {
+        await service.addAtom({ type: 'ConceptNode', name: 'cat', attentionValue: { sti: 0, lti: 0.01, vlti: 0 } });
+        await service.runAttentionCycle({ ltiDecay: 0.5, spreadFraction: 0 });
+        await service.runAttentionCycle({ ltiDecay: 0.5, spreadFraction: 0 });
+        await service.runAttentionCycle({ ltiDecay: 0.5, spreadFraction: 0 });
+        await service.runAttentionCycle({ ltiDecay: 0.5, spreadFraction: 0 });
+        expect((await attentionOf('cat'))!.lti).to.equal(0);
+
+        const stats = await service.runAttentionCycle({ ltiDecay: 0.5, spreadFraction: 0 });
+        expect(stats.decayed).to.equal(0);
+    });
+
+    it('should not report attention updates as atom changes', async () => {
+        await service.addAtom({ type: 'ConceptNode', name: 'cat', attentionValue: { sti: 100, lti: 10, vlti: 0 } });
+        const batches: unknown[] = [];
+        const subscription = service.onAtomSpaceChanges(batch => batches.push(batch));
+        await service.runAttentionCycle({ stiDecay: 0.5, spreadFraction: 0 });
+        await new Promise(resolve => setTimeout(resolve, 20));
+        subscription.dispose();
+
+        expect((await attentionOf('cat'))!.sti).to.equal(50);
+        expect(batches).to.be.empty;
+    });
+
+    it('should spread importance from focus atoms along their links', async () => {
+        const cat = await service.addAtom({ type: 'ConceptNode', name: 'cat', attentionValue: { sti: 100, lti: 0, vlti: 0 } });
+        const animal = await service.addAtom({ type: 'ConceptNode', name: 'animal' });
+        await service.addAtom({ type: 'InheritanceLink', outgoing: [{ id: cat, type: 'ConceptNode' }, { id: animal, type: 'ConceptNode' }] });
+        await service.runAttentionCycle({ stiDecay: 0, spreadFraction: 0.5 });
+
+        const [link] = await service.queryAtoms({ type: 'InheritanceLink' });
+        expect((await attentionOf('cat'))!.sti).to.equal(50);
+        expect(link.attentionValue!.sti).to.equal(50);
+        expect(await attentionOf('animal')).to.be.undefined;
+    });
+
+    it('should forget the least important atoms down to the budget', async () => {
+        for (let i = 0; i < 10; i++) {
+            await service.addAtom({ type: 'ConceptNode', name: `concept_${i}`, attentionValue: { sti: 0, lti: i, vlti: 0 } });
+        }
+        await service.addAtom({ type: 'ConceptNode', name: 'unjudged' });
+        await service.addAtom({ type: 'ConceptNode', name: 'pinned', attentionValue: { sti: 0, lti: 0, vlti: 1 } });
+
+        const stats = await service.runAttentionCycle({ maxAtoms: 6, stiDecay: 0, ltiDecay: 0, spreadFraction: 0 });
+        expect(stats.forgotten).to.equal(6);
+        expect(await attentionOf('unjudged')).to.be.undefined;
+        expect(await service.queryAtoms({ type: 'ConceptNode', name: 'unjudged' })).to.be.empty;
+        expect(await attentionOf('pinned')).to.not.be.undefined;
+        const survivors = (await service.queryAtoms({ type: 'ConceptNode' })).map(atom => atom.name).sort();
+        expect(survivors).to.deep.equal(['concept_5', 'concept_6', 'concept_7', 'concept_8', 'concept_9', 'pinned']);
+    });
+
+    it('should keep atoms that links still point to', async () => {
+        const cat = await service.addAtom({ type: 'ConceptNode', name: 'cat', attentionValue: { sti: 0, lti: 0, vlti: 0 } });
+        const animal = await service.addAtom({ type: 'ConceptNode', name: 'animal', attentionValue: { sti: 0, lti: 0, vlti: 0 } });
+        await service.addAtom({
+            type: 'InheritanceLink',
+            outgoing: [{ id: cat, type: 'ConceptNode' }, { id: animal, type: 'ConceptNode' }],
+            attentionValue: { sti: 0, lti: 5, vlti: 0 }
+        });
+
+        const stats = await service.runAttentionCycle({ maxAtoms: 2, stiDecay: 0, ltiDecay: 0, spreadFraction: 0 });
+        expect(stats.forgotten).to.equal(1);
+        expect(await service.queryAtoms({ type: 'InheritanceLink' })).to.be.empty;
+        expect(await service.queryAtoms({ type: 'ConceptNode' })).to.have.length(2);
+    });
+
+    it('should run a large cycle in several time slices', async () => {
+        const atoms = [];
+        for (let i = 0; i < 20000; i++) {
+            atoms.push({ type: 'ConceptNode', name: `concept_${i}`, attentionValue: { sti: 10, lti: 1, vlti: 0 } });
+        }
+        await service.addAtoms(atoms);
+
+        let served = 0;
+        const timer = setInterval(() => served++, 0);
+        const stats = await service.runAttentionCycle({ sliceMs: 1 });
+        clearInterval(timer);
+        expect(stats.decayed).to.equal(20000);
+        expect(stats.slices).to.be.greaterThan(1);
+        expect(served).to.be.greaterThan(0);
+    });
+});
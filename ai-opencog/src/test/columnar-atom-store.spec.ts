@@ -0,0 +1,168 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { expect } from 'chai';
+import { AtomSpaceService } from '../node/atomspace-service';
+import { AtomRecord, AtomStore, ColumnarAtomStore } from '../node/atomspace';
+
+describe('Columnar Atom Store', () => {
+
+    function record(id: string, fields: Partial<AtomRecord> = {}): AtomRecord {
+        return {
+            id,
+            type: 'ConceptNode',
+            name: id,
+            truthValue: { strength: 0.5, confidence: 0.25 },
+            attentionValue: { sti: 10, lti: 2, vlti: 0 },
+            ...fields
+        };
+    }
+
+    it('should round-trip records through the typed-array columns', () => {
+        const store = new ColumnarAtomStore();
+        store.set('atom_1', record('atom_1', { metadata: { source: 'test' } }));
+        store.set('custom-id', record('custom-id', { name: undefined, attentionValue: undefined }));
+        store.set('atom_2', record('atom_2', { type: 'InheritanceLink', outgoing: ['atom_1', 'custom-id'] }));
+
+        expect(store.size).to.equal(3);
+        expect(store.get('atom_1')).to.deep.equal(record('atom_1', { metadata: { source: 'test' } }));
+        expect(store.get('custom-id')).to.deep.equal({
+            id: 'custom-id',
+            type: 'ConceptNode',
+            truthValue: { strength: 0.5, confidence: 0.25 }
+        });
+        expect(store.get('atom_2')!.outgoing).to.deep.equal(['atom_1', 'custom-id']);
+        expect(Array.from(store.keys())).to.have.members(['atom_1', 'atom_2', 'custom-id']);
+    });
+
+    it('should store values in single precision', () => {
+        const store = new ColumnarAtomStore();
+        store.set('atom_1', record('atom_1', { truthValue: { strength: 0.85, confidence: 0.1 } }));
+
+        const stored = store.get('atom_1')!;
+        expect(stored.truthValue!.strength).to.equal(Math.fround(0.85));
+        expect(stored.truthValue!.confidence).to.equal(Math.fround(0.1));
+    });
+
+    it('should reuse freed rows after deletion', () => {
+        const store = new ColumnarAtomStore();
+        for (let i = 0; i < 100; i++) {
+            store.set(`atom_${i}`, record(`atom_${i}`));
+        }
+        const bytes = store.columnBytes;
+
+        for (let i = 0; i < 100; i++) {
+            expect(store.delete(`atom_${i}`)).to.be.true;
+        }
+        expect(store.size).to.equal(0);
+        expect(store.has('atom_5')).to.be.false;
+        expect(store.delete('atom_5')).to.be.false;
+
+        for (let i = 100; i < 200; i++) {
+            store.set(`atom_${i}`, record(`atom_${i}`));
+        }
+        expect(store.size).to.equal(100);
+        expect(store.get('atom_150')!.name).to.equal('atom_150');
+        expect(store.columnBytes).to.equal(bytes);
+    });
+
+    it('should keep sparse numeric IDs out of the dense lookup', () => {
+        const store = new ColumnarAtomStore();
+        const ids = ['atom_3', 'atom_60000000', 'atom_9000', 'atom_40000000'];
+        for (const id of ids) {
+            store.set(id, record(id));
+        }
+        expect(store.columnBytes).to.be.lessThan(1 << 20);
+        expect(ids.map(id => store.get(id)!.id)).to.deep.equal(ids);
+        expect(Array.from(store.keys())).to.have.members(ids);
+
+        expect(store.delete('atom_60000000')).to.be.true;
+        expect(store.has('atom_60000000')).to.be.false;
+        expect(store.delete('atom_60000000')).to.be.false;
+        expect(store.get('atom_40000000')!.name).to.equal('atom_40000000');
+        expect(store.size).to.equal(3);
+    });
+
+        it('should overwrite a row in place when a record is set again', () => {
+        const store = new ColumnarAtomStore();
+        store.set('atom_1', record('atom_1', { metadata: { a: 1 } }));
+        store.set('atom_1', record('atom_1', { name: 'renamed', metadata: undefined }));
+
+        const stored = store.get('atom_1')!;
+        expect(stored.name).to.equal('renamed');
+        expect(stored.metadata).to.be.undefined;
+        expect(store.size).to.equal(1);
+    });
+
+    it('should back the AtomSpace when selected through the environment', async () => {
+        const previous = process.env.AI_OPENCOG_ATOM_STORE;
+        process.env.AI_OPENCOG_ATOM_STORE = 'columnar';
+        let service: AtomSpaceService;
+        try {
+            service = new AtomSpaceService();
+        } finally {
+            if (previous === undefined) {
+                delete process.env.AI_OPENCOG_ATOM_STORE;
+            } else {
+                process.env.AI_OPENCOG_ATOM_STORE = previous;
+            }
+        }
+
+        const cat = await service.addAtom({ type: 'ConceptNode', name: 'cat', truthValue: { strength: 0.7, confidence: 0.9 } });
+        const animal = await service.addAtom({ type: 'ConceptNode', name: 'animal' });
+        const link = await service.addAtom({ type: 'InheritanceLink', outgoing: [{ id: cat, type: 'ConceptNode' }, { id: animal, type: 'ConceptNode' }] });
+
+        const strong = await service.queryAtoms({ truthValueThreshold: { strength: 0.7 } });
+        expect(strong.map(atom => atom.id)).to.deep.equal([cat]);
+
+        await service.updateAtom(cat, { truthValue: { strength: 0.3, confidence: 0.9 } });
+        expect(await service.queryAtoms({ truthValueThreshold: { strength: 0.7 } })).to.be.empty;
+
+        expect((await service.getIncoming(animal)).map(atom => atom.id)).to.deep.equal([link]);
+        await service.removeAtom(cat);
+        expect(await service.getAtomSpaceSize()).to.equal(1);
+    });
+
+    it('should hold a large AtomSpace in a fraction of the heap used by the map store', function () {
+        const gc = (global as { gc?: () => void }).gc;
+        if (!gc) {
+            this.skip();
+        }
+        this.timeout(60000);
+
+        const SIZE = 200000;
+        const measure = (create: () => AtomStore): number => {
+            gc!();
+            const before = process.memoryUsage();
+            const store = create();
+            for (let i = 0; i < SIZE; i++) {
+                store.set(`atom_${i}`, record(`atom_${i}`, {
+                    name: `concept_${i}`,
+                    truthValue: { strength: Math.random(), confidence: Math.random() },
+                    attentionValue: { sti: Math.random() * 100, lti: Math.random() * 10, vlti: 0 }
+                }));
+            }
+            gc!();
+            const after = process.memoryUsage();
+            expect(store.size).to.equal(SIZE);
+            return (after.heapUsed - before.heapUsed) + (after.arrayBuffers - before.arrayBuffers);
+        };
+
+        const mapBytes = measure(() => new Map<string, AtomRecord>());
+        const columnarBytes = measure(() => new ColumnarAtomStore());
+        expect(columnarBytes * 4).to.be.lessThan(mapBytes);
+    });
+});
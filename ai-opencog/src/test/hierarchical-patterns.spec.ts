@@ -0,0 +1,68 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { expect } from 'chai';
+import { Atom } from '../common/opencog-types';
+import { PatternMatchingEngine } from '../node/reasoning-engines';
+
+describe('Hierarchical Patterns', () => {
+
+    const engine = new PatternMatchingEngine() as any;
+    const findPatterns = (root: Atom): any[] => engine.findCommonHierarchicalPatterns(engine.buildHierarchies([root])[0]);
+
+    let counter = 0;
+    const node = (type: string): Atom => ({ type, name: `n${counter++}` });
+    const link = (type: string, ...outgoing: Atom[]): Atom => ({ type, name: `n${counter++}`, outgoing });
+
+    it('should group subtrees of the same shape', () => {
+        const pair = () => link('ListLink', node('ConceptNode'), node('PredicateNode'));
+        const root = link('SetLink',
+            link('AndLink', pair(), pair()),
+            link('AndLink', pair(), pair()),
+            link('AndLink', pair(), link('ListLink', node('PredicateNode'), node('ConceptNode'))));
+
+        const patterns = findPatterns(root);
+        const byRoot = new Map(patterns.map(pattern => [`${pattern.structure.rootType}/${pattern.depth}`, pattern.frequency]));
+        expect(byRoot.get('ListLink/2')).to.equal(5);
+        expect(byRoot.get('AndLink/3')).to.equal(2);
+        expect(byRoot.get('ConceptNode/1')).to.equal(6);
+        expect(byRoot.has('SetLink/4')).to.be.false;
+    });
+
+    it('should cache depth and branching factor on subtrees', () => {
+        const root = link('ListLink', link('ListLink', node('ConceptNode'), node('ConceptNode'), node('ConceptNode')), node('ConceptNode'));
+        const [hierarchy] = engine.buildHierarchies([root]);
+        engine.findCommonHierarchicalPatterns(hierarchy);
+        expect(hierarchy.depth).to.equal(3);
+        expect(hierarchy.branchingFactor).to.equal(3);
+        expect(hierarchy.children[0].structure).to.not.equal(hierarchy.structure);
+    });
+
+    it('should handle wide and deep hierarchies', function () {
+        this.timeout(60000);
+        const wide = link('SetLink', ...Array.from({ length: 200000 }, () => link('ListLink', node('ConceptNode'))));
+        const [leaves] = findPatterns(wide).filter(pattern => pattern.structure.rootType === 'ListLink');
+        expect(leaves.frequency).to.equal(200000);
+        expect(leaves.branchingFactor).to.equal(1);
+
+        let deep = node('ConceptNode');
+        for (let i = 0; i < 2000; i++) {
+            deep = link('ListLink', deep, node('ConceptNode'));
+        }
+        const patterns = findPatterns(deep);
+        expect(patterns.find(pattern => pattern.structure.rootType === 'ConceptNode').frequency).to.equal(2001);
+    });
+});
@@ -0,0 +1,70 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { expect } from 'chai';
+import { LearningData } from '../common/opencog-types';
+import { LearningHistory } from '../node/learning-history';
+
+describe('Learning History', () => {
+
+    function record(index: number, userId: string, currentTask: string, helpful?: boolean): LearningData {
+        return {
+            type: index % 2 === 0 ? 'supervised' : 'behavioral',
+            input: { index },
+            context: { userId, currentTask },
+            feedback: helpful === undefined ? undefined : { rating: helpful ? 5 : 1, helpful, timeSpent: 1 }
+        };
+    }
+
+    it('should keep only the most recent records once full', () => {
+        const history = new LearningHistory(3);
+        for (let i = 0; i < 5; i++) {
+            history.push(record(i, 'alice', 'debugging'));
+        }
+        expect(history.length).to.equal(3);
+        expect(history.totalRecorded).to.equal(5);
+        expect(Array.from(history).map(item => item.input.index)).to.deep.equal([2, 3, 4]);
+        expect(history.countByType('supervised')).to.equal(2);
+        expect(history.countByType('behavioral')).to.equal(1);
+    });
+
+    it('should index records per user and drop evicted ones', () => {
+        const history = new LearningHistory(4);
+        history.push(record(0, 'alice', 'debugging', false));
+        history.push(record(1, 'bob', 'testing', true));
+        history.push(record(2, 'alice', 'refactoring', true));
+        history.push(record(3, 'alice', 'debugging', true));
+        history.push(record(4, 'bob', 'testing', false));
+
+        expect(history.forUser('alice').map(item => item.input.index)).to.deep.equal([2, 3]);
+        expect(history.forUser('carol')).to.be.empty;
+        const alice = history.userSummary('alice')!;
+        expect(alice.count).to.equal(2);
+        expect(alice.helpful).to.equal(2);
+        expect(Object.fromEntries(alice.tasks)).to.deep.equal({ refactoring: 1, debugging: 1 });
+        expect(Array.from(alice.unhelpfulTasks.keys())).to.be.empty;
+        expect(Array.from(history.userSummary('bob')!.unhelpfulTasks.keys())).to.deep.equal(['testing']);
+    });
+
+    it('should forget a user whose records have all been evicted', () => {
+        const history = new LearningHistory(2);
+        history.push(record(0, 'alice', 'debugging'));
+        history.push(record(1, 'bob', 'testing'));
+        history.push(record(2, 'bob', 'testing'));
+        expect(history.userSummary('alice')).to.be.undefined;
+        expect(history.userSummary('bob')!.count).to.equal(2);
+    });
+});
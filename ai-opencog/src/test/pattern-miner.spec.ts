@@ -0,0 +1,125 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { expect } from 'chai';
+import { Atom } from '../common/opencog-types';
+import { PLNReasoningEngine, mineFrequentItemsets, mineSequentialPatterns } from '../node/reasoning-engines';
+
+describe('Pattern Miner', () => {
+
+    /** Deterministic pseudo-random items */
+    function generate(count: number, length: number, alphabet: number, seed: number): string[][] {
+        let state = seed;
+        const next = () => {
+            state = (Math.imul(state, 1664525) + 1013904223) >>> 0;
+            return (state >>> 16) % alphabet;
+        };
+        return Array.from({ length: count }, () => Array.from({ length: 1 + (next() % length) }, () => `i${next()}`));
+    }
+
+    const key = (items: string[]) => [...items].sort().join(',');
+
+    it('should find the frequent itemsets that brute-force counting finds', () => {
+        const transactions = generate(200, 6, 8, 7).map((items, index) => ({ items, score: index % 2 }));
+        const mined = new Map(mineFrequentItemsets(transactions, { minSupport: 20 }).map(itemset => [key(itemset.items), itemset]));
+
+        const distinct = transactions.map(({ items }) => new Set(items));
+        const alphabet = Array.from(new Set(transactions.flatMap(({ items }) => items))).sort();
+        let expected = 0;
+        for (let mask = 1; mask < (1 << alphabet.length); mask++) {
+            const itemset = alphabet.filter((_, bit) => mask & (1 << bit));
+            const supporting = transactions.filter((_, index) => itemset.every(item => distinct[index].has(item)));
+            if (supporting.length >= 20) {
+                expected++;
+                const found = mined.get(key(itemset))!;
+                expect(found.support).to.equal(supporting.length);
+                expect(found.score).to.equal(supporting.reduce((sum, { score }) => sum + score, 0));
+            }
+        }
+        expect(mined.size).to.equal(expected);
+    });
+
+    it('should mine gapped and contiguous sequential patterns', () => {
+        const sequences = [['a', 'b', 'c'], ['a', 'x', 'c'], ['a', 'c', 'b'], ['b', 'a']];
+        const gapped = mineSequentialPatterns(sequences, { minSupport: 3 }).map(({ sequence, support }) => `${sequence.join('')}:${support}`);
+        expect(gapped.sort()).to.deep.equal(['a:4', 'ac:3', 'b:3', 'c:3']);
+
+        const contiguous = mineSequentialPatterns(sequences, { minSupport: 2, maxGap: 1 }).map(({ sequence }) => sequence.join(''));
+        expect(contiguous).to.not.include('ac');
+        expect(mineSequentialPatterns([['a', 'x', 'a', 'b']], { minSupport: 1, maxGap: 1 }).map(({ sequence }) => sequence.join(''))).to.include('ab');
+    });
+
+    it('should count contiguous occurrences within and across sequences', () => {
+        const [repeated] = mineSequentialPatterns([['a', 'b', 'a', 'b']], { minSupport: 2, maxGap: 1, countOccurrences: true })
+            .filter(({ sequence }) => sequence.join('') === 'ab');
+        expect(repeated).to.deep.equal({ sequence: ['a', 'b'], support: 1, occurrences: 2 });
+
+        const sequences = generate(200, 8, 4, 7);
+        const mined = mineSequentialPatterns(sequences, { minSupport: 10, maxLength: 3, maxGap: 1, countOccurrences: true });
+        const counts = new Map<string, number>();
+        for (const sequence of sequences) {
+            for (let start = 0; start < sequence.length; start++) {
+                for (let end = start + 1; end <= Math.min(sequence.length, start + 3); end++) {
+                    const key = sequence.slice(start, end).join(',');
+                    counts.set(key, (counts.get(key) ?? 0) + 1);
+                }
+            }
+        }
+        const expected = Array.from(counts).filter(([, count]) => count >= 10);
+        expect(mined).to.have.length(expected.length);
+        for (const [key, count] of expected) {
+            expect(mined.find(({ sequence }) => sequence.join(',') === key)!.occurrences).to.equal(count);
+        }
+        expect(() => mineSequentialPatterns(sequences, { minSupport: 2, countOccurrences: true })).to.throw();
+    });
+
+    it('should count sequence support once per sequence', () => {
+        const sequences = generate(300, 8, 5, 11);
+        const mined = mineSequentialPatterns(sequences, { minSupport: 8, maxLength: 3 });
+        const contains = (sequence: string[], pattern: string[]) => {
+            let position = 0;
+            for (const element of sequence) {
+                if (element === pattern[position] && ++position === pattern.length) {
+                    return true;
+                }
+            }
+            return false;
+        };
+        for (const { sequence, support } of mined) {
+            expect(support).to.equal(sequences.filter(candidate => contains(candidate, sequence)).length);
+            expect(support).to.be.at.least(8);
+        }
+        expect(mined.some(({ sequence }) => sequence.length === 3)).to.be.true;
+    });
+
+    it('should generalize over predicates and recurring arguments', async () => {
+        const observation = (predicate: string, value: string, strength: number): Atom => ({
+            type: 'EvaluationLink',
+            truthValue: { strength, confidence: 0.8 },
+            outgoing: [{ type: 'PredicateNode', name: predicate }, { type: 'ConceptNode', name: value }]
+        });
+        const atoms: Atom[] = [];
+        for (let i = 0; i < 3000; i++) {
+            atoms.push(observation('usesPattern', i % 3 === 0 ? 'singleton' : `module${i}`, i % 4 === 0 ? 0.2 : 0.9));
+        }
+
+        const result = await new PLNReasoningEngine().reason({ type: 'inductive', atoms });
+        const names = result.conclusion!.map(atom => atom.name);
+        expect(names).to.deep.equal(['pattern_usesPattern', 'pattern_usesPattern_singleton']);
+        expect(result.conclusion![0].truthValue!.strength).to.equal(0.75);
+        expect(result.metadata).to.have.property('observationCount', 3000);
+    });
+});
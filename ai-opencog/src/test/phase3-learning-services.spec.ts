@@ -154,6 +154,17 @@ describe('Phase 3 Learning Services', () => {
             expect(result.optimizations).to.be.an('array');
         });
 
+        it('should count workflow runs repeated within one session', async () => {
+            const service = container.get(UnsupervisedLearningServiceImpl);
+
+            const actions = ['open', 'edit', 'open', 'edit', 'open', 'edit', 'save'];
+            const result = await service.learnWorkflowOptimizations(actions.map(action => ({ action, timeSpent: 1 })));
+
+            const pattern = result.optimizations.find(optimization => optimization.description === 'Common workflow pattern: open->edit');
+            expect(pattern).to.not.be.undefined;
+            expect(pattern!.impact).to.equal(3 / 20);
+        });
+
         it('should learn quality metrics', async () => {
             const service = container.get(UnsupervisedLearningServiceImpl);
             
@@ -0,0 +1,107 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { expect } from 'chai';
+import { Atom } from '../common/opencog-types';
+import { AtomSpaceService } from '../node/atomspace-service';
+import { PLNBackwardChainer } from '../node/reasoning-engines';
+
+describe('PLN Backward Chainer', () => {
+
+    const concept = (name: string, strength?: number, confidence?: number): Atom =>
+        strength === undefined ? { type: 'ConceptNode', name } : { type: 'ConceptNode', name, truthValue: { strength, confidence: confidence! } };
+    const link = (type: string, from: string, to: string): Atom => ({
+        type,
+        truthValue: { strength: 0.9, confidence: 0.9 },
+        outgoing: [concept(from), concept(to)]
+    });
+    const chain = (type: string, length: number): Atom[] =>
+        Array.from({ length }, (_, i) => link(type, `n${i}`, `n${i + 1}`));
+
+    it('should prove a goal through implication links', () => {
+        const chainer = new PLNBackwardChainer();
+        chainer.add([concept('a', 0.9, 0.9), link('ImplicationLink', 'a', 'b'), link('ImplicationLink', 'b', 'c')]);
+
+        const result = chainer.prove(concept('c'));
+        expect(result.truthValue!.strength).to.be.closeTo(0.9 * 0.9 * 0.9, 1e-9);
+        expect(result.goal.truthValue).to.deep.equal(result.truthValue);
+        expect(chainer.prove(concept('unrelated')).truthValue).to.be.undefined;
+    });
+
+    it('should decompose inheritance goals by deduction', () => {
+        const chainer = new PLNBackwardChainer();
+        chainer.add([link('InheritanceLink', 'cat', 'mammal'), link('InheritanceLink', 'mammal', 'animal'), link('InheritanceLink', 'animal', 'living')]);
+
+        const result = chainer.prove({ type: 'InheritanceLink', outgoing: [concept('cat'), concept('living')] });
+        expect(result.truthValue).to.not.be.undefined;
+        expect(result.subgoals).to.equal(3);
+        expect(chainer.prove({ type: 'InheritanceLink', outgoing: [concept('living'), concept('cat')] }).truthValue).to.be.undefined;
+    });
+
+    it('should solve shared subgoals once', () => {
+        const chainer = new PLNBackwardChainer({ maxDepth: 30 });
+        chainer.add([...chain('ImplicationLink', 20), link('ImplicationLink', 'n0', 'left'), link('ImplicationLink', 'n0', 'right'),
+            link('ImplicationLink', 'n20', 'left'), link('ImplicationLink', 'n20', 'right'),
+            link('ImplicationLink', 'left', 'goal'), link('ImplicationLink', 'right', 'goal'), concept('n0', 0.9, 0.9)]);
+
+        const first = chainer.prove(concept('goal'));
+        expect(first.truthValue).to.not.be.undefined;
+        // goal, left, right and n1..n20, each expanded once
+        expect(first.subgoals).to.equal(23);
+        expect(first.tableHits).to.be.greaterThan(0);
+
+        const second = chainer.prove(concept('goal'));
+        expect(second.subgoals).to.equal(0);
+        expect(second.truthValue).to.deep.equal(first.truthValue);
+    });
+
+    it('should terminate on recursive subgoals', () => {
+        const chainer = new PLNBackwardChainer();
+        chainer.add([link('ImplicationLink', 'a', 'b'), link('ImplicationLink', 'b', 'a'), link('ImplicationLink', 'b', 'c')]);
+        expect(chainer.prove(concept('c')).truthValue).to.be.undefined;
+
+        chainer.add([concept('a', 0.9, 0.9)]);
+        expect(chainer.prove(concept('c')).truthValue).to.not.be.undefined;
+    });
+
+    it('should stop at the depth and time budgets', () => {
+        const atoms = [concept('n0', 0.9, 0.9), ...chain('ImplicationLink', 2000)];
+        const shallow = new PLNBackwardChainer({ maxDepth: 3 });
+        shallow.add(atoms);
+        const limited = shallow.prove(concept('n5'));
+        expect(limited.truthValue).to.be.undefined;
+        expect(limited.depthLimited).to.be.true;
+
+        const hurried = new PLNBackwardChainer({ maxDepth: Infinity, timeBudgetMs: 0 });
+        hurried.add(atoms);
+        const timedOut = hurried.prove(concept('n2000'));
+        expect(timedOut.timedOut).to.be.true;
+        expect(timedOut.subgoals).to.be.lessThan(2000);
+    });
+
+    it('should answer backward deductive queries through reason()', async () => {
+        const service = new AtomSpaceService();
+        const result = await service.reason({
+            type: 'deductive',
+            premises: [concept('a', 0.9, 0.9), link('ImplicationLink', 'a', 'b')],
+            atoms: [concept('b'), concept('z')],
+            parameters: { chaining: 'backward', maxDepth: 4 }
+        });
+        expect(result.conclusion!.map(atom => atom.name)).to.deep.equal(['b']);
+        expect(result.metadata!.reasoningType).to.equal('pln-backward');
+        expect(result.confidence).to.be.greaterThan(0);
+    });
+});
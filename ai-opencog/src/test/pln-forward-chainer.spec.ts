@@ -0,0 +1,96 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { expect } from 'chai';
+import { Atom } from '../common/opencog-types';
+import { AtomSpaceService } from '../node/atomspace-service';
+import { PLNForwardChainer } from '../node/reasoning-engines';
+
+describe('PLN Forward Chainer', () => {
+
+    const concept = (name: string, strength?: number, confidence?: number): Atom =>
+        strength === undefined ? { type: 'ConceptNode', name } : { type: 'ConceptNode', name, truthValue: { strength, confidence: confidence! } };
+    const implication = (from: string, to: string): Atom => ({
+        type: 'ImplicationLink',
+        truthValue: { strength: 0.95, confidence: 0.95 },
+        outgoing: [concept(from), concept(to)]
+    });
+    const names = (atoms: Atom[]) => atoms.map(atom => atom.name).sort();
+
+    it('should chain modus ponens to a fixpoint', () => {
+        const chainer = new PLNForwardChainer();
+        chainer.add([concept('a', 0.95, 0.95), implication('a', 'b'), implication('b', 'c'), implication('c', 'd')]);
+        const result = chainer.run();
+
+        expect(result.fixpoint).to.be.true;
+        expect(names(result.derived)).to.deep.equal(['b', 'c', 'd']);
+        const d = result.derived.find(atom => atom.name === 'd')!;
+        expect(d.truthValue!.confidence).to.be.lessThan(0.95 * 0.9 * 0.9);
+        expect(chainer.getMetrics().steps).to.equal(3);
+    });
+
+    it('should stop on the step budget and resume on the next run', () => {
+        const chainer = new PLNForwardChainer({ maxSteps: 1 });
+        chainer.add([concept('a', 0.95, 0.95), implication('a', 'b'), implication('b', 'c')]);
+
+        const first = chainer.run();
+        expect(first.fixpoint).to.be.false;
+        expect(names(first.derived)).to.deep.equal(['b']);
+        const second = chainer.run();
+        expect(second.fixpoint).to.be.true;
+        expect(names(second.derived)).to.deep.equal(['c']);
+    });
+
+    it('should only derive what depends on newly added atoms', () => {
+        const chainer = new PLNForwardChainer();
+        chainer.add([concept('a', 0.95, 0.95), implication('a', 'b'), implication('b', 'c')]);
+        chainer.run();
+
+        chainer.add([implication('c', 'd')]);
+        const result = chainer.run();
+        expect(names(result.derived)).to.deep.equal(['d']);
+        expect(result.steps).to.equal(1);
+        expect(chainer.run().steps).to.equal(0);
+    });
+
+    it('should terminate on cyclic rules', () => {
+        const chainer = new PLNForwardChainer();
+        chainer.add([concept('a', 0.95, 0.95), implication('a', 'b'), implication('b', 'a')]);
+        const result = chainer.run();
+        expect(result.fixpoint).to.be.true;
+        expect(names(result.derived)).to.deep.equal(['b']);
+    });
+
+    it('should store derivations in the AtomSpace and re-derive incrementally', async () => {
+        const service = new AtomSpaceService();
+        await service.addAtoms([concept('a', 0.95, 0.95), implication('a', 'b'), implication('b', 'c')]);
+
+        const first = await service.forwardChain();
+        expect(names(first.derived)).to.deep.equal(['b', 'c']);
+        const [c] = await service.queryAtoms({ type: 'ConceptNode', name: 'c' });
+        expect(c.truthValue!.confidence).to.be.greaterThan(0);
+        const size = await service.getAtomSpaceSize();
+
+        expect((await service.forwardChain()).steps).to.equal(0);
+        await service.addAtom(implication('c', 'd'));
+        const second = await service.forwardChain();
+        expect(names(second.derived)).to.deep.equal(['d']);
+        expect(second.steps).to.equal(1);
+        // The new rule and its conclusion
+        expect(await service.getAtomSpaceSize()).to.equal(size + 2);
+        expect(service.getForwardChainingMetrics()!.derived).to.equal(3);
+    });
+});
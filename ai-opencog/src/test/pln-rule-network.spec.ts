@@ -0,0 +1,159 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { expect } from 'chai';
+import { Atom } from '../common/opencog-types';
+import { DeductiveReasoningServiceImpl } from '../node/deductive-reasoning-service';
+import { PLNReasoningEngine, PLNRuleNetwork } from '../node/reasoning-engines';
+
+describe('PLN Rule Network', () => {
+
+    const concept = (name: string, strength?: number, confidence?: number): Atom =>
+        strength === undefined ? { type: 'ConceptNode', name } : { type: 'ConceptNode', name, truthValue: { strength, confidence: confidence! } };
+    const implication = (from: Atom, to: string): Atom => ({
+        type: 'ImplicationLink',
+        truthValue: { strength: 0.95, confidence: 0.95 },
+        outgoing: [from, concept(to)]
+    });
+    const names = (atoms: Atom[]) => atoms.map(atom => atom.name).sort();
+
+    it('should maintain conclusions as premises are asserted and retracted', () => {
+        const network = new PLNRuleNetwork();
+        network.assert([implication(concept('a'), 'b'), implication(concept('b'), 'c')]);
+        expect(network.getConclusions()).to.be.empty;
+
+        network.assert([concept('a', 0.95, 0.95)]);
+        expect(names(network.getConclusions())).to.deep.equal(['b', 'c']);
+
+        network.retract([implication(concept('b'), 'c')]);
+        expect(names(network.getConclusions())).to.deep.equal(['b']);
+        network.retract([concept('a')]);
+        expect(network.getConclusions()).to.be.empty;
+    });
+
+    it('should join conjunctive conditions', () => {
+        const network = new PLNRuleNetwork();
+        const both: Atom = { type: 'AndLink', outgoing: [concept('a'), concept('b')] };
+        network.assert([implication(both, 'c'), concept('a', 0.95, 0.95)]);
+        expect(network.getConclusions()).to.be.empty;
+        network.assert([concept('b', 0.9, 0.9)]);
+        const [c] = network.getConclusions();
+        expect(c.truthValue!.strength).to.be.closeTo(0.95 * 0.95 * 0.9, 1e-9);
+    });
+
+    it('should treat truth values embedded in an antecedent as facts', async () => {
+        const service = new DeductiveReasoningServiceImpl(new PLNReasoningEngine());
+        const deduced = await service.deduceConclusions([implication(concept('a', 0.9, 0.9), 'b')]);
+        expect(names(deduced.conclusion!)).to.deep.equal(['b']);
+
+        // A fact given on its own overrides the one embedded in the rule
+        const network = new PLNRuleNetwork();
+        network.replace([implication(concept('a', 0.9, 0.9), 'b'), concept('a', 0.2, 0.9)]);
+        expect(network.getConclusions()).to.be.empty;
+        network.replace([implication(concept('a', 0.9, 0.9), 'b')]);
+        expect(names(network.getConclusions())).to.deep.equal(['b']);
+        network.replace([implication(concept('a'), 'b')]);
+        expect(network.getConclusions()).to.be.empty;
+    });
+
+    it('should re-evaluate only the activations affected by a change', () => {
+        const network = new PLNRuleNetwork();
+        const rules = Array.from({ length: 100 }, (_, i) => implication(concept(`p${i}`), `q${i}`));
+        const facts = Array.from({ length: 100 }, (_, i) => concept(`p${i}`, 0.9, 0.9));
+        network.replace([...rules, ...facts]);
+        expect(network.getConclusions()).to.have.length(100);
+
+        const update = network.replace([...rules, ...facts.slice(1)]);
+        expect(update).to.deep.equal({ asserted: 0, retracted: 1, activations: 1 });
+        expect(network.getConclusions()).to.have.length(99);
+    });
+
+    it('should evict atoms nothing asserts, derives or refers to', () => {
+        const network = new PLNRuleNetwork();
+        const both: Atom = { type: 'AndLink', outgoing: [concept('a'), concept('b')] };
+        network.replace([implication(both, 'c'), implication(concept('c'), 'd'), concept('a', 0.9, 0.9), concept('b', 0.9, 0.9)]);
+        expect(names(network.getConclusions())).to.deep.equal(['c', 'd']);
+        expect(network.size).to.equal(6);
+
+        network.replace([implication(concept('c'), 'd'), concept('a', 0.9, 0.9)]);
+        expect(network.getConclusions()).to.be.empty;
+        expect(network.size).to.equal(4);
+        network.assert([concept('unrelated')]);
+        expect(network.size).to.equal(4);
+
+        network.replace([]);
+        expect(network.size).to.equal(0);
+    });
+
+    it('should drop conclusions that only support each other', () => {
+        const network = new PLNRuleNetwork();
+        network.assert([implication(concept('a'), 'b'), implication(concept('b'), 'a'), concept('a', 0.9, 0.9)]);
+        expect(names(network.getConclusions())).to.deep.equal(['a', 'b']);
+
+        network.retract([concept('a')]);
+        expect(network.getConclusions()).to.be.empty;
+    });
+
+    it('should keep contradictions as a materialized view', () => {
+        const negates = (a: Atom, b: Atom) => a.type === 'NotLink' && a.outgoing![0].name === b.name;
+        const network = new PLNRuleNetwork({ contradicts: (a, b) => negates(a, b) || negates(b, a) });
+        const notC: Atom = { type: 'NotLink', name: 'not_c', truthValue: { strength: 1, confidence: 0.9 }, outgoing: [concept('c')] };
+        network.assert([notC, implication(concept('a'), 'c')]);
+        expect(network.getConflicts()).to.be.empty;
+
+        network.assert([concept('a', 0.9, 0.9)]);
+        expect(network.getConflicts().map(pair => names(pair))).to.deep.equal([['c', 'not_c']]);
+        network.retract([concept('a')]);
+        expect(network.getConflicts()).to.be.empty;
+    });
+
+    it('should check consistency incrementally across calls', async () => {
+        const service = new DeductiveReasoningServiceImpl(new PLNReasoningEngine());
+        const statements: Atom[] = [
+            { type: 'ConceptNode', name: 'A', truthValue: { strength: 1.0, confidence: 0.9 } },
+            { type: 'NotLink', name: 'not_A', outgoing: [{ type: 'ConceptNode', name: 'A' }], truthValue: { strength: 1.0, confidence: 0.9 } }
+        ];
+        const inconsistent = await service.checkConsistency(statements);
+        expect(inconsistent.isConsistent).to.be.false;
+        expect(inconsistent.conflicts).to.have.length(1);
+        expect((await service.checkConsistency(statements.slice(1))).isConsistent).to.be.true;
+
+        const deduced = await service.deduceConclusions([implication(concept('rain'), 'wet'), concept('rain', 0.9, 0.9)]);
+        expect(names(deduced.conclusion!)).to.deep.equal(['wet']);
+        expect(deduced.confidence).to.be.greaterThan(0);
+    });
+
+    it('should report divergent truth values for the same atom as contradictory', async () => {
+        const service = new DeductiveReasoningServiceImpl(new PLNReasoningEngine());
+        const into = (from: string, strength: number): Atom => ({
+            type: 'ImplicationLink',
+            truthValue: { strength, confidence: 0.95 },
+            outgoing: [concept(from), concept('c')]
+        });
+        const divergent = await service.checkConsistency([into('a', 0.95), into('b', 0.05), concept('a', 0.95, 0.95), concept('b', 0.95, 0.95)]);
+        expect(divergent.isConsistent).to.be.false;
+        const [{ atoms: [first, second] }] = divergent.conflicts!;
+        expect([first.name, second.name]).to.deep.equal(['c', 'c']);
+        expect(Math.abs(first.truthValue.strength - second.truthValue.strength)).to.be.greaterThan(0.8);
+
+        const agreeing = await service.checkConsistency([into('a', 0.95), into('b', 0.9), concept('a', 0.95, 0.95), concept('b', 0.95, 0.95)]);
+        expect(agreeing.isConsistent).to.be.true;
+
+        const statements = await service.checkConsistency([concept('d', 1, 0.9), concept('d', 0.1, 0.9)]);
+        expect(statements.isConsistent).to.be.false;
+        expect((await service.checkConsistency([concept('d', 1, 0.9)])).isConsistent).to.be.true;
+    });
+});
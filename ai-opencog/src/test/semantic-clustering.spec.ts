@@ -0,0 +1,94 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { expect } from 'chai';
+import { Atom } from '../common/opencog-types';
+import { MinHashIndex, PatternMatchingEngine } from '../node/reasoning-engines';
+
+describe('Semantic Clustering', () => {
+
+    const words = ['user', 'admin', 'login', 'logout', 'session', 'token', 'cache', 'query', 'render', 'parse'];
+    const types = ['ConceptNode', 'PredicateNode', 'SchemaNode', 'VariableNode', 'NumberNode', 'TypeNode', 'AnchorNode', 'GroundedSchemaNode'];
+
+    function generate(count: number): Atom[] {
+        let state = 42;
+        const next = (range: number) => {
+            state = (Math.imul(state, 1664525) + 1013904223) >>> 0;
+            return (state >>> 16) % range;
+        };
+        return Array.from({ length: count }, (_, i) => {
+            const first = next(words.length);
+            const name = Array.from({ length: 1 + next(3) }, (_, k) => words[(first + k * (1 + next(3))) % words.length]).join('_');
+            return next(10) === 0
+                ? { id: `atom_${i}`, type: 'ListLink', outgoing: [{ type: 'ConceptNode', name: `c${next(20)}` }] }
+                : { id: `atom_${i}`, type: `${types[next(types.length)]}_${next(50)}`, name };
+        });
+    }
+
+    /** The pairwise clustering the engine used before candidate indexing */
+    function clusterPairwise(atoms: Atom[]): Atom[][] {
+        const similar = (a: string, b: string) => {
+            const words1 = a.toLowerCase().split(/[_\-\s]+/);
+            const words2 = b.toLowerCase().split(/[_\-\s]+/);
+            return words1.filter(word => words2.includes(word)).length / Math.max(words1.length, words2.length);
+        };
+        const related = (a: Atom, b: Atom) => (a.name && b.name && similar(a.name, b.name) > 0.6) || a.type === b.type
+            || (!!a.outgoing && !!b.outgoing && a.outgoing.some(x => b.outgoing!.some(y => x.name === y.name || x.type === y.type)));
+        const clusters: Atom[][] = [];
+        const used = new Set<string>();
+        for (const atom of atoms) {
+            if (used.has(atom.id!)) continue;
+            const cluster = [atom];
+            used.add(atom.id!);
+            for (const other of atoms) {
+                if (!used.has(other.id!) && related(atom, other)) {
+                    cluster.push(other);
+                    used.add(other.id!);
+                }
+            }
+            if (cluster.length >= 2) {
+                clusters.push(cluster);
+            }
+        }
+        return clusters;
+    }
+
+    const cluster = (atoms: Atom[]): Atom[][] => (new PatternMatchingEngine() as any).clusterAtomsBySemantic(atoms);
+    const ids = (clusters: Atom[][]) => clusters.map(members => members.map(atom => atom.id).join(','));
+
+    it('should find candidates sharing most tokens', () => {
+        const index = new MinHashIndex();
+        index.add(0, ['user', 'login', 'session']);
+        index.add(1, ['user', 'login', 'session', 'token']);
+        index.add(2, ['render', 'cache']);
+        expect(Array.from(index.candidates(0))).to.deep.equal([1]);
+
+        index.remove(1);
+        expect(index.candidates(0).size).to.equal(0);
+    });
+
+    it('should produce the clusters of pairwise comparison', () => {
+        const atoms = generate(2000);
+        expect(ids(cluster(atoms))).to.deep.equal(ids(clusterPairwise(atoms)));
+    });
+
+    it('should cluster 100k atoms', function () {
+        this.timeout(60000);
+        const atoms = generate(100000);
+        const clusters = cluster(atoms);
+        expect(clusters.reduce((sum, members) => sum + members.length, 0)).to.be.at.most(atoms.length);
+    });
+});
@@ -0,0 +1,88 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { expect } from 'chai';
+import { Atom } from '../common/opencog-types';
+import { PatternMatchingEngine } from '../node/reasoning-engines';
+
+describe('Sequential Patterns', () => {
+
+    const findSequences = (atoms: Atom[]): Atom[][] => (new PatternMatchingEngine() as any).findSequentialPatterns(atoms);
+
+    /** The nested-loop detection the engine used before indexing */
+    function findSequencesPairwise(atoms: Atom[]): Atom[][] {
+        const related = (a: Atom, b: Atom) => a.outgoing && b.outgoing
+            ? a.outgoing.some(x => b.outgoing!.some(y => x.name === y.name || x.type === y.type))
+            : a.type === b.type;
+        const sequences: Atom[][] = [];
+        const visited = new Set<string>();
+        for (let i = 0; i < atoms.length - 2; i++) {
+            const sequence = [atoms[i]];
+            let current = atoms[i];
+            for (let j = i + 1; j < atoms.length; j++) {
+                if (related(current, atoms[j])) {
+                    sequence.push(atoms[j]);
+                    current = atoms[j];
+                }
+            }
+            const key = sequence.map(a => a.id || a.name).join('-');
+            if (sequence.length >= 3 && !visited.has(key)) {
+                sequences.push(sequence);
+                visited.add(key);
+            }
+        }
+        return sequences;
+    }
+
+    function generate(count: number, seed: number): Atom[] {
+        let state = seed;
+        const next = (range: number) => {
+            state = (Math.imul(state, 1664525) + 1013904223) >>> 0;
+            return (state >>> 16) % range;
+        };
+        return Array.from({ length: count }, () => {
+            const name = next(4) === 0 ? undefined : `event${next(12)}`;
+            switch (next(4)) {
+                case 0:
+                    return { type: 'EvaluationLink', name, outgoing: [{ type: `Node${next(6)}`, name: `arg${next(30)}` }, { type: `Node${next(6)}` }] };
+                case 1:
+                    return { type: 'ListLink', name, outgoing: next(3) === 0 ? [] : [{ type: `Node${next(6)}`, name: `arg${next(30)}` }] };
+                default:
+                    return { type: `Event${next(8)}`, name };
+            }
+        });
+    }
+
+    it('should find the sequences of pairwise comparison', () => {
+        for (const seed of [1, 2, 3]) {
+            const atoms = generate(300, seed);
+            const sequences = findSequences(atoms);
+            const expected = findSequencesPairwise(atoms);
+            expect(expected).to.not.be.empty;
+            expect(sequences.length).to.equal(expected.length);
+            expect(sequences.every((sequence, i) => sequence.length === expected[i].length
+                && sequence.every((atom, k) => atom === expected[i][k]))).to.be.true;
+        }
+    });
+
+    it('should scale to a 50k-event trace', function () {
+        this.timeout(60000);
+        const atoms: Atom[] = Array.from({ length: 50000 }, (_, i) => ({ id: `event_${i}`, type: `Action${i % 10000}` }));
+        const sequences = findSequences(atoms);
+        expect(sequences).to.have.length(30000);
+        expect(sequences[0].map(atom => atom.id)).to.deep.equal(['event_0', 'event_10000', 'event_20000', 'event_30000', 'event_40000']);
+    });
+});
@@ -0,0 +1,91 @@
+// *****************************************************************************
+// Copyright (C) 2024 Eclipse Foundation and others.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Eclipse Public License v. 2.0 which is available at
+// http://www.eclipse.org/legal/epl-2.0.
+//
+// This Source Code may also be made available under the following Secondary
+// Licenses when the conditions for such availability set forth in the Eclipse
+// Public License v. 2.0 are satisfied: GNU General Public License, version 2
+// with the GNU Classpath Exception which is available at
+// https://www.gnu.org/software/classpath/license.html.
+//
+// SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0
+// *****************************************************************************
+
+import { expect } from 'chai';
+import { StartupProfiler } from '../node/startup-profiler';
+
+describe('Startup Profiler', () => {
+
+    function verboseProfiler(): StartupProfiler {
+        const previous = process.env.AI_OPENCOG_PROFILE_STARTUP;
+        process.env.AI_OPENCOG_PROFILE_STARTUP = 'true';
+        try {
+            return new StartupProfiler();
+        } finally {
+            if (previous === undefined) {
+                delete process.env.AI_OPENCOG_PROFILE_STARTUP;
+            } else {
+                process.env.AI_OPENCOG_PROFILE_STARTUP = previous;
+            }
+        }
+    }
+
+    it('should record construction time and timers started by a service', () => {
+        const profiler = verboseProfiler();
+        let timer: ReturnType<typeof setInterval> | undefined;
+        const service = profiler.activate('/services/polling', () => {
+            timer = setInterval(() => undefined, 60000);
+            setTimeout(() => undefined, 0);
+            return { name: 'polling' };
+        });
+        clearInterval(timer);
+
+        expect(service.name).to.equal('polling');
+        const [activation] = profiler.getActivations();
+        expect(activation.service).to.equal('/services/polling');
+        expect(activation.intervals).to.equal(1);
+        expect(activation.timeouts).to.equal(1);
+        expect(activation.durationMs).to.be.at.least(0);
+    });
+
+    it('should leave the timer functions alone unless profiling verbosely', () => {
+        const profiler = new StartupProfiler();
+        const originalSetTimeout = global.setTimeout;
+        let seenSetTimeout: unknown;
+        profiler.activate('/services/quiet', () => {
+            seenSetTimeout = global.setTimeout;
+            return {};
+        });
+
+        expect(seenSetTimeout).to.equal(originalSetTimeout);
+        const [activation] = profiler.getActivations();
+        expect(activation.service).to.equal('/services/quiet');
+        expect(activation.timeouts).to.equal(0);
+    });
+
+    it('should profile only the first activation and restore the timer functions', () => {
+        const profiler = verboseProfiler();
+        const originalSetInterval = global.setInterval;
+        profiler.activate('/services/idle', () => ({}));
+        profiler.activate('/services/idle', () => ({}));
+
+        expect(profiler.getActivations()).to.have.length(1);
+        expect(global.setInterval).to.equal(originalSetInterval);
+    });
+
+    it('should restore the timer functions when construction fails', () => {
+        const profiler = verboseProfiler();
+        const originalSetTimeout = global.setTimeout;
+        expect(() => profiler.activate('/services/broken', () => {
+            throw new Error('construction failed');
+        })).to.throw('construction failed');
+        expect(global.setTimeout).to.equal(originalSetTimeout);
+        expect(profiler.getActivations()).to.be.empty;
+
+        profiler.activate('/services/broken', () => ({}));
+        expect(profiler.getActivations().map(activation => activation.service)).to.deep.equal(['/services/broken']);
+    });
+});